@@ -0,0 +1,84 @@
+"""crawling_id 해시 벤치마크
+
+실행: python -m benchmarks.bench_hashing [행 수]
+
+기존 재귀 변환 + sha256과 hashing 모듈의 방식별(sha256/blake2b/xxh3) 행당 비용을 비교한다.
+"""
+
+import hashlib
+import sys
+import time
+
+import orjson
+import pandas as pd
+
+from lib.Distributor.secretary.hashing import ALGORITHMS, ResultHasher
+
+
+def legacy_hash_id(tag, df):
+    def convert(obj):
+        if isinstance(obj, pd.Timestamp):
+            return obj.isoformat()
+        if isinstance(obj, dict):
+            return {k: convert(v) for k, v in obj.items()}
+        if isinstance(obj, list):
+            return [convert(i) for i in obj]
+        return obj
+
+    raw_bytes = orjson.dumps(
+        {"tag": tag, "df": convert(df)},
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+    return hashlib.sha256(raw_bytes).hexdigest()
+
+
+def make_results(n: int) -> list[tuple[str, list[dict]]]:
+    """주가 결과와 비슷한 단일 행 결과 n개"""
+    base = pd.Timestamp("2025-05-01 09:30")
+    return [
+        (
+            "stock",
+            [
+                {
+                    "company_id": i % 500,
+                    "posted_at": base + pd.Timedelta(minutes=i),
+                    "Open": 100.0 + i,
+                    "High": 101.0 + i,
+                    "Low": 99.0 + i,
+                    "Close": 100.5 + i,
+                    "Volume": 1_000_000 + i,
+                    "Change": 0.5,
+                }
+            ],
+        )
+        for i in range(n)
+    ]
+
+
+def measure(label: str, fn, n: int):
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<22} {elapsed * 1e3:9.1f} ms  {elapsed / n * 1e6:7.2f} µs/row")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    items = make_results(n)
+    print(f"rows: {n}")
+
+    measure("legacy sha256", lambda: [legacy_hash_id(t, d) for t, d in items], n)
+    assert ResultHasher("sha256").hash_rows(*items[0]) == legacy_hash_id(*items[0])
+
+    for algorithm in ALGORITHMS:
+        try:
+            hasher = ResultHasher(algorithm, workers=4, batch_min=256)
+        except ImportError:
+            print(f"{algorithm:<22} (건너뜀: 의존성 미설치)")
+            continue
+        measure(algorithm, lambda: [hasher.hash(t, d) for t, d in items], n)
+        measure(f"{algorithm} batch", lambda: hasher.hash_batch(items), n)
+
+
+if __name__ == "__main__":
+    main()
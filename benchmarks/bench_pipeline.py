@@ -0,0 +1,376 @@
+"""크롤링 → DB 저장 → 분석 서버 전송 파이프라인 단계별 벤치마크
+
+실행: python -m benchmarks.bench_pipeline [--iterations N] [--db-url URL]
+                                          [--output PATH] [--baseline PATH]
+
+benchmarks/fixtures/의 기록된 HTML, yfinance 분봉, FRED 관측값을 재생하여
+네트워크 없이 아래 단계를 반복 측정하고 단계별 처리량/지연 시간을 JSON으로 출력한다.
+
+- fetch: 로컬 재생 서버에서 HTML 수신 (rate limit 세션 경유), FRED 조회
+- parse: BeautifulSoup 파싱
+- extract: selector 추출 및 결과 생성, yfinance 분봉 가공
+- process_result: CrawlerInterface._process_result
+- distribute: Secretary.distribute (기본은 SQLite 파일, --db-url로 MySQL 지정 가능)
+- notifier_build: 저장된 뉴스로 요청 메시지 생성 및 직렬화
+- socket_send: 로컬 분석 서버로 요청 전송 (압축 + TCP 왕복)
+
+결과는 --output(기본: 작업 디렉터리/bench_pipeline.json)에 저장되며,
+--baseline으로 이전 결과 JSON을 지정하면 단계별 p50 변화율을 함께 출력한다.
+"""
+
+import argparse
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import numpy as np
+import orjson
+import yaml
+
+from benchmarks import fixtures
+
+SETTINGS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "bench_settings.yaml"
+)
+
+
+class Sample:
+    """측정 1회 (처리 건수는 측정 블록 안에서 갱신)"""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: int):
+        self.items = items
+
+
+class StageRecorder:
+    """단계별 소요 시간과 처리 건수 수집"""
+
+    def __init__(self):
+        self._samples: dict[str, list[tuple[float, int]]] = {}
+
+    @contextmanager
+    def measure(self, stage: str, items: int = 1):
+        sample = Sample(items)
+        started = time.perf_counter()
+        yield sample
+        elapsed = time.perf_counter() - started
+        self._samples.setdefault(stage, []).append((elapsed, sample.items))
+
+    def summary(self) -> dict[str, dict]:
+        stages = {}
+        for stage, samples in self._samples.items():
+            durations = np.array([elapsed for elapsed, _ in samples])
+            items = sum(count for _, count in samples)
+            total = float(durations.sum())
+            stages[stage] = {
+                "calls": len(samples),
+                "items": items,
+                "total_sec": round(total, 6),
+                "mean_ms": round(float(durations.mean()) * 1e3, 3),
+                "p50_ms": round(float(np.percentile(durations, 50)) * 1e3, 3),
+                "p95_ms": round(float(np.percentile(durations, 95)) * 1e3, 3),
+                "max_ms": round(float(durations.max()) * 1e3, 3),
+                "items_per_sec": round(items / total, 1) if total else None,
+            }
+        return stages
+
+
+def configure(db_url: str, work_dir: str):
+    """벤치마크 설정 파일을 작업 디렉터리에 만들고 Config가 읽도록 지정
+
+    DB 엔진은 처음 사용할 때 설정으로 생성되므로 DB에 접근하기 전에 호출해야 한다.
+    """
+    from lib.Config.config import Config
+
+    with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
+        settings = yaml.safe_load(f)
+    settings["database"]["url"] = db_url
+
+    path = os.path.join(work_dir, "settings.yaml")
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(settings, f, allow_unicode=True)
+
+    Config._config_path = path
+    Config.init()
+
+
+class PipelineBenchmark:
+    """기록 데이터를 재생하며 파이프라인 단계를 측정"""
+
+    def __init__(self, recorder: StageRecorder, http_server, analysis_server):
+        from lib.Crawling.config.LoadConfig import load_config
+        from lib.Crawling.Financial.Fred import FredCrawler
+        from lib.Crawling.News.Yahoo import YahooNewsCrawler
+        from lib.Crawling.Stock.YFinance_stock import YFinanceStockCrawler
+        from lib.Distributor.secretary.Secretary import Secretary
+        from lib.Distributor.socket.messages.builder import RequestMessageBuilder
+        from lib.Distributor.socket.messages.request import news_requests_message
+
+        self.recorder = recorder
+        self.history = fixtures.load_minute_history()
+
+        no_save = {"save_to_file": False, "save_to_DB": False}
+        selector_config = load_config("selector_config.json")["YahooFinanceNews"]
+        self.news = YahooNewsCrawler(
+            "YahooFinanceNews", http_server.selector_config(selector_config)
+        )
+        self.stock = YFinanceStockCrawler("YFinanceStock")
+        self.stock._adj_map = {}
+        self.fred = FredCrawler("Fred", "fixture")
+        self.fred.series_dict = {
+            series_id: series_id for series_id in fixtures.FixtureFred().series_ids
+        }
+        for crawler in (self.news, self.stock, self.fred):
+            crawler.SAVE_METHOD = no_save  # 저장은 distribute 단계에서 측정
+
+        self.secretary = Secretary.instance()
+        self.builder = RequestMessageBuilder(news_requests_message)
+        self.client = analysis_server.client()
+
+    # ── 뉴스 ────────────────────────────────────────────────────────────
+    def _fetch(self, url: str) -> str:
+        from lib.Crawling.config.headers import HEADERS
+        from lib.Crawling.utils.http_session import get_http_session
+
+        with self.recorder.measure("fetch.news"):
+            response = get_http_session().get(url, headers=HEADERS, timeout=20)
+            response.raise_for_status()
+            return response.text
+
+    def _parse(self, html: str):
+        from bs4 import BeautifulSoup
+
+        with self.recorder.measure("parse.news"):
+            return BeautifulSoup(html, "html.parser")
+
+    def crawl_news(self, iteration: int) -> list:
+        """YahooNewsCrawler.crawl_main과 같은 순서로 목록/본문 수집"""
+        import pandas as pd
+
+        from lib.Crawling.Interfaces.CrawlResult import CrawlResult
+
+        crawler = self.news
+        list_soup = self._parse(self._fetch(crawler.config["url"]))
+        with self.recorder.measure("extract.news"):
+            containers = crawler.extract_mainContainer(list_soup) or []
+            mains = [crawler.extract_fields(c, "main") for c in containers]
+
+        results = []
+        for main_data in mains[: crawler.max_articles]:
+            url = crawler.get_absolute_url(main_data.get("href"))
+            article_soup = self._parse(self._fetch(url))
+            with self.recorder.measure("extract.news"):
+                container = crawler.extract_contentContainer(article_soup)
+                content = crawler.extract_fields(container, "contents")
+                article = {**main_data, **content}
+                # 반복마다 신규 뉴스로 저장되도록 제목 구분
+                article["title"] = f"{article['title']} #{iteration}"
+                results.append(
+                    CrawlResult.success(
+                        crawler.tag, pd.DataFrame([article]), target_url=url
+                    )
+                )
+        return results
+
+    # ── 주가 / 거시지표 ─────────────────────────────────────────────────
+    def crawl_stock(self, iteration: int) -> list:
+        from lib.Crawling.Interfaces.CrawlResult import CrawlResult
+        from lib.Crawling.Stock.YFinance_stock import TARGET_URL
+
+        results = []
+        with self.recorder.measure("extract.yfinance") as sample:
+            for ticker, company in self.stock._company_map.items():
+                ticker_obj = fixtures.FixtureTicker(self.history, shift_days=iteration)
+                df = self.stock._process_minute_data(
+                    ticker_obj, ticker, company["company_id"]
+                )
+                results.append(
+                    CrawlResult.success(self.stock.tag, df, target_url=TARGET_URL)
+                )
+            sample.items = len(results)
+        return results
+
+    def crawl_fred(self, iteration: int) -> list:
+        self.fred.fred = fixtures.FixtureFred(shift_days=iteration)
+        with self.recorder.measure("fetch.fred") as sample:
+            results = self.fred.crawl()
+            sample.items = len(self.fred.series_dict)
+        return results
+
+    # ── 저장 ────────────────────────────────────────────────────────────
+    def store(self, source: str, crawler, results: list):
+        with self.recorder.measure(f"process_result.{source}", len(results)):
+            crawler._process_result(results)
+        with self.recorder.measure(f"distribute.{source}", len(results)):
+            self.secretary.distribute(results)
+
+    # ── 전송 ────────────────────────────────────────────────────────────
+    def build_messages(self, titles: list[str]) -> list[dict]:
+        """저장된 뉴스와 종목 주가로 ArticleNotifier와 같은 형태의 요청 생성
+
+        notifier_*_vw 뷰는 MySQL 전용이므로 같은 컬럼을 ORM으로 조회한다.
+        """
+        from sqlalchemy import select
+
+        from lib.Distributor.secretary.models.company import Company
+        from lib.Distributor.secretary.models.news import News, NewsTag
+        from lib.Distributor.secretary.models.stock import Stock
+        from lib.Distributor.socket.messages.builder import (
+            date_column,
+            dumps,
+            float_column,
+            new_item,
+            transpose,
+        )
+
+        messages = []
+        with self.recorder.measure("notifier_build") as sample:
+            with self.secretary.session() as db:
+                rows = db.execute(
+                    select(News.crawling_id, News.content, NewsTag.tag)
+                    .join(NewsTag, News.tag_id == NewsTag.tag_id)
+                    .where(News.title.in_(titles))
+                ).all()
+                for crawling_id, content, ticker in rows:
+                    prices = db.execute(
+                        select(
+                            Stock.posted_at,
+                            Stock.open,
+                            Stock.close,
+                            Stock.high,
+                            Stock.low,
+                            Stock.volume,
+                        )
+                        .join(Company, Stock.company_id == Company.company_id)
+                        .where(Company.ticker == ticker)
+                        .order_by(Stock.posted_at)
+                    ).all()
+                    posted_at, o, c, h, l, v = transpose(prices, 6)
+                    item = new_item(
+                        "news",
+                        news_data=[content],
+                        stock_history={
+                            "stock": [ticker] * len(prices),
+                            "Date": date_column(posted_at),
+                            "Open": float_column(o, fill=0.0),
+                            "Close": float_column(c, fill=0.0),
+                            "High": float_column(h, fill=0.0),
+                            "Low": float_column(l, fill=0.0),
+                            "Volume": float_column(v, fill=0.0),
+                        },
+                    )
+                    message = self.builder.build(item)
+                    dumps(message)  # 전송 전 직렬화 비용 포함
+                    messages.append(message)
+            sample.items = len(messages)
+        return messages
+
+    def send(self, messages: list[dict]):
+        for message in messages:
+            with self.recorder.measure("socket_send"):
+                self.client.request_tcp(message)
+
+    def run_once(self, iteration: int):
+        news = self.crawl_news(iteration)
+        stock = self.crawl_stock(iteration)
+        macro = self.crawl_fred(iteration)
+
+        self.store("stock", self.stock, stock)
+        self.store("macro", self.fred, macro)
+        self.store("news", self.news, news)
+
+        titles = [r.df[0]["title"] for r in news if r.df]
+        self.send(self.build_messages(titles))
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_summary(stages: dict, baseline_path: str | None = None):
+    """단계별 요약 출력 (baseline 지정 시 p50 변화율 포함)"""
+    baseline = {}
+    if baseline_path:
+        with open(baseline_path, "rb") as f:
+            baseline = orjson.loads(f.read()).get("stages", {})
+
+    print(f"{'stage':<24} {'items/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'change':>8}")
+    for stage, stats in stages.items():
+        before = baseline.get(stage, {}).get("p50_ms")
+        change = f"{(stats['p50_ms'] / before - 1) * 100:+7.1f}%" if before else "-"
+        print(
+            f"{stage:<24} {stats['items_per_sec'] or 0:>10.1f} "
+            f"{stats['p50_ms']:>9.3f} {stats['p95_ms']:>9.3f} {change:>8}"
+        )
+
+
+def main(argv: list[str] | None = None) -> dict:
+    parser = argparse.ArgumentParser(description="파이프라인 단계별 벤치마크")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1, help="측정 제외 반복 수")
+    parser.add_argument("--db-url", help="기본값: 작업 디렉터리의 SQLite 파일")
+    parser.add_argument("--work-dir", help="설정/DB 파일 위치 (기본값: 임시 디렉터리)")
+    parser.add_argument(
+        "--output", help="결과 JSON 경로 (기본값: 작업 디렉터리/bench_pipeline.json)"
+    )
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    args = parser.parse_args(argv)
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="bench-pipeline-")
+    os.makedirs(work_dir, exist_ok=True)
+    db_url = args.db_url or f"sqlite:///{os.path.join(work_dir, 'bench.sqlite3')}"
+    configure(db_url, work_dir)
+
+    from lib.Distributor.secretary.session import engine
+
+    fixtures.prepare_database(engine)
+    http_server = fixtures.FixtureHTTPServer().start()
+    analysis_server = fixtures.FixtureAnalysisServer().start()
+
+    try:
+        bench = PipelineBenchmark(StageRecorder(), http_server, analysis_server)
+        for i in range(args.warmup):
+            bench.run_once(i)
+
+        bench.recorder = StageRecorder()  # 예열 구간은 결과에서 제외
+        for i in range(args.warmup, args.warmup + args.iterations):
+            bench.run_once(i)
+    finally:
+        http_server.stop()
+        analysis_server.stop()
+
+    report = {
+        "benchmark": "pipeline",
+        "revision": git_revision(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "database": engine.dialect.name,
+        "iterations": args.iterations,
+        "stages": bench.recorder.summary(),
+    }
+
+    output = args.output or os.path.join(work_dir, "bench_pipeline.json")
+    with open(output, "wb") as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+
+    print_summary(report["stages"], args.baseline)
+    print(f"결과 저장: {output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
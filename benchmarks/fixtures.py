@@ -0,0 +1,251 @@
+"""벤치마크용 기록 데이터 재생
+
+benchmarks/fixtures/ 아래의 기록된 HTML 페이지, yfinance 분봉, FRED 관측값을
+네트워크 없이 크롤러에 공급하고, 벤치마크용 로컬 DB와 분석 서버를 띄운다.
+"""
+
+import os
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import orjson
+import pandas as pd
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+NEWS_LIST_PATH = "/topic/stock-market-news/"
+
+
+def fixture_path(name: str) -> str:
+    return os.path.join(FIXTURE_DIR, name)
+
+
+def read_fixture(name: str) -> bytes:
+    with open(fixture_path(name), "rb") as f:
+        return f.read()
+
+
+# ── HTML ────────────────────────────────────────────────────────────────
+class FixtureHTTPServer:
+    """기록된 HTML을 돌려주는 로컬 HTTP 서버
+
+    NEWS_LIST_PATH는 뉴스 목록, /news/*.html은 기사 본문 페이지를 반환한다.
+    """
+
+    def __init__(self):
+        pages = {
+            "list": read_fixture("yahoo_news_list.html"),
+            "article": read_fixture("yahoo_news_article.html"),
+        }
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == NEWS_LIST_PATH:
+                    body = pages["list"]
+                elif self.path.startswith("/news/"):
+                    body = pages["article"]
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # 요청 로그 출력 생략
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> "FixtureHTTPServer":
+        threading.Thread(
+            target=self._server.serve_forever, name="FixtureHTTP", daemon=True
+        ).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def selector_config(self, selector_config: dict) -> dict:
+        """크롤러 selector 설정의 URL을 재생 서버로 변경"""
+        return {
+            **selector_config,
+            "base_url": self.base_url,
+            "url": self.base_url + NEWS_LIST_PATH,
+            "next_page": None,
+        }
+
+
+# ── yfinance / FRED ─────────────────────────────────────────────────────
+def load_minute_history() -> pd.DataFrame:
+    """기록된 yfinance 분봉 (Ticker.history(interval="1m") 결과 형태)"""
+    df = pd.read_csv(fixture_path("yf_history_1m.csv"))
+    df["Datetime"] = pd.to_datetime(df["Datetime"], utc=True).dt.tz_convert(
+        "America/New_York"
+    )
+    return df.set_index("Datetime")
+
+
+class FixtureTicker:
+    """yf.Ticker 대신 기록된 분봉을 반환 (반복마다 새 행이 되도록 날짜 이동)"""
+
+    def __init__(self, history: pd.DataFrame, shift_days: int = 0):
+        self._history = history
+        self._shift = pd.Timedelta(days=shift_days)
+
+    def history(self, **kwargs) -> pd.DataFrame:
+        df = self._history.copy()
+        df.index = df.index + self._shift
+        return df
+
+
+class FixtureFred:
+    """fredapi.Fred 대신 기록된 관측값을 반환"""
+
+    def __init__(self, shift_days: int = 0):
+        df = pd.read_csv(fixture_path("fred_series.csv"), parse_dates=["date"])
+        self._series = {
+            series_id: pd.Series(
+                group["value"].to_numpy(),
+                index=group["date"] + pd.Timedelta(days=shift_days),
+            )
+            for series_id, group in df.groupby("series_id")
+        }
+
+    @property
+    def series_ids(self) -> list[str]:
+        return list(self._series)
+
+    def get_series(self, series_id: str, observation_start=None, **kwargs):
+        if series_id not in self._series:
+            raise ValueError(f"Bad Request. The series does not exist: {series_id}")
+        series = self._series[series_id]
+        if observation_start is not None:
+            series = series[series.index >= pd.Timestamp(observation_start)]
+        return series.copy()
+
+
+# ── DB ──────────────────────────────────────────────────────────────────
+def use_sqlite_types():
+    """MySQL 전용 컬럼 타입을 SQLite에서 생성 가능하도록 매핑"""
+    from sqlalchemy.dialects.mysql import LONGTEXT
+    from sqlalchemy.ext.compiler import compiles
+
+    @compiles(LONGTEXT, "sqlite")
+    def _longtext(element, compiler, **kw):
+        return "TEXT"
+
+
+def load_companies() -> pd.DataFrame:
+    return pd.read_csv(fixture_path("companies.csv"), dtype={"cik": str})
+
+
+def prepare_database(engine) -> pd.DataFrame:
+    """벤치마크 DB 스키마 생성 및 종목/시가총액 적재
+
+    Returns:
+        pd.DataFrame: 적재된 종목 목록 (companies.csv).
+    """
+    from sqlalchemy import delete
+
+    from lib.Distributor.secretary.models import (  # noqa: F401 (모델 등록)
+        company,
+        financials,
+        macro,
+        news,
+        reports,
+        stock,
+    )
+    from lib.Distributor.secretary.models.company import Company
+    from lib.Distributor.secretary.models.core import Base
+    from lib.Distributor.secretary.models.stock import Stock_Daily
+
+    if engine.dialect.name == "sqlite":
+        use_sqlite_types()
+    Base.metadata.create_all(engine)
+
+    companies = load_companies()
+    with engine.begin() as conn:
+        conn.execute(delete(Stock_Daily))
+        conn.execute(delete(Company))
+        conn.execute(
+            Company.__table__.insert(),
+            [
+                {
+                    "company_id": int(row.company_id),
+                    "ticker": row.ticker,
+                    "cik": row.cik,
+                    "name_kr": row.name_en,
+                    "name_en": row.name_en,
+                    "sector": row.sector,
+                }
+                for row in companies.itertuples()
+            ],
+        )
+        conn.execute(
+            Stock_Daily.__table__.insert(),
+            [
+                {
+                    "company_id": int(row.company_id),
+                    "open": 100,
+                    "close": 100,
+                    "adj_close": 100,
+                    "high": 100,
+                    "low": 100,
+                    "volume": 0,
+                    "market_cap": int(row.market_cap),
+                    "posted_at": pd.Timestamp("2025-04-30").to_pydatetime(),
+                }
+                for row in companies.itertuples()
+            ],
+        )
+    return companies
+
+
+# ── 분석 서버 ───────────────────────────────────────────────────────────
+class FixtureAnalysisServer:
+    """notifier 요청을 받아 고정 응답을 돌려주는 로컬 TCP 서버"""
+
+    REPLY = orjson.dumps({"status_code": 200, "message": "ok", "item": {"result": 1}})
+
+    def __init__(self):
+        self._sock = socket.create_server(("127.0.0.1", 0))
+        self.address = self._sock.getsockname()
+        self._closed = False
+
+    def start(self) -> "FixtureAnalysisServer":
+        threading.Thread(target=self._serve, name="FixtureTCP", daemon=True).start()
+        return self
+
+    def _serve(self):
+        from lib.Distributor.socket.framing import FrameReader
+
+        while not self._closed:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            with conn:
+                FrameReader(conn, read_timeout=10).read()
+                conn.sendall(self.REPLY)
+
+    def stop(self):
+        self._closed = True
+        self._sock.close()
+
+    def client(self):
+        """이 서버로 요청하는 SocketClient"""
+        from lib.Distributor.socket.Client import SocketClient
+
+        address = self.address
+
+        class FixtureSocketClient(SocketClient):
+            @staticmethod
+            def resolve_addr(message=None):
+                return address
+
+        return FixtureSocketClient()
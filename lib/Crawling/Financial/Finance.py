@@ -1,12 +1,28 @@
 import yfinance as yf
 import pandas as pd
-import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
 
 
 from lib.Crawling.Interfaces.Crawler import CrawlerInterface
+from lib.Crawling.Interfaces.CrawlResult import CrawlResult
 from lib.Config.config import Config
 from lib.Crawling.utils.GetSymbols import get_company_map_from_db
+from lib.Crawling.utils.http_session import get_yf_session
+from lib.Crawling.utils.concurrency import (
+    AdaptiveLimiter,
+    backoff_sleep,
+    is_throttled,
+)
+
+TARGET_URL = "yfinance_library"  # CrawlingLog.target_url
+
+# 재무제표 종류 → (분기 accessor, 연간 accessor)
+STATEMENT_ACCESSORS = {
+    "income_statement": ("quarterly_financials", "financials"),
+    "balance_sheet": ("quarterly_balance_sheet", "balance_sheet"),
+    "cash_flow": ("quarterly_cashflow", "cashflow"),
+}
 
 SECTION_FIELDS = {
     "balance_sheet": {
@@ -38,75 +54,72 @@ class YFinancialCrawler(CrawlerInterface):
     def __init__(self, name):
         super().__init__(name)
         self.batch_size = 100
-        self.symbols = list(
-            get_company_map_from_db(limit=Config.get("symbol_size.total", 5)).keys()
-        )
+        self.symbols = self._load_symbols()
         self.tag = "financials"
         self.missing_stock_symbols = set()
         self.missing_financial_data = set()
 
+        options = Config.get("financial_crawler", {}) or {}
+        self.max_workers = options.get("max_workers", 8)
+        self.max_retries = options.get("max_retries", 3)
+        self.limiter = AdaptiveLimiter(
+            initial=options.get("initial_concurrency", 4),
+            minimum=1,
+            maximum=self.max_workers,
+        )
+        self._executor = None
+
+    def _load_symbols(self) -> list[str]:
+        """담당 종목 조회 (sharding 시 lease 재분배를 반영하도록 매 크롤링마다 호출)"""
+        return list(
+            get_company_map_from_db(limit=Config.get("symbol_size.total", 5)).keys()
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """크롤링 주기 사이에도 유지되는 작업자 풀 (스레드별 세션 재사용)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="Fundamentals"
+            )
+        return self._executor
+
     def crawl(self):
+        self.symbols = self._load_symbols()
         results = []
+        executor = self._get_executor()
 
-        for start in range(0, len(self.symbols), self.batch_size):
-            batch_idx = start // self.batch_size
-            batch = self.symbols[start : start + self.batch_size]
+        future_to_symbol = {
+            executor.submit(self._fetch_with_limit, symbol): symbol
+            for symbol in self.symbols
+        }
 
-            # 배치 인덱스가 10의 배수일 때만 로그 출력
-            if batch_idx % 10 == 0:
-                self.logger.debug(f"[배치 진행] [{batch_idx}]번째 배치 시작")
+        # 제표 종류별로 전 종목의 원본 제표를 모아 한 번에 가공
+        statements_by_type = {fin_type: [] for fin_type in STATEMENT_ACCESSORS}
 
+        for done, future in enumerate(as_completed(future_to_symbol), start=1):
+            symbol = future_to_symbol[future]
             try:
-                tickers = yf.Tickers(" ".join(batch))
-
+                statements, failures = future.result()
             except Exception as e:
-                for symbol in batch:
-                    for tag in ["income_statement", "balance_sheet", "cash_flow"]:
-                        results.append(
-                            {
-                                "tag": tag,
-                                "log": {
-                                    "crawling_type": self.tag,
-                                    "status_code": 500,
-                                },
-                                "fail_log": {
-                                    "err_message": str(f"{symbol} - yf.Tickers 실패")
-                                },
-                            }
-                        )
-                self.logger.error(f"yf.Tickers 실패: {str(e)}")
-                continue
+                for tag in STATEMENT_ACCESSORS:
+                    results.append(
+                        self._failure(tag, f"{symbol} 처리 중 오류 발생: {str(e)}")
+                    )
+                self.logger.error(f"{symbol} 처리 중 오류 발생: {str(e)}")
+            else:
+                results.extend(failures)
+                for fin_type, df_raw in statements.items():
+                    statements_by_type[fin_type].append((symbol, df_raw))
+
+            # 배치 크기 10개 분량마다 진행 상황 출력
+            if done % (self.batch_size * 10) == 0:
+                self.logger.debug(
+                    f"[진행] {done}/{len(self.symbols)} 종목 완료 "
+                    f"(동시 실행 {self.limiter.limit})"
+                )
 
-            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-                future_to_symbol = {
-                    executor.submit(self.fetch_symbol_data, symbol, tickers): symbol
-                    for symbol in batch
-                }
-
-                for future in concurrent.futures.as_completed(future_to_symbol):
-                    symbol = future_to_symbol[future]
-                    try:
-                        symbol_results = future.result()
-                        results.extend(symbol_results)
-                    except Exception as e:
-                        for tag in ["income_statement", "balance_sheet", "cash_flow"]:
-                            results.append(
-                                {
-                                    "tag": tag,
-                                    "log": {
-                                        "crawling_type": self.tag,
-                                        "status_code": 500,
-                                    },
-                                    "fail_log": {
-                                        "err_message": f"{symbol} 처리 중 오류 발생: {str(e)}"
-                                    },
-                                }
-                            )
-                        self.logger.error(f"{symbol} 처리 중 오류 발생: {str(e)}")
-
-        for result in results:
-            if "log" in result:
-                result["log"]["target_url"] = "yfinance_library"
+        for fin_type, frames in statements_by_type.items():
+            results.extend(self.shape_statements(frames, fin_type))
 
         if self.missing_stock_symbols:
             self.logger.warning(
@@ -122,76 +135,128 @@ class YFinancialCrawler(CrawlerInterface):
 
         return results
 
-    def fetch_symbol_data(self, symbol: str, tickers) -> List[dict]:
-        results = []
-        stock = tickers.tickers.get(symbol)
-
-        if not stock:
-            self.missing_stock_symbols.add(symbol)
-            return results  # 이 경우 이후 재무제표 루프 생략
-
-        for fin_type, accessors in [
-            (
-                "income_statement",
-                [lambda s: s.quarterly_financials, lambda s: s.financials],
-            ),
-            (
-                "balance_sheet",
-                [lambda s: s.quarterly_balance_sheet, lambda s: s.balance_sheet],
-            ),
-            ("cash_flow", [lambda s: s.quarterly_cashflow, lambda s: s.cashflow]),
-        ]:
-            df_raw = None
-            for accessor in accessors:
+    def _fetch_with_limit(
+        self, symbol: str
+    ) -> tuple[dict[str, pd.DataFrame], List[CrawlResult]]:
+        """동시 실행 제한 안에서 종목 재무제표 수집 (rate limit 시 감속 후 재시도)"""
+        for attempt in range(self.max_retries + 1):
+            with self.limiter.slot():
                 try:
-                    df = accessor(stock)
-                    if df is not None and not df.empty:
-                        df_raw = df
-                        break
-                except Exception:
+                    stock = yf.Ticker(symbol, session=get_yf_session())
+                    fetched = self.fetch_symbol_data(symbol, stock)
+                except Exception as e:
+                    if not is_throttled(e) or attempt == self.max_retries:
+                        raise
+                    limit = self.limiter.on_throttle()
+                    self.logger.warning(
+                        f"{symbol} rate limit 감지 → 동시 실행 {limit}로 감소: {e}"
+                    )
+                else:
+                    self.limiter.on_success()
+                    return fetched
+
+            backoff_sleep(attempt)
+
+    def _fetch_statements(self, stock) -> dict[str, pd.DataFrame]:
+        """세 재무제표를 한 번에 수집 (분기 데이터 우선, 없는 제표만 연간 데이터 조회)"""
+        statements = {}
+        for period in (0, 1):  # 0: 분기, 1: 연간
+            for fin_type, accessors in STATEMENT_ACCESSORS.items():
+                if fin_type in statements:
+                    continue
+                try:
+                    df = getattr(stock, accessors[period])
+                except Exception as e:
+                    if is_throttled(e):
+                        raise
                     continue
+                if df is not None and not df.empty:
+                    statements[fin_type] = df
+        return statements
+
+    def fetch_symbol_data(
+        self, symbol: str, stock
+    ) -> tuple[dict[str, pd.DataFrame], List[CrawlResult]]:
+        """종목의 원본 재무제표와 (없는 제표의) 실패 결과 반환"""
+        if not stock:
+            self.missing_stock_symbols.add(symbol)
+            return {}, []  # 이 경우 이후 재무제표 조회 생략
 
-            if df_raw is None or df_raw.empty:
-                self.missing_financial_data.add(f"{symbol} ({fin_type})")
-                results.append(
-                    {
-                        "tag": fin_type,
-                        "log": {"crawling_type": self.tag, "status_code": 404},
-                        "fail_log": {
-                            "err_message": f"{symbol}/{fin_type}: 분기 및 연간 데이터 모두 없음"
-                        },
-                    }
-                )
+        statements = self._fetch_statements(stock)
+
+        failures = []
+        for fin_type in STATEMENT_ACCESSORS:
+            if fin_type in statements:
                 continue
+            self.missing_financial_data.add(f"{symbol} ({fin_type})")
+            failures.append(
+                self._failure(
+                    fin_type,
+                    f"{symbol}/{fin_type}: 분기 및 연간 데이터 모두 없음",
+                    status_code=404,
+                )
+            )
+
+        return statements, failures
+
+    def shape_statements(
+        self, frames: list[tuple[str, pd.DataFrame]], fin_type: str
+    ) -> List[CrawlResult]:
+        """여러 종목의 같은 재무제표를 하나의 프레임으로 쌓아 컬럼 연산으로 가공
 
+        Returns:
+            List[CrawlResult]: 종목별 재무제표 결과 (df에 최근 분기 행들이 담김).
+        """
+        results, parts, columns = [], [], {}
+        for symbol, df_raw in frames:
             try:
-                df_latest = self.extract_recent_quarters(df_raw, symbol, fin_type)
-                for _, row in df_latest.iterrows():
-                    row_dict = {
-                        k: (None if pd.isna(v) else v) for k, v in row.to_dict().items()
-                    }
-                    row_dict = self.fill_missing_fields(row_dict, fin_type)
-                    results.append(
-                        {
-                            "tag": fin_type,
-                            "log": {"crawling_type": self.tag, "status_code": 200},
-                            "df": [row_dict],
-                        }
-                    )
+                part = self.extract_recent_quarters(df_raw, symbol, fin_type)
             except Exception as e:
                 results.append(
-                    {
-                        "tag": fin_type,
-                        "log": {"crawling_type": self.tag, "status_code": 500},
-                        "fail_log": {
-                            "err_message": f"{symbol}/{fin_type} 처리 중 오류: {str(e)}"
-                        },
-                    }
+                    self._failure(
+                        fin_type, f"{symbol}/{fin_type} 처리 중 오류: {str(e)}"
+                    )
                 )
                 self.logger.error(f"{symbol}/{fin_type} 처리 중 오류: {str(e)}")
-
+                continue
+            parts.append(part)
+            columns[symbol] = list(part.columns)
+
+        if not parts:
+            return results
+
+        stacked = derive_missing_fields(pd.concat(parts, ignore_index=True), fin_type)
+        values = stacked.astype(object).where(stacked.notna(), None)
+        fields = sorted(SECTION_FIELDS.get(fin_type, set()))
+
+        for symbol, group in values.groupby("Symbol", sort=False):
+            # 종목 원본에 있던 항목 + 섹션 필수 항목만 (다른 종목의 항목은 제외)
+            keys = list(dict.fromkeys(columns[symbol] + fields))
+            results.append(
+                CrawlResult.success(
+                    fin_type,
+                    [
+                        dict(zip(keys, row))
+                        for row in group[keys].itertuples(index=False, name=None)
+                    ],
+                    crawling_type=self.tag,
+                    target_url=TARGET_URL,
+                )
+            )
         return results
 
+    def _failure(
+        self, fin_type: str, err_message: str, status_code: int = 500
+    ) -> CrawlResult:
+        """재무제표 종류별 실패 결과 (crawling_type은 financials)"""
+        return CrawlResult.failure(
+            fin_type,
+            err_message,
+            crawling_type=self.tag,
+            status_code=status_code,
+            target_url=TARGET_URL,
+        )
+
     def extract_recent_quarters(
         self, df: pd.DataFrame, symbol: str, financial_type: str
     ) -> pd.DataFrame:
@@ -208,48 +273,47 @@ class YFinancialCrawler(CrawlerInterface):
             df.sort_values("posted_at", ascending=False).head(5).reset_index(drop=True)
         )
 
-    def fill_missing_fields(self, row: dict, section: str) -> dict:
-        fields = SECTION_FIELDS.get(section, set())
-
-        if "Cash Equivalents" in fields and (row.get("Cash Equivalents") is None):
-            ceq = row.get("Cash And Cash Equivalents")
-            if ceq is not None:
-                row["Cash Equivalents"] = ceq
-
-        if "Cash Financial" in fields and (row.get("Cash Financial") is None):
-            ce = row.get("Cash Equivalents") or row.get("Cash And Cash Equivalents")
-            osti = row.get("Other Short Term Investments")
-            if ce is not None and osti is not None:
-                row["Cash Financial"] = ce + osti
-
-        if "Cash Cash Equivalents And Short Term Investments" in fields and (
-            row.get("Cash Cash Equivalents And Short Term Investments") is None
-        ):
-            ce = row.get("Cash Equivalents") or row.get("Cash And Cash Equivalents")
-            osti = row.get("Other Short Term Investments")
-            if ce is not None and osti is not None:
-                row["Cash Cash Equivalents And Short Term Investments"] = ce + osti
-
-        if "Cost Of Revenue" in fields and (row.get("Cost Of Revenue") is None):
-            tr, gp = row.get("Total Revenue"), row.get("Gross Profit")
-            if tr is not None and gp is not None:
-                row["Cost Of Revenue"] = tr - gp
-
-        if "Gross Profit" in fields and (row.get("Gross Profit") is None):
-            tr, cor = row.get("Total Revenue"), row.get("Cost Of Revenue")
-            if tr is not None and cor is not None:
-                row["Gross Profit"] = tr - cor
-
-        if "EBITDA" in fields and (row.get("EBITDA") is None):
-            oi, rd = row.get("Operating Income"), row.get("Reconciled Depreciation")
-            if oi is not None and rd is not None:
-                row["EBITDA"] = oi + rd
-
-        for field in fields:
-            if field not in row:
-                row[field] = None
-
-        return row
+
+def derive_missing_fields(df: pd.DataFrame, section: str) -> pd.DataFrame:
+    """비어 있는 항목을 다른 항목으로 계산해 채움 (전체 행에 대한 컬럼 연산)
+
+    - Cash Equivalents ← Cash And Cash Equivalents
+    - Cash Financial, Cash Cash Equivalents And Short Term Investments
+      ← 현금성 자산 + Other Short Term Investments
+    - Cost Of Revenue ← Total Revenue - Gross Profit (Gross Profit은 그 역)
+    - EBITDA ← Operating Income + Reconciled Depreciation
+
+    섹션 필수 항목 중 없는 컬럼은 NaN으로 추가한다.
+    """
+    fields = SECTION_FIELDS.get(section, set())
+    df = df.copy()
+
+    def column(name: str) -> pd.Series:
+        if name in df.columns:
+            return pd.to_numeric(df[name], errors="coerce")
+        return pd.Series(float("nan"), index=df.index)
+
+    def fill(name: str, values: pd.Series):
+        if name in fields:
+            df[name] = column(name).fillna(values)
+
+    fill("Cash Equivalents", column("Cash And Cash Equivalents"))
+
+    # Cash Equivalents가 비었거나 0이면 Cash And Cash Equivalents 사용
+    ce = column("Cash Equivalents")
+    ce = ce.where(ce.notna() & (ce != 0), column("Cash And Cash Equivalents"))
+    cash_and_investments = ce + column("Other Short Term Investments")
+    fill("Cash Financial", cash_and_investments)
+    fill("Cash Cash Equivalents And Short Term Investments", cash_and_investments)
+
+    fill("Cost Of Revenue", column("Total Revenue") - column("Gross Profit"))
+    fill("Gross Profit", column("Total Revenue") - column("Cost Of Revenue"))
+    fill("EBITDA", column("Operating Income") + column("Reconciled Depreciation"))
+
+    for field in fields:
+        if field not in df.columns:
+            df[field] = float("nan")
+    return df
 
 
 from collections import defaultdict
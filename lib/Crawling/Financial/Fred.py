@@ -1,7 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
 from fredapi import Fred
 import pandas as pd
 
 from lib.Crawling.Interfaces.Crawler import CrawlerInterface
+from lib.Crawling.Interfaces.CrawlResult import CrawlResult
+from lib.Config.config import Config
+from lib.Crawling.utils.http_archive import HttpArchive
+from lib.Crawling.utils.rate_limit import RateLimiterRegistry
+from lib.Metrics.registry import MetricsRegistry
+
+FRED_HOST = "api.stlouisfed.org"
+TARGET_URL = "Fred_API"  # CrawlingLog.target_url
+
+# 가져올 FRED 데이터 목록 (지표명 : FRED Series ID), fred.series 설정이 없을 때 사용
+DEFAULT_SERIES = {
+    "Nominal GDP": "GDP",
+    "Real GDP": "GDPC1",
+    "Consumer Price Index (CPI)": "CPIAUCSL",
+    "Unemployment Rate": "UNRATE",
+    "Federal Funds Rate": "FEDFUNDS",
+    "2-Year Treasury Yield": "DGS2",
+    "Trade Balance": "BOPGSTB",
+    "Producer Price Index (PPI)": "PPIACO",
+    "PPI - Vehicle": "PCU336110336110",
+    "PPI - Electric": "PCU335999335999",
+    # "Purchasing Managers' Index (PMI)": "PMI",
+    "Personal Consumption Expenditures (PCE)": "PCE",
+    "Consumer Confidence Index (CCI)": "UMCSENT",
+}
+
+
+def get_observation_starts(index_names: list[str]) -> dict[str, datetime]:
+    """지표별로 저장된 관측일 중 두 번째로 최근 날짜 (최근/이전 값 재수집 시작점)"""
+    from sqlalchemy import func, select
+
+    from lib.Distributor.secretary.models.macro import MacroEconomics, MacroIndex
+    from lib.Distributor.secretary.session import get_session
+
+    ranked = (
+        select(
+            MacroIndex.index_name,
+            MacroEconomics.posted_at,
+            func.dense_rank()
+            .over(
+                partition_by=MacroEconomics.index_id,
+                order_by=MacroEconomics.posted_at.desc(),
+            )
+            .label("rank"),
+        )
+        .join(MacroIndex, MacroEconomics.index_id == MacroIndex.index_id)
+        .where(MacroIndex.index_name.in_(index_names))
+        .subquery()
+    )
+
+    with get_session() as db:
+        rows = db.execute(
+            select(ranked.c.index_name, func.min(ranked.c.posted_at))
+            .where(ranked.c.rank <= 2)
+            .group_by(ranked.c.index_name)
+            .having(func.count(func.distinct(ranked.c.posted_at)) == 2)
+        ).all()
+    return {name: posted_at for name, posted_at in rows}
 
 
 class FredCrawler(CrawlerInterface):
@@ -9,85 +70,117 @@ class FredCrawler(CrawlerInterface):
         super().__init__(name)
         self.key = api_key
         self.fred = Fred(api_key=self.key)
-        # 가져올 FRED 데이터 목록 (지표명 : FRED Series ID)
-        self.series_dict = {
-            "Nominal GDP": "GDP",
-            "Real GDP": "GDPC1",
-            "Consumer Price Index (CPI)": "CPIAUCSL",
-            "Unemployment Rate": "UNRATE",
-            "Federal Funds Rate": "FEDFUNDS",
-            "2-Year Treasury Yield": "DGS2",
-            "Trade Balance": "BOPGSTB",
-            "Producer Price Index (PPI)": "PPIACO",
-            "PPI - Vehicle": "PCU336110336110",
-            "PPI - Electric": "PCU335999335999",
-            # "Purchasing Managers' Index (PMI)": "PMI",
-            "Personal Consumption Expenditures (PCE)": "PCE",
-            "Consumer Confidence Index (CCI)": "UMCSENT",
-        }
         self.tag = "macro"
 
+        options = Config.get("fred", {}) or {}
+        self.series_dict = options.get("series") or DEFAULT_SERIES
+        self.max_workers = options.get("workers", 4)
+        # 저장 이력이 없는 지표의 조회 기간 (분기/연간 지표도 두 개 이상 관측되도록)
+        self.lookback_days = options.get("lookback_days", 800)
+
     def crawl(self):
         """FRED 데이터를 지표별로 분리하여 최근과 그 전 데이터 각각 반환"""
+        try:
+            starts = get_observation_starts(list(self.series_dict))
+        except Exception as e:
+            self.logger.warning(f"지표별 최근 관측일 조회 실패 → 기본 기간 사용: {e}")
+            starts = {}
+
+        default_start = datetime.now() - timedelta(days=self.lookback_days)
+        jobs = [
+            (name, series_id, starts.get(name, default_start))
+            for name, series_id in self.series_dict.items()
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            fetched = list(executor.map(lambda job: self._crawl_series(*job), jobs))
+
+        return [result for series_results in fetched for result in series_results]
+
+    def _fetch_series(self, series_id: str, observation_start) -> pd.Series:
+        """observation_start 이후만 조회, 관측값이 2개 미만이면 전체 이력 조회"""
+        data_series = self._get_series(
+            series_id, observation_start=observation_start.strftime("%Y-%m-%d")
+        ).dropna()
+        if len(data_series) < 2:
+            data_series = self._get_series(series_id).dropna()
+        return data_series
+
+    def _get_series(self, series_id: str, **kwargs) -> pd.Series:
+        """fredapi는 urlopen을 직접 호출하므로 호출 단위로 FRED 호스트 rate limit 적용"""
+        archive = HttpArchive.instance()  # 기록/재생 모드면 urlopen 핸들러 설치
+        limiter = RateLimiterRegistry.instance().for_host(FRED_HOST)
+        metrics = MetricsRegistry.instance()
+        if limiter is not None and not (archive and archive.replaying):
+            limiter.acquire()
+
+        try:
+            with metrics.timer("crawler_fetch_seconds", host=FRED_HOST):
+                data_series = self.fred.get_series(series_id, **kwargs)
+        except Exception as e:
+            metrics.inc("crawler_fetch_total", host=FRED_HOST, status="error")
+            if limiter is not None and any(
+                code in str(e) for code in ("429", "Too Many Requests")
+            ):
+                limiter.on_throttle()
+            raise
+
+        metrics.inc("crawler_fetch_total", host=FRED_HOST, status=200)
+        if limiter is not None:
+            limiter.on_success()
+        return data_series
+
+    def _crawl_series(
+        self, name: str, series_id: str, observation_start
+    ) -> list[CrawlResult]:
         results = []
 
-        for name, series_id in self.series_dict.items():
-            try:
-                data_series = self.fred.get_series(series_id)
-                data_series = data_series.dropna().ffill()
-                data_series.index = pd.to_datetime(data_series.index)
-
-                latest_date = data_series.index[-1]
-                previous_date = data_series.index[-2]
-                latest_value = data_series.iloc[-1]
-                previous_value = data_series.iloc[-2]
-
-                latest_row = {
-                    "index_name": name,
-                    "country": "US",
-                    "index_value": str(latest_value),
-                    "posted_at": latest_date.to_pydatetime(),
-                }
-
-                previous_row = {
-                    "index_name": name,
-                    "country": "US",
-                    "index_value": str(previous_value),
-                    "posted_at": previous_date.to_pydatetime(),
-                }
-
-                # 최신 데이터용 result
-                results.append(
-                    {
-                        "tag": self.tag,
-                        "log": {"crawling_type": self.tag, "status_code": 200},
-                        "df": pd.DataFrame([latest_row]),
-                    }
+        try:
+            data_series = self._fetch_series(series_id, observation_start)
+            data_series.index = pd.to_datetime(data_series.index)
+
+            latest_date = data_series.index[-1]
+            previous_date = data_series.index[-2]
+            latest_value = data_series.iloc[-1]
+            previous_value = data_series.iloc[-2]
+
+            latest_row = {
+                "index_name": name,
+                "country": "US",
+                "index_value": str(latest_value),
+                "posted_at": latest_date.to_pydatetime(),
+            }
+
+            previous_row = {
+                "index_name": name,
+                "country": "US",
+                "index_value": str(previous_value),
+                "posted_at": previous_date.to_pydatetime(),
+            }
+
+            # 최신 데이터용 result
+            results.append(
+                CrawlResult.success(
+                    self.tag, pd.DataFrame([latest_row]), target_url=TARGET_URL
                 )
+            )
 
-                # 이전 데이터용 result
-                results.append(
-                    {
-                        "tag": self.tag,
-                        "log": {"crawling_type": self.tag, "status_code": 200},
-                        "df": pd.DataFrame([previous_row]),
-                    }
+            # 이전 데이터용 result
+            results.append(
+                CrawlResult.success(
+                    self.tag, pd.DataFrame([previous_row]), target_url=TARGET_URL
                 )
+            )
 
-            except Exception as e:
-                results.append(
-                    {
-                        "tag": self.tag,
-                        "log": {"crawling_type": self.tag, "status_code": 500},
-                        "fail_log": {
-                            "index_name": name,
-                            "err_message": f"{series_id} - {str(e)}",
-                        },
-                    }
+        except Exception as e:
+            results.append(
+                CrawlResult.failure(
+                    self.tag,
+                    f"{series_id} - {str(e)}",
+                    target_url=TARGET_URL,
+                    index_name=name,
                 )
-                self.logger.error(f"{series_id} - {str(e)}")
+            )
+            self.logger.error(f"{series_id} - {str(e)}")
 
-        for result in results:
-            if "log" in result:
-                result["log"]["target_url"] = "Fred_API"
         return results
@@ -0,0 +1,201 @@
+import pandas as pd
+
+LOG_FIELDS = ("crawling_type", "status_code", "target_url")
+RESULT_FIELDS = ("tag", "log", "df", "fail_log")
+
+
+class InvalidCrawlResult(ValueError):
+    """형식이 잘못된 크롤링 결과"""
+
+
+class CrawlLog:
+    """CrawlingLog에 기록되는 크롤링 정보"""
+
+    __slots__ = LOG_FIELDS
+
+    def __init__(
+        self, crawling_type: str, status_code: int, target_url: str | None = None
+    ):
+        if not isinstance(crawling_type, str) or not crawling_type:
+            raise InvalidCrawlResult(f"잘못된 crawling_type: {crawling_type!r}")
+        if not isinstance(status_code, int) or isinstance(status_code, bool):
+            raise InvalidCrawlResult(f"status_code는 정수여야 함: {status_code!r}")
+
+        self.crawling_type = crawling_type
+        self.status_code = status_code
+        self.target_url = target_url
+
+    @classmethod
+    def from_dict(cls, log) -> "CrawlLog":
+        """dict 형태 log 변환"""
+        if isinstance(log, cls):
+            return log
+        if not isinstance(log, dict):
+            raise InvalidCrawlResult(f"log는 dict여야 함: {type(log).__name__}")
+
+        unknown = log.keys() - set(LOG_FIELDS)
+        if unknown:
+            raise InvalidCrawlResult(f"알 수 없는 log 필드: {sorted(unknown)}")
+        return cls(
+            log.get("crawling_type"), log.get("status_code"), log.get("target_url")
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "crawling_type": self.crawling_type,
+            "status_code": self.status_code,
+            "target_url": self.target_url,
+        }
+
+    # ── dict 형태 log를 읽던 코드 호환 ───────────────────────────────────
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in LOG_FIELDS else default
+
+    def __getitem__(self, key: str):
+        if key not in LOG_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self):
+        return (
+            f"CrawlLog({self.crawling_type!r}, {self.status_code!r}, "
+            f"{self.target_url!r})"
+        )
+
+
+class CrawlResult:
+    """크롤러가 Secretary로 넘기는 결과 1건
+
+    - 성공: df에 행 목록(list[dict]) 또는 DataFrame (내용이 없으면 None)
+    - 실패: fail_log에 err_message가 담긴 dict (df 없음)
+
+    생성 시 형식을 검사하므로 잘못된 결과는 저장 단계가 아니라 크롤러에서 걸러진다.
+    이전 dict 형식({"tag", "log", "df", "fail_log"})은 from_dict / to_dict로 변환하고,
+    dict처럼 읽는 코드(result["df"], "fail_log" in result 등)도 그대로 동작한다.
+    """
+
+    __slots__ = RESULT_FIELDS
+
+    def __init__(self, tag: str, log: CrawlLog, df=None, fail_log: dict | None = None):
+        if not isinstance(tag, str) or not tag:
+            raise InvalidCrawlResult(f"잘못된 tag: {tag!r}")
+        if not isinstance(log, CrawlLog):
+            raise InvalidCrawlResult(f"log는 CrawlLog여야 함: {type(log).__name__}")
+        if fail_log is not None:
+            if df is not None:
+                raise InvalidCrawlResult(f"{tag}: df와 fail_log를 함께 가질 수 없음")
+            if not isinstance(fail_log, dict) or "err_message" not in fail_log:
+                raise InvalidCrawlResult(f"{tag}: fail_log에 err_message 없음")
+        elif isinstance(df, list):
+            if df and not isinstance(df[0], dict):
+                raise InvalidCrawlResult(
+                    f"{tag}: df 행은 dict여야 함: {type(df[0]).__name__}"
+                )
+        elif df is not None and not isinstance(df, pd.DataFrame):
+            raise InvalidCrawlResult(
+                f"{tag}: df는 list 또는 DataFrame이어야 함: {type(df).__name__}"
+            )
+
+        self.tag = tag
+        self.log = log
+        self.df = df
+        self.fail_log = fail_log
+
+    @classmethod
+    def success(
+        cls,
+        tag: str,
+        df,
+        crawling_type: str | None = None,
+        target_url: str | None = None,
+        status_code: int = 200,
+    ) -> "CrawlResult":
+        """성공 결과 (crawling_type 생략 시 tag 사용)"""
+        return cls(tag, CrawlLog(crawling_type or tag, status_code, target_url), df=df)
+
+    @classmethod
+    def failure(
+        cls,
+        tag: str,
+        err_message: str,
+        crawling_type: str | None = None,
+        status_code: int = 500,
+        target_url: str | None = None,
+        **detail,
+    ) -> "CrawlResult":
+        """실패 결과 (detail은 fail_log에 함께 기록)"""
+        return cls(
+            tag,
+            CrawlLog(crawling_type or tag, status_code, target_url),
+            fail_log={**detail, "err_message": err_message},
+        )
+
+    @property
+    def failed(self) -> bool:
+        return self.fail_log is not None
+
+    def with_df(self, df) -> "CrawlResult":
+        """같은 tag/log로 df만 바꾼 결과 (log는 공유)"""
+        return CrawlResult(self.tag, self.log, df=df)
+
+    # ── dict 형식 호환 ───────────────────────────────────────────────────
+    @classmethod
+    def from_dict(cls, result) -> "CrawlResult":
+        """이전 dict 형식 결과 변환 (spool 재생, 외부 호출자)"""
+        if not isinstance(result, dict):
+            raise InvalidCrawlResult(f"결과는 dict여야 함: {type(result).__name__}")
+
+        unknown = result.keys() - set(RESULT_FIELDS)
+        if unknown:
+            raise InvalidCrawlResult(f"알 수 없는 결과 필드: {sorted(unknown)}")
+        if "log" not in result:
+            raise InvalidCrawlResult(f"{result.get('tag')}: log 없음")
+        return cls(
+            result.get("tag"),
+            CrawlLog.from_dict(result["log"]),
+            df=result.get("df"),
+            fail_log=result.get("fail_log"),
+        )
+
+    @classmethod
+    def coerce(cls, result) -> "CrawlResult":
+        return result if isinstance(result, cls) else cls.from_dict(result)
+
+    def to_dict(self) -> dict:
+        result = {"tag": self.tag, "log": self.log.to_dict()}
+        if self.df is not None:
+            result["df"] = self.df
+        if self.fail_log is not None:
+            result["fail_log"] = self.fail_log
+        return result
+
+    def __contains__(self, key: str) -> bool:
+        return key in RESULT_FIELDS and getattr(self, key) is not None
+
+    def __getitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self else default
+
+    def __repr__(self):
+        if self.failed:
+            return (
+                f"CrawlResult({self.tag!r}, {self.log!r}, fail_log={self.fail_log!r})"
+            )
+        rows = None if self.df is None else len(self.df)
+        return f"CrawlResult({self.tag!r}, {self.log!r}, rows={rows})"
+
+
+def coerce_results(results, logger=None) -> list[CrawlResult]:
+    """결과 목록을 CrawlResult로 변환 (형식이 잘못된 결과는 로그 후 제외)"""
+    coerced = []
+    for result in results:
+        try:
+            coerced.append(CrawlResult.coerce(result))
+        except InvalidCrawlResult as e:
+            if logger is not None:
+                logger.error(f"잘못된 크롤링 결과 제외 → {e}")
+    return coerced
@@ -12,8 +12,24 @@ import numpy as np  # 수치 데이터 처리
 
 # 내부 모듈
 from lib.Crawling.Interfaces.Scheduler import Scheduler  # 스케줄러 클래스
+from lib.Crawling.Interfaces.CrawlResult import (  # 크롤링 결과 타입
+    CrawlResult,
+    coerce_results,
+)
 from lib.Config.config import Config  # 설정 관리 클래스
 from lib.Logger.logger import get_logger  # 로깅 클래스
+from lib.Crawling.utils.resilience import RetryBudget  # 주기별 재시도 예산
+from lib.Metrics.registry import MetricsRegistry  # 계측 저장소
+from lib.Metrics.profiling import CycleProfiler  # 주기별 프로파일링
+
+
+def _json_default(obj):
+    """json 저장 시 결과는 dict로, DataFrame 결과(COLUMNAR_RESULT)는 행 목록으로 기록"""
+    if isinstance(obj, CrawlResult):
+        return obj.to_dict()
+    if isinstance(obj, pd.DataFrame):
+        return obj.replace({np.nan: None}).to_dict(orient="records")
+    return str(obj)
 
 
 class CrawlerInterface(ABC):
@@ -22,12 +38,16 @@ class CrawlerInterface(ABC):
     # 클래스 변수
     CHECK_INTERVAL_SEC = 5  # 크롤링 주기 (초)
     SAVE_METHOD = Config.get("save_method", {})  # 저장 방식 설정
+    # True면 DataFrame 결과를 dict로 변환하지 않고 DB 핸들러에 전달
+    COLUMNAR_RESULT = False
 
     def __init__(self, name: str):
         """크롤러 초기화"""
         self.name = name
         self.scheduler = Scheduler(name)
         self.logger = get_logger(self.__class__.__name__)
+        self.retry_budget = None  # 크롤링 주기별 재시도 예산
+        self.deadline = None  # 다음 실행 시각 (epoch 초), 재시도는 이 시각 전까지만
 
     def run(self):
         """크롤러 실행 루프"""
@@ -44,27 +64,56 @@ class CrawlerInterface(ABC):
     def _execute_crawl(self):
         """크롤링 실행 및 결과 처리"""
         self.logger.info(f"크롤링 시작")
-        result = self.crawl()
-
-        if result:
-            self._process_result(result)
-        else:
-            self.logger.info(f"크롤링 결과 없음")
+        self.retry_budget = RetryBudget.from_config()
+        self.deadline = self.scheduler.next_fire_time()
+
+        metrics = MetricsRegistry.instance()
+        crawler = self.__class__.__name__
+        # profiling.targets에 지정된 크롤러면 이번 주기 전체(수집 + 저장)를 측정
+        with CycleProfiler.instance().profile(crawler, crawler_name=self.name):
+            with metrics.timer("crawler_crawl_seconds", crawler=crawler):
+                result = self.crawl()
+
+            # dict 결과도 CrawlResult로 변환하고 형식이 잘못된 결과는 여기서 제외
+            result = coerce_results(result or [], self.logger)
+            if result:
+                self._record_result_metrics(metrics, crawler, result)
+                self._process_result(result)
+            else:
+                self.logger.info(f"크롤링 결과 없음")
 
         self.logger.log_summary()
 
-    def _process_result(self, result):
+    @staticmethod
+    def _record_result_metrics(
+        metrics: MetricsRegistry, crawler: str, result: list[CrawlResult]
+    ):
+        """크롤러별 결과 수와 생성된 행 수 기록"""
+        for item in result:
+            status = "fail" if item.failed else "ok"
+            metrics.inc(
+                "crawler_results_total", crawler=crawler, tag=item.tag, status=status
+            )
+            if item.df is not None:
+                metrics.inc(
+                    "crawler_rows_total", len(item.df), crawler=crawler, tag=item.tag
+                )
+
+    def _process_result(self, result: list[CrawlResult]):
         """크롤링 결과 처리"""
         for result_item in result:
-            df = result_item.get("df")
+            df = result_item.df
             if isinstance(df, pd.DataFrame):
                 if "posted_at" in df.columns:
                     df["posted_at"] = pd.to_datetime(df["posted_at"])
-                result_item["df"] = (
-                    df.reset_index(drop=True)
-                    .replace({np.nan: None})
-                    .to_dict(orient="records")
-                )
+                if self.COLUMNAR_RESULT:
+                    result_item.df = df.reset_index(drop=True)
+                else:
+                    result_item.df = (
+                        df.reset_index(drop=True)
+                        .replace({np.nan: None})
+                        .to_dict(orient="records")
+                    )
             elif isinstance(df, list):
                 for row in df:
                     if "posted_at" in row:
@@ -82,9 +131,20 @@ class CrawlerInterface(ABC):
             os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         )
         temp_dir = os.path.join(base_dir, "Datas")
+
+        file_format = self.SAVE_METHOD.get("file_format", "json")
+        if file_format != "json":
+            try:
+                self._save_columnar(temp_dir, result)
+                return
+            except ImportError:
+                self.logger.warning(
+                    f"pyarrow 미설치 → {file_format} 대신 json으로 저장"
+                )
+
         os.makedirs(temp_dir, exist_ok=True)
 
-        tag = result[0].get("tag", "unknown") if result else "unknown"
+        tag = result[0].tag if result else "unknown"
         if tag == "income_statement":
             tag = "financials"
 
@@ -93,17 +153,46 @@ class CrawlerInterface(ABC):
 
         try:
             with open(filename, "w", encoding="utf-8") as f:
-                json.dump(result, f, ensure_ascii=False, indent=2, default=str)
+                json.dump(
+                    result, f, ensure_ascii=False, indent=2, default=_json_default
+                )
             self.logger.info(f"결과 저장 완료: {filename}")
         except Exception as e:
             self.logger.error(f"파일 저장 중 예외 발생: {e}")
 
+    def _save_columnar(self, base_dir, result):
+        """태그/날짜로 파티션된 Parquet 또는 Arrow IPC 파일로 저장"""
+        from lib.Crawling.utils.columnar import ColumnarStore
+
+        store = ColumnarStore.instance(base_dir)
+        try:
+            written = store.write(result)
+            self.logger.info(
+                f"결과 저장 완료: {len(written)}개 파일 ({store.file_format})"
+            )
+        except Exception as e:
+            self.logger.error(f"파일 저장 중 예외 발생: {e}")
+
     def save_to_db(self, result):
         """크롤링 결과를 데이터베이스에 저장"""
         from ...Distributor.secretary.Secretary import Secretary
         from sqlalchemy.exc import SQLAlchemyError
 
-        secretary = Secretary()  # DB 세션은 Secretary 내부에서 관리
+        if Config.get("write_behind.enabled", False):
+            from ...Distributor.secretary.writer import WriteBehindQueue
+
+            writer = WriteBehindQueue.instance()
+            if writer.put(result):
+                self.logger.info(f"DB 저장 대기열 등록 - {len(result)}건")
+                self.logger.debug(f"DB 저장 대기열 상태: {writer.stats()}")
+                return
+            self.logger.warning(f"DB 저장 대기열 포화: {writer.stats()}")
+
+            # 저장 지연 → spool에 보관 후 DB 복구/여유 시 재생 (spool 비활성화 시 동기 저장)
+            if Secretary.instance().spool(result, reason="(DB 저장 지연)"):
+                return
+
+        secretary = Secretary.instance()  # 프로세스 공용, 세션은 호출마다 풀에서 대여
 
         try:
             secretary.distribute(result)
@@ -112,6 +201,6 @@ class CrawlerInterface(ABC):
             self.logger.error(f"DB 저장 중 SQLAlchemy 예외 발생: {e}")
 
     @abstractmethod
-    def crawl(self):
+    def crawl(self) -> list[CrawlResult] | None:
         """크롤링 로직은 서브클래스에서 구현"""
         pass
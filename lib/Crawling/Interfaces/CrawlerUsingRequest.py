@@ -1,13 +1,19 @@
+from urllib.parse import urlsplit
+
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 
 
 from lib.Crawling.Interfaces.Crawler import CrawlerInterface
+from lib.Crawling.Interfaces.CrawlResult import CrawlResult
 from lib.Crawling.config.headers import HEADERS
 from lib.Crawling.Interfaces.Crawler_handlers import EXTRACT_HANDLERS
 from lib.Config.config import Config
 from lib.Crawling.utils.retry import retry_with_exponential_backoff
+from lib.Metrics.registry import MetricsRegistry
+from lib.Crawling.utils.http_session import get_http_session
+from lib.Crawling.utils.resilience import CircuitBreakerRegistry
 
 
 class CrawlerUsingRequest(CrawlerInterface):
@@ -25,10 +31,14 @@ class CrawlerUsingRequest(CrawlerInterface):
             url = self.config["url"]
 
         def _fetch():
-            response = requests.get(url, headers=HEADERS, timeout=20)
+            response = get_http_session().get(url, headers=HEADERS, timeout=20)
             response.raise_for_status()
+            with MetricsRegistry.instance().timer(
+                "crawler_parse_seconds", crawler=self.__class__.__name__
+            ):
+                soup = BeautifulSoup(response.text, "html.parser")
             return {
-                "soup": BeautifulSoup(response.text, "html.parser"),
+                "soup": soup,
                 "status_code": response.status_code,
                 "url": url,
             }
@@ -41,6 +51,9 @@ class CrawlerUsingRequest(CrawlerInterface):
             max_delay=30,
             class_name=self.__class__.__name__,
             logger=self.logger,
+            circuit=CircuitBreakerRegistry.instance().for_host(urlsplit(url).hostname),
+            retry_budget=self.retry_budget,
+            deadline=self.deadline,
         )
 
     def crawl(self):
@@ -62,21 +75,11 @@ class CrawlerUsingRequest(CrawlerInterface):
                 if not href:
                     continue
 
-                result = {
-                    "tag": self.tag,
-                    "log": {
-                        "crawling_type": self.tag,
-                        "status_code": 200,
-                        "target_url": href,
-                    },
-                }
-
-                if article.get("content"):
-                    result["df"] = pd.DataFrame([article])
-                else:
+                df = pd.DataFrame([article]) if article.get("content") else None
+                if df is None:
                     self.logger.warning("기사 내용 없음")
 
-                results.append(result)
+                results.append(CrawlResult.success(self.tag, df, target_url=href))
 
             return results
 
@@ -94,15 +97,12 @@ class CrawlerUsingRequest(CrawlerInterface):
             self.logger.error(f"{type(e).__name__}: {str(e)}")
 
             return [
-                {
-                    "tag": self.tag,
-                    "log": {
-                        "crawling_type": self.tag,
-                        "status_code": status_code,
-                        "target_url": target_url,
-                    },
-                    "fail_log": {"err_message": f"{type(e).__name__}: {str(e)}"},
-                }
+                CrawlResult.failure(
+                    self.tag,
+                    f"{type(e).__name__}: {str(e)}",
+                    status_code=status_code,
+                    target_url=target_url,
+                )
             ]
 
     def crawl_main(self, soup):
@@ -47,6 +47,14 @@ class Scheduler:
         expires_at = Scheduler._ttl_cache.get(self.name)
         return expires_at is not None and time.time() < expires_at
 
+    def next_fire_time(self) -> float | None:
+        """다음 크롤링 실행 가능 시각
+
+        Returns:
+            float | None: epoch 초 (TTL이 설정되지 않았으면 None)
+        """
+        return Scheduler._ttl_cache.get(self.name)
+
     def _load_schedule(self):
         """스케줄 설정 로드
 
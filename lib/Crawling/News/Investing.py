@@ -1,18 +1,21 @@
 from bs4 import BeautifulSoup
-import cloudscraper
 import datetime
 import re
+from urllib.parse import urlsplit
 
 from lib.Crawling.Interfaces.CrawlerUsingRequest import CrawlerUsingRequest
 from lib.Crawling.config.headers import HEADERS
 from lib.Crawling.utils.retry import retry_with_exponential_backoff
+from lib.Metrics.registry import MetricsRegistry
+from lib.Crawling.utils.http_session import RateLimitedScraper
+from lib.Crawling.utils.resilience import CircuitBreakerRegistry
 
 
 class InvestingNewsCrawler(CrawlerUsingRequest):
 
     def __init__(self, name, config):
         super().__init__(name, config)
-        self.scraper = cloudscraper.create_scraper()
+        self.scraper = RateLimitedScraper.create_scraper()
         self.tag = "news"
         self.custom_handlers = {
             "organization": self.custom_extract_organization,
@@ -30,8 +33,12 @@ class InvestingNewsCrawler(CrawlerUsingRequest):
             if response.status_code != 200:
                 response.raise_for_status()
 
+            with MetricsRegistry.instance().timer(
+                "crawler_parse_seconds", crawler=self.__class__.__name__
+            ):
+                soup = BeautifulSoup(response.text, "html.parser")
             return {
-                "soup": BeautifulSoup(response.text, "html.parser"),
+                "soup": soup,
                 "status_code": response.status_code,
                 "url": url,
             }
@@ -43,6 +50,9 @@ class InvestingNewsCrawler(CrawlerUsingRequest):
             max_delay=3.0,
             class_name=self.__class__.__name__,
             logger=self.logger,
+            circuit=CircuitBreakerRegistry.instance().for_host(urlsplit(url).hostname),
+            retry_budget=self.retry_budget,
+            deadline=self.deadline,
         )
 
     def extract_mainContainer(self, soup):
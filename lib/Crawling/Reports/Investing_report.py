@@ -1,18 +1,21 @@
 from bs4 import BeautifulSoup
-import cloudscraper
 import datetime
 import re
+from urllib.parse import urlsplit
 
 from lib.Crawling.Interfaces.CrawlerUsingRequest import CrawlerUsingRequest
 from lib.Crawling.config.headers import HEADERS
 from lib.Crawling.utils.retry import retry_with_exponential_backoff
+from lib.Metrics.registry import MetricsRegistry
+from lib.Crawling.utils.http_session import RateLimitedScraper
+from lib.Crawling.utils.resilience import CircuitBreakerRegistry
 
 
 class InvestingReportCrawler(CrawlerUsingRequest):
 
     def __init__(self, name, config):
         super().__init__(name, config)
-        self.scraper = cloudscraper.create_scraper()
+        self.scraper = RateLimitedScraper.create_scraper()
         self.tag = "reports"
         self.custom_handlers = {"posted_at": self.custom_extract_posted_at}
 
@@ -29,8 +32,12 @@ class InvestingReportCrawler(CrawlerUsingRequest):
             if response.status_code != 200:
                 response.raise_for_status()
 
+            with MetricsRegistry.instance().timer(
+                "crawler_parse_seconds", crawler=self.__class__.__name__
+            ):
+                soup = BeautifulSoup(response.text, "html.parser")
             return {
-                "soup": BeautifulSoup(response.text, "html.parser"),
+                "soup": soup,
                 "status_code": response.status_code,
                 "url": url,
             }
@@ -42,6 +49,9 @@ class InvestingReportCrawler(CrawlerUsingRequest):
             max_delay=5.0,
             class_name=self.__class__.__name__,
             logger=self.logger,
+            circuit=CircuitBreakerRegistry.instance().for_host(urlsplit(url).hostname),
+            retry_budget=self.retry_budget,
+            deadline=self.deadline,
         )
 
     def custom_extract_posted_at(self, soup, selectors):
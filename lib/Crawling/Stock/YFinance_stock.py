@@ -1,29 +1,30 @@
 from __future__ import annotations
 
 # ─── Built-in Modules ─────────────────────────────────────────────────────
-import time
 from typing import List
-import random
 
 # ─── Third-party Modules ─────────────────────────────────────────────────
 import logging
 import pandas as pd
 import yfinance as yf
-from curl_cffi import requests as curl_requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ─── Project-specific Modules ────────────────────────────────────────────
 from lib.Crawling.Interfaces.Crawler import CrawlerInterface
+from lib.Crawling.Interfaces.CrawlResult import CrawlResult
 from lib.Distributor.secretary.models.stock import Stock_Daily
 from lib.Distributor.secretary.session import get_session
 from lib.Config.config import Config
 from lib.Crawling.utils.yfhandler import _YFForwardHandler
 from lib.Crawling.utils.GetSymbols import get_company_map_from_db
+from lib.Crawling.utils.http_session import get_yf_session
+from lib.Metrics.profiling import CycleProfiler
 
-session = curl_requests.Session(impersonate="chrome")
+TARGET_URL = "yfinance_library"  # CrawlingLog.target_url
 
 
 class YFinanceStockCrawler(CrawlerInterface):
+    COLUMNAR_RESULT = True  # 분봉 DataFrame을 store_stock에 그대로 전달
 
     def __init__(self, name: str):
         """Initializes the crawler."""
@@ -31,9 +32,7 @@ class YFinanceStockCrawler(CrawlerInterface):
         self.tag = "stock"
         self.batch_size = 30
         self.max_workers = 5
-        self._company_map = get_company_map_from_db(
-            Config.get("symbol_size.total", 6000)
-        )
+        self._company_map = self._load_company_map()
         self.failed_tickers: dict[str, set[str]] = {}
 
         # Configure yfinance logger
@@ -43,6 +42,10 @@ class YFinanceStockCrawler(CrawlerInterface):
         yf_logger.addHandler(_YFForwardHandler(self.logger))
         yf_logger.propagate = False
 
+    def _load_company_map(self) -> dict[str, dict]:
+        """담당 종목 조회 (sharding 시 lease 재분배를 반영하도록 매 크롤링마다 호출)"""
+        return get_company_map_from_db(Config.get("symbol_size.total", 6000))
+
     def _add_fail(self, ticker: str, msg: str):
         if ticker not in self.failed_tickers:
             self.failed_tickers[ticker] = set()
@@ -62,7 +65,8 @@ class YFinanceStockCrawler(CrawlerInterface):
         ]
 
         for crawler in crawlers:
-            crawler.crawl()
+            with CycleProfiler.instance().profile(crawler.__class__.__name__):
+                crawler.crawl()
             crawler.logger.log_summary()
 
         self.logger.debug("주가 데이터 캐싱 완료")
@@ -107,6 +111,7 @@ class YFinanceStockCrawler(CrawlerInterface):
 
     def crawl(self):
         try:
+            self._company_map = self._load_company_map()
             self._refresh_price_data_cache()
             self._adj_map = self.get_adj_close_map()
 
@@ -136,20 +141,13 @@ class YFinanceStockCrawler(CrawlerInterface):
                     except Exception as e:
                         for sym in batch:
                             results.append(
-                                {
-                                    "tag": self.tag,
-                                    "log": {
-                                        "crawling_type": self.tag,
-                                        "status_code": 500,
-                                    },
-                                    "fail_log": {"err_message": f"Batch error: {e}"},
-                                }
+                                CrawlResult.failure(
+                                    self.tag,
+                                    f"Batch error: {e}",
+                                    target_url=TARGET_URL,
+                                )
                             )
 
-            for result in results:
-                if "log" in result:
-                    result["log"]["target_url"] = "yfinance_library"
-
             if self.failed_tickers:
                 total = sum(len(reasons) for reasons in self.failed_tickers.values())
                 self.logger.warning(
@@ -170,7 +168,7 @@ class YFinanceStockCrawler(CrawlerInterface):
         except Exception as e:
             self.logger.error(f"{e}")
 
-    def _crawl_batch(self, batch: List[str]):
+    def _crawl_batch(self, batch: List[str]) -> List[CrawlResult]:
         batch_results = []
 
         for ticker in batch:
@@ -181,30 +179,22 @@ class YFinanceStockCrawler(CrawlerInterface):
                     continue
 
                 company_id = company["company_id"]
-                stock = yf.Ticker(ticker, session=session)
+                stock = yf.Ticker(ticker, session=get_yf_session())
 
                 df_min = self._process_minute_data(stock, ticker, company_id)
 
                 batch_results.append(
-                    {
-                        "tag": self.tag,
-                        "log": {"crawling_type": self.tag, "status_code": 200},
-                        "df": df_min,
-                    }
+                    CrawlResult.success(self.tag, df_min, target_url=TARGET_URL)
                 )
 
             except Exception as e:
                 batch_results.append(
-                    {
-                        "tag": self.tag,
-                        "log": {"crawling_type": self.tag, "status_code": 500},
-                        "fail_log": {"err_message": f"{ticker}: {str(e)}"},
-                    }
+                    CrawlResult.failure(
+                        self.tag, f"{ticker}: {str(e)}", target_url=TARGET_URL
+                    )
                 )
                 self._add_fail(ticker, str(e))
 
-            time.sleep(random.uniform(0.1, 0.4))
-
         return batch_results
 
     def _process_minute_data(self, stock, ticker, company_id) -> pd.DataFrame:
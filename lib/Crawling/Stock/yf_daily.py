@@ -7,6 +7,7 @@ from lib.Distributor.secretary.session import get_session
 from lib.Distributor.secretary.models.company import Company
 from lib.Distributor.secretary.models.stock import Stock_Daily, Stock_Quarterly
 from lib.Logger.logger import get_logger
+from lib.Crawling.utils.http_session import get_yf_session
 
 
 class YF_Daily:
@@ -65,7 +66,9 @@ class YF_Daily:
         return None
 
     def get_previous_trading_day(self) -> str:
-        df = yf.Ticker("AAPL").history(period="7d", interval="1d")
+        df = yf.Ticker("AAPL", session=get_yf_session()).history(
+            period="7d", interval="1d"
+        )
         return df.index[-1].date().isoformat() if not df.empty else None
 
     def check_missing(self, prev_day: str) -> list[str]:
@@ -111,6 +114,7 @@ class YF_Daily:
                     group_by="ticker",
                     threads=True,
                     progress=False,
+                    session=get_yf_session(),
                 )
             except Exception as e:
                 raise RuntimeError(f"yf.download 실패: {e}")
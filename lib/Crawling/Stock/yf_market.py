@@ -8,6 +8,7 @@ from lib.Distributor.secretary.models.company import Company
 from lib.Distributor.secretary.models.stock import Stock_Market
 from lib.Logger.logger import get_logger
 from lib.Crawling.config.MarketMap import MARKET_INDEX_TICKER
+from lib.Crawling.utils.http_session import get_yf_session
 
 
 class YF_Market:
@@ -28,7 +29,9 @@ class YF_Market:
 
     def get_recent_trading_day(self) -> date | None:
         try:
-            df = yf.Ticker("^IXIC").history(period="7d", interval="1d")
+            df = yf.Ticker("^IXIC", session=get_yf_session()).history(
+                period="7d", interval="1d"
+            )
             if df.empty:
                 return None
             return df.index[-1].date()
@@ -81,7 +84,9 @@ class YF_Market:
         try:
             for market_code in market_codes:
                 index_symbol = self.market_map[market_code]
-                df = yf.Ticker(index_symbol).history(period=f"{days}d", interval="1d")
+                df = yf.Ticker(index_symbol, session=get_yf_session()).history(
+                    period=f"{days}d", interval="1d"
+                )
 
                 if df.empty:
                     missing_data_codes.add(market_code)
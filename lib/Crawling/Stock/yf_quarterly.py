@@ -10,6 +10,7 @@ from lib.Distributor.secretary.session import get_session
 from lib.Distributor.secretary.models.company import Company
 from lib.Distributor.secretary.models.stock import Stock_Quarterly
 from lib.Logger.logger import get_logger  # Logger import 추가
+from lib.Crawling.utils.http_session import get_yf_session
 
 
 class YF_Quarterly:
@@ -47,7 +48,7 @@ class YF_Quarterly:
 
     def fetch_fundamentals(self, ticker: str) -> Optional[dict[date, dict]]:
         try:
-            tkr = yf.Ticker(ticker)
+            tkr = yf.Ticker(ticker, session=get_yf_session())
             shares_dict = self._get_quarterly_shares(tkr)
             if not shares_dict:
                 return None
@@ -5,35 +5,43 @@ from concurrent.futures import (
 )  # 스레드 풀 및 작업 완료 처리
 
 # 내부 모듈
-from lib.Crawling.News import run as run_news  # 뉴스 크롤링 실행 함수
-from lib.Crawling.Reports import run as run_reports  # 리포트 크롤링 실행 함수
-from lib.Crawling.Financial import run as run_financial  # 금융 데이터 크롤링 실행 함수
-from lib.Crawling.Stock import run as run_stock  # 주식 데이터 크롤링 실행 함수
 from lib.Config.config import Config  # 설정 관리 클래스
 
 
 def run():
-    """크롤링 실행 (스레드 풀)"""
+    """크롤링 실행 (스레드 풀)
+
+    크롤러 모듈(pandas, yfinance, bs4 등)은 crawler_switch에서 켜진 것만 import 한다.
+    """
     crawler_switch = Config.get("crawler_switch", {})
+    runners = []
 
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = []
+    # 뉴스 크롤링 실행
+    if crawler_switch.get("news", True):
+        from lib.Crawling.News import run as run_news
+
+        runners.append(run_news)
+
+    # 리포트 크롤링 실행
+    if crawler_switch.get("reports", True):
+        from lib.Crawling.Reports import run as run_reports
 
-        # 뉴스 크롤링 실행
-        if crawler_switch.get("news", True):
-            futures.append(executor.submit(run_news))
+        runners.append(run_reports)
 
-        # 리포트 크롤링 실행
-        if crawler_switch.get("reports", True):
-            futures.append(executor.submit(run_reports))
+    # 금융 데이터 크롤링 실행
+    if crawler_switch.get("financial", True):
+        from lib.Crawling.Financial import run as run_financial
 
-        # 금융 데이터 크롤링 실행
-        if crawler_switch.get("financial", True):
-            futures.append(executor.submit(run_financial))
+        runners.append(run_financial)
 
-        # 주식 데이터 크롤링 실행
-        if crawler_switch.get("stock", True):
-            futures.append(executor.submit(run_stock))
+    # 주식 데이터 크롤링 실행
+    if crawler_switch.get("stock", True):
+        from lib.Crawling.Stock import run as run_stock
+
+        runners.append(run_stock)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(runner) for runner in runners]
 
         # 모든 크롤링 작업 완료 대기
         for future in as_completed(futures):
@@ -2,18 +2,31 @@ from typing import Optional, Dict
 
 from lib.Distributor.secretary.models.company import Company
 from lib.Distributor.secretary.session import get_session
+from lib.Crawling.utils.sharding import ShardCoordinator, shard_of
 
 
-def get_company_map_from_db(limit: Optional[int] = None) -> Dict[str, dict]:
+def get_company_map_from_db(
+    limit: Optional[int] = None, sharded: bool = True
+) -> Dict[str, dict]:
+    """company_id 순 상위 limit개 종목 중 이 노드가 담당하는 종목 조회
+
+    Args:
+        limit: 전체 종목 universe 크기 (shard로 나누기 전 기준).
+        sharded: False면 sharding 설정과 무관하게 전체 종목 반환.
+    """
     with get_session() as session:
         q = session.query(Company.ticker, Company.company_id, Company.cik).order_by(
             Company.company_id.asc()
         )
         if limit:
             q = q.limit(limit)
+        rows = q.all()
+
+    coordinator = ShardCoordinator.instance() if sharded else None
+    owned = set(coordinator.owned_shards()) if coordinator else None
 
-        return {
-            ticker.upper(): {"company_id": company_id, "cik": cik}
-            for ticker, company_id, cik in q.all()
-            if cik
-        }
+    return {
+        ticker.upper(): {"company_id": company_id, "cik": cik}
+        for ticker, company_id, cik in rows
+        if cik and (owned is None or shard_of(ticker, coordinator.shard_count) in owned)
+    }
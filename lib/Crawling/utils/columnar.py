@@ -0,0 +1,188 @@
+import datetime
+import glob
+import os
+import threading
+from uuid import uuid4
+
+import orjson
+import pandas as pd
+
+from lib.Config.config import Config
+from lib.Logger.logger import get_logger
+
+FILE_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
+def _import_pyarrow():
+    """pyarrow는 컬럼 저장 방식을 쓸 때만 필요하므로 지연 import"""
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    return pa, pq, feather
+
+
+class ColumnarStore:
+    """크롤링 결과를 태그/날짜로 파티션된 Parquet 또는 Arrow IPC 파일로 저장
+
+    Datas/<tag>/date=YYYY-MM-DD/part-<시각>-<id>.<ext> 형태로 추가 기록하고,
+    파티션의 part 파일 수가 compact_threshold 이상이 되면 하나로 병합한다.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        base_dir: str,
+        file_format: str = "parquet",
+        compression: str = "zstd",
+        compact_threshold: int = 32,
+    ):
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f"지원하지 않는 파일 형식: {file_format}")
+
+        self.base_dir = base_dir
+        self.file_format = file_format
+        self.extension = FILE_FORMATS[file_format]
+        self.compression = compression
+        self.compact_threshold = compact_threshold
+        self.logger = get_logger("ColumnarStore")
+        self._lock = threading.Lock()
+        self.pa, self.pq, self.feather = _import_pyarrow()
+
+    @classmethod
+    def instance(cls, base_dir: str) -> "ColumnarStore":
+        """save_method 설정으로 프로세스 공용 저장소 생성"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    options = Config.get("save_method", {}) or {}
+                    cls._instance = cls(
+                        base_dir,
+                        file_format=options.get("file_format", "parquet"),
+                        compression=options.get("compression", "zstd"),
+                        compact_threshold=options.get("compact_threshold", 32),
+                    )
+        return cls._instance
+
+    # ── 쓰기 ────────────────────────────────────────────────────────────
+    def write(self, result: list[dict]) -> list[str]:
+        """결과의 df 행을 태그/날짜 파티션별로 기록
+
+        Returns:
+            list[str]: 새로 기록된 파일 경로 목록.
+        """
+        frames_by_tag: dict[str, list[pd.DataFrame]] = {}
+        rows_by_tag: dict[str, list[dict]] = {}
+        for item in result:
+            rows = item.get("df")
+            tag = item.get("tag", "unknown")
+            if isinstance(rows, pd.DataFrame):
+                if not rows.empty:
+                    frames_by_tag.setdefault(tag, []).append(rows)
+            elif rows:
+                rows_by_tag.setdefault(tag, []).extend(rows)
+
+        for tag, rows in rows_by_tag.items():
+            frames_by_tag.setdefault(tag, []).append(pd.DataFrame(rows))
+
+        written = []
+        for tag, frames in frames_by_tag.items():
+            df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+            for date, part in df.groupby(self._partition_dates(df), sort=False):
+                partition = os.path.join(self.base_dir, tag, f"date={date}")
+                written.append(self._write_part(partition, part))
+                self._maybe_compact(partition)
+        return written
+
+    def _partition_dates(self, df: pd.DataFrame) -> pd.Series:
+        """posted_at 기준 파티션 날짜 (없으면 저장 일자)"""
+        today = datetime.date.today().isoformat()
+        if "posted_at" not in df.columns:
+            return pd.Series(today, index=df.index)
+
+        try:
+            posted = pd.to_datetime(df["posted_at"], errors="coerce")
+        except (TypeError, ValueError):  # 시간대가 섞인 경우
+            posted = pd.to_datetime(df["posted_at"], errors="coerce", utc=True)
+        return posted.dt.strftime("%Y-%m-%d").fillna(today)
+
+    def _to_table(self, df: pd.DataFrame):
+        """DataFrame → Arrow 테이블 (타입 추론이 안 되는 컬럼은 JSON 문자열로 저장)"""
+        pa = self.pa
+        columns = {}
+        for name in df.columns:
+            values = df[name]
+            try:
+                columns[str(name)] = pa.array(values, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                columns[str(name)] = pa.array(
+                    [
+                        None if v is None else orjson.dumps(v, default=str).decode()
+                        for v in values
+                    ],
+                    type=pa.string(),
+                )
+        return pa.table(columns)
+
+    def _write_part(self, partition: str, df: pd.DataFrame) -> str:
+        os.makedirs(partition, exist_ok=True)
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(
+            partition, f"part-{timestamp}-{uuid4().hex[:8]}{self.extension}"
+        )
+        self._write_table(self._to_table(df.reset_index(drop=True)), path)
+        return path
+
+    def _write_table(self, table, path: str):
+        # 기록 중 종료되어도 읽기 쪽에 반쪽 파일이 보이지 않도록 임시 파일 후 교체
+        temp_path = f"{path}.tmp"
+        if self.file_format == "parquet":
+            self.pq.write_table(table, temp_path, compression=self.compression)
+        else:
+            self.feather.write_feather(table, temp_path, compression=self.compression)
+        os.replace(temp_path, path)
+
+    def _read_table(self, path: str):
+        if self.file_format == "parquet":
+            return self.pq.read_table(path)
+        return self.feather.read_table(path)
+
+    # ── 병합 ────────────────────────────────────────────────────────────
+    def _maybe_compact(self, partition: str):
+        parts = glob.glob(os.path.join(partition, f"part-*{self.extension}"))
+        if len(parts) >= self.compact_threshold:
+            self.compact(partition)
+
+    def compact(self, partition: str) -> str | None:
+        """파티션의 파일들을 하나의 파일로 병합
+
+        Returns:
+            str | None: 병합된 파일 경로 (병합할 파일이 2개 미만이면 None).
+        """
+        with self._lock:
+            paths = sorted(glob.glob(os.path.join(partition, f"*{self.extension}")))
+            if len(paths) < 2:
+                return None
+
+            try:
+                table = self.pa.concat_tables(
+                    [self._read_table(p) for p in paths], promote_options="permissive"
+                )
+            except (self.pa.ArrowInvalid, self.pa.ArrowTypeError) as e:
+                self.logger.warning(
+                    f"파티션 병합 실패 (스키마 불일치) - {partition}: {e}"
+                )
+                return None
+
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            target = os.path.join(
+                partition, f"compact-{timestamp}-{uuid4().hex[:8]}{self.extension}"
+            )
+            self._write_table(table, target)
+            for path in paths:
+                os.remove(path)
+
+        self.logger.debug(f"파티션 병합 완료 - {partition}: {len(paths)}개 → 1개")
+        return target
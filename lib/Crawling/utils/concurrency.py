@@ -0,0 +1,67 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class AdaptiveLimiter:
+    """AIMD 방식의 동시 실행 수 제한
+
+    - 성공이 limit번 누적될 때마다 허용 동시 실행 수를 1 증가 (additive increase)
+    - 429/401 등 rate limit 응답 시 절반으로 감소 (multiplicative decrease)
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 16):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = max(minimum, min(initial, maximum))
+        self._active = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        """허용 동시 실행 수 이내가 될 때까지 대기 후 실행"""
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    def on_success(self):
+        with self._cond:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.maximum:
+                self.limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    def on_throttle(self) -> int:
+        """rate limit 감지 시 동시 실행 수 감소
+
+        Returns:
+            int: 감소 후 허용 동시 실행 수.
+        """
+        with self._cond:
+            self.limit = max(self.minimum, self.limit // 2)
+            self._successes = 0
+            return self.limit
+
+
+def is_throttled(exc: Exception) -> bool:
+    """rate limit(429) 또는 인증 만료(401, crumb) 응답인지 판별"""
+    if type(exc).__name__ == "YFRateLimitError":
+        return True
+    message = str(exc)
+    return any(
+        token in message
+        for token in ("429", "Too Many Requests", "401", "Unauthorized", "Crumb")
+    )
+
+
+def backoff_sleep(attempt: int, base: float = 1.0, cap: float = 30.0):
+    time.sleep(min(cap, base * 2**attempt))
@@ -0,0 +1,372 @@
+import hashlib
+import http.client
+import io
+import os
+import struct
+import threading
+import time
+import urllib.request
+import zlib
+from datetime import timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from urllib.response import addinfourl
+
+import orjson
+import zstandard as zstd
+
+from lib.Config.config import Config
+from lib.Logger.logger import get_logger
+
+# 레코드: length(4) | crc32(4) | zstd(meta_length(4) | orjson(meta) | body)
+RECORD_HEADER = struct.Struct("!II")
+META_HEADER = struct.Struct("!I")
+MODES = ("record", "replay")
+# 본문은 디코딩된 상태로 저장하므로 전송 관련 헤더는 기록하지 않음
+SKIP_HEADERS = {"content-encoding", "transfer-encoding", "content-length"}
+# 인증 정보 query 파라미터 (설정과 관계없이 요청 구분에서 빼고 파일에도 기록하지 않음)
+CREDENTIAL_PARAMS = ("api_key", "apikey", "access_token", "token")
+DEFAULT_IGNORE_PARAMS = ("crumb",) + CREDENTIAL_PARAMS
+
+
+class ArchiveMiss(LookupError):
+    """replay 모드에서 기록되지 않은 요청"""
+
+
+def request_url(url: str, params=None) -> str:
+    """params를 query에 합친 요청 URL"""
+    if not params:
+        return url
+    items = params.items() if isinstance(params, dict) else params
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    query.extend((k, str(v)) for k, v in items if v is not None)
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def body_digest(body) -> str:
+    """요청 본문(data/json) 해시 (본문 없으면 빈 문자열)"""
+    if body is None or body == b"" or body == "":
+        return ""
+    if isinstance(body, str):
+        body = body.encode()
+    elif not isinstance(body, bytes):
+        body = orjson.dumps(body, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.sha1(body).hexdigest()[:16]
+
+
+class ArchivedResponse:
+    """기록된 응답 1건 (세션 종류에 맞는 응답 객체로 변환)"""
+
+    __slots__ = ("url", "status", "reason", "headers", "body", "elapsed")
+
+    def __init__(self, url, status, reason, headers, body, elapsed):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+        self.elapsed = elapsed
+
+    @classmethod
+    def from_response(cls, response, elapsed: float) -> "ArchivedResponse":
+        """requests / curl_cffi 응답에서 생성"""
+        return cls(
+            str(response.url),
+            response.status_code,
+            response.reason or "",
+            [
+                (k, v)
+                for k, v in response.headers.items()
+                if k.lower() not in SKIP_HEADERS
+            ],
+            response.content or b"",
+            elapsed,
+        )
+
+    def to_requests(self):
+        import requests
+        from requests.structures import CaseInsensitiveDict
+        from requests.utils import get_encoding_from_headers
+
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status
+        response.reason = self.reason
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.elapsed = timedelta(seconds=self.elapsed)
+        response._content = self.body
+        return response
+
+    def to_curl(self):
+        from curl_cffi.requests import Headers, Response
+
+        response = Response()
+        response.url = self.url
+        response.status_code = self.status
+        response.reason = self.reason
+        response.ok = self.status < 400
+        response.headers = Headers(self.headers)
+        response.elapsed = self.elapsed
+        response.content = self.body
+        return response
+
+    def to_urllib(self):
+        headers = http.client.HTTPMessage()
+        for k, v in self.headers:
+            headers[k] = v
+        response = addinfourl(io.BytesIO(self.body), headers, self.url, self.status)
+        response.msg = self.reason  # HTTPErrorProcessor가 참조
+        return response
+
+
+class HttpArchive:
+    """HTTP 요청 → 응답 기록/재생 저장소
+
+    - record: 실제 요청 후 응답을 zstd 압축 레코드로 파일 끝에 추가
+    - replay: 기록된 응답만 반환 (네트워크 접근 없음, 미기록 요청은 ArchiveMiss)
+      같은 요청이 여러 번 기록되었으면 기록 순서대로 돌아가며 반환하고,
+      speed > 0이면 기록 당시 응답 시간 / speed 만큼 대기한다 (0은 대기 없음)
+
+    요청은 method + URL(query 정렬, ignore_params 제외) + 본문 해시로 구분한다.
+    ignore_params(api_key 등 인증 정보 포함)는 파일에 기록하는 URL에서도 지운다.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        speed: float = 0.0,
+        ignore_params=DEFAULT_IGNORE_PARAMS,
+        sleep=time.sleep,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"지원하지 않는 http_archive 모드: {mode}")
+
+        self.path = path
+        self.mode = mode
+        self.speed = speed
+        self.ignore_params = set(ignore_params or ()) | set(CREDENTIAL_PARAMS)
+        self.logger = get_logger("HttpArchive")
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._file = None
+        self._cctx = zstd.ZstdCompressor(level=3)
+        self._entries: dict[str, list[ArchivedResponse]] = {}
+        self._cursor: dict[str, int] = {}
+
+        if mode == "replay":
+            loaded = self._load()
+            self.logger.info(f"HTTP 재생 모드 - {loaded}건 로드 ({path})")
+
+    @classmethod
+    def instance(cls) -> "HttpArchive | None":
+        """http_archive 설정이 켜져 있으면 프로세스 공용 저장소 반환
+
+        최초 생성 시 urllib 전역 opener에 기록/재생 핸들러를 설치한다 (fredapi용).
+        """
+        options = Config.get("http_archive", {}) or {}
+        if str(options.get("mode") or "off") == "off":  # YAML의 off는 False로 읽힘
+            return None
+
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    archive = cls(
+                        options.get("path", "cache/http_archive.bin"),
+                        mode=options["mode"],
+                        speed=options.get("speed", 0.0),
+                        ignore_params=options.get(
+                            "ignore_params", DEFAULT_IGNORE_PARAMS
+                        ),
+                    )
+                    urllib.request.install_opener(
+                        urllib.request.build_opener(ArchiveHandler(archive))
+                    )
+                    cls._instance = archive
+        return cls._instance
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def key(self, method: str, url: str, digest: str = "") -> str:
+        target = self.strip_params(url, sort=True)
+        return f"{method.upper()} {target} {digest}".rstrip()
+
+    def strip_params(self, url: str, sort: bool = False) -> str:
+        """ignore_params를 뺀 URL (sort=True면 query 정렬 및 fragment 제거)"""
+        parts = urlsplit(url)
+        query = [
+            (k, v)
+            for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if k not in self.ignore_params
+        ]
+        if sort:
+            query.sort()
+            parts = parts._replace(fragment="")
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    # ── 기록 ────────────────────────────────────────────────────────────
+    def record(self, method: str, url: str, digest: str, entry: ArchivedResponse):
+        meta = orjson.dumps(
+            {
+                "method": method.upper(),
+                "request_url": self.strip_params(url),
+                "digest": digest,
+                "url": self.strip_params(entry.url),
+                "status": entry.status,
+                "reason": entry.reason,
+                "headers": entry.headers,
+                "elapsed": round(entry.elapsed, 6),
+            }
+        )
+        record = self._cctx.compress(META_HEADER.pack(len(meta)) + meta + entry.body)
+        with self._lock:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._file = open(self.path, "ab")
+            self._file.write(RECORD_HEADER.pack(len(record), zlib.crc32(record)))
+            self._file.write(record)
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # ── 재생 ────────────────────────────────────────────────────────────
+    def _load(self) -> int:
+        if not os.path.exists(self.path):
+            return 0
+
+        dctx = zstd.ZstdDecompressor()
+        with open(self.path, "rb") as f:
+            data = f.read()
+
+        count = 0
+        offset = 0
+        while offset + RECORD_HEADER.size <= len(data):
+            length, crc = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            record = data[start : start + length]
+            if len(record) < length or zlib.crc32(record) != crc:
+                break  # 기록 중 종료된 마지막 레코드
+            offset = start + length
+
+            payload = dctx.decompress(record)
+            (meta_length,) = META_HEADER.unpack_from(payload)
+            meta_end = META_HEADER.size + meta_length
+            meta = orjson.loads(payload[META_HEADER.size : meta_end])
+            key = self.key(meta["method"], meta["request_url"], meta["digest"])
+            self._entries.setdefault(key, []).append(
+                ArchivedResponse(
+                    meta["url"],
+                    meta["status"],
+                    meta["reason"],
+                    [tuple(h) for h in meta["headers"]],
+                    payload[meta_end:],
+                    meta["elapsed"],
+                )
+            )
+            count += 1
+        return count
+
+    def replay(self, method: str, url: str, digest: str = "") -> ArchivedResponse:
+        key = self.key(method, url, digest)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise ArchiveMiss(f"기록되지 않은 요청: {key}")
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = (index + 1) % len(entries)
+        entry = entries[index]
+
+        if self.speed > 0:
+            self._sleep(entry.elapsed / self.speed)
+        return entry
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+
+class ArchivedSessionMixin:
+    """Session.request를 http_archive 설정에 따라 기록/재생 (requests / curl_cffi 공용)
+
+    rate limit mixin보다 앞에 두어 재생 시에는 호스트별 대기 없이 응답하고,
+    기록되는 응답 시간에는 rate limit 대기가 포함된다 (speed 1.0 = 기록 당시 속도).
+    """
+
+    def request(self, method, url, *args, **kwargs):
+        archive = HttpArchive.instance()
+        if archive is None:
+            return super().request(method, url, *args, **kwargs)
+
+        target = request_url(str(url), kwargs.get("params"))
+        digest = body_digest(
+            kwargs.get("data") if kwargs.get("data") is not None else kwargs.get("json")
+        )
+        if archive.replaying:
+            return self._replay_response(archive.replay(method, target, digest))
+
+        started = time.perf_counter()
+        response = super().request(method, url, *args, **kwargs)
+        archive.record(
+            method,
+            target,
+            digest,
+            ArchivedResponse.from_response(response, time.perf_counter() - started),
+        )
+        return response
+
+    def _replay_response(self, entry: ArchivedResponse):
+        return entry.to_requests()
+
+
+class ArchiveHandler(urllib.request.BaseHandler):
+    """urllib(urlopen) 요청 기록/재생 핸들러 (fredapi가 사용)"""
+
+    handler_order = 100  # 기본 http/https 핸들러보다 먼저 호출
+
+    def __init__(self, archive: HttpArchive):
+        self.archive = archive
+
+    def _request_info(self, req) -> tuple[str, str, str]:
+        return req.get_method(), req.full_url, body_digest(req.data)
+
+    def http_request(self, req):
+        req.archive_started = time.perf_counter()
+        return req
+
+    def http_open(self, req):
+        if not self.archive.replaying:
+            return None  # 실제 요청은 기본 핸들러가 처리
+        return self.archive.replay(*self._request_info(req)).to_urllib()
+
+    def http_response(self, req, response):
+        if self.archive.replaying:
+            return response
+
+        body = response.read()
+        entry = ArchivedResponse(
+            response.geturl(),
+            response.code,
+            getattr(response, "msg", "") or "",
+            [
+                (k, v)
+                for k, v in response.headers.items()
+                if k.lower() not in SKIP_HEADERS
+            ],
+            body,
+            time.perf_counter() - getattr(req, "archive_started", time.perf_counter()),
+        )
+        self.archive.record(*self._request_info(req), entry)
+        return entry.to_urllib()  # 읽은 본문을 호출자가 다시 읽을 수 있도록 교체
+
+    https_request = http_request
+    https_open = http_open
+    https_response = http_response
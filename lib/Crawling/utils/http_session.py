@@ -0,0 +1,54 @@
+import threading
+
+import cloudscraper
+import requests
+from curl_cffi import requests as curl_requests
+
+from lib.Crawling.utils.http_archive import ArchivedSessionMixin
+from lib.Crawling.utils.rate_limit import RateLimitedSessionMixin
+
+_local = threading.local()
+
+
+class RateLimitedCurlSession(
+    ArchivedSessionMixin, RateLimitedSessionMixin, curl_requests.Session
+):
+    """호스트별 rate limit이 적용된 curl_cffi 세션"""
+
+    def _replay_response(self, entry):
+        return entry.to_curl()
+
+
+class RateLimitedRequestsSession(
+    ArchivedSessionMixin, RateLimitedSessionMixin, requests.Session
+):
+    """호스트별 rate limit이 적용된 requests 세션"""
+
+
+class RateLimitedScraper(
+    ArchivedSessionMixin, RateLimitedSessionMixin, cloudscraper.CloudScraper
+):
+    """호스트별 rate limit이 적용된 cloudscraper 세션 (Cloudflare 우회)"""
+
+
+def get_yf_session(impersonate: str = "chrome") -> curl_requests.Session:
+    """yfinance용 브라우저 위장 curl_cffi 세션
+
+    curl_cffi 세션은 스레드 간 공유가 안전하지 않으므로 스레드마다 하나씩 만들고,
+    같은 스레드에서는 계속 재사용해 연결(keep-alive)과 쿠키/crumb을 유지한다.
+    요청 속도는 모든 스레드가 공유하는 호스트별 rate limiter로 조절된다.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = RateLimitedCurlSession(impersonate=impersonate)
+        _local.session = session
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """HTML 페이지 수집용 requests 세션 (스레드별 재사용, 호스트별 rate limit 적용)"""
+    session = getattr(_local, "http_session", None)
+    if session is None:
+        session = RateLimitedRequestsSession()
+        _local.http_session = session
+    return session
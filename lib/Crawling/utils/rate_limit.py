@@ -0,0 +1,181 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+from lib.Config.config import Config
+from lib.Logger.logger import get_logger
+from lib.Metrics.registry import MetricsRegistry
+
+# rate를 줄이는 응답 코드 (5xx는 별도 판정)
+THROTTLE_STATUSES = {401, 429}
+
+
+def is_throttle_status(status_code: int | None) -> bool:
+    return status_code in THROTTLE_STATUSES or (status_code or 0) >= 500
+
+
+class HostRateLimiter:
+    """호스트 하나에 대한 토큰 버킷 (초당 요청 수를 AIMD로 조정)
+
+    - 요청마다 토큰 1개를 예약하고, 부족하면 채워질 때까지 대기
+    - 성공 응답마다 rate += increase (additive increase)
+    - 429/401/5xx 응답 시 rate *= decrease, 남은 토큰 폐기 (multiplicative decrease)
+      동시에 돌아온 실패 응답들로 연속 감소하지 않도록 cooldown 동안은 한 번만 감소
+    """
+
+    def __init__(
+        self,
+        host: str,
+        rate: float = 5.0,
+        burst: float = 10.0,
+        min_rate: float = 0.2,
+        max_rate: float | None = None,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.host = host
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate * 4
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = burst
+        self._updated = clock()
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """토큰 1개 예약 후 필요한 만큼 대기
+
+        Returns:
+            float: 대기한 시간 (초).
+        """
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def on_response(self, status_code: int | None):
+        if is_throttle_status(status_code):
+            self.on_throttle()
+        else:
+            self.on_success()
+
+    def on_success(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self) -> float:
+        """차단/과부하 응답 시 rate 감소
+
+        Returns:
+            float: 감소 후 rate.
+        """
+        with self._lock:
+            now = self._clock()
+            if now - self._last_decrease >= self.cooldown:
+                self._refill(now)
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self._tokens = min(self._tokens, 0.0)
+                self._last_decrease = now
+            return self.rate
+
+
+class RateLimiterRegistry:
+    """호스트별 HostRateLimiter를 프로세스 전체에서 공유
+
+    rate_limit.hosts에 설정된 호스트는 해당 값, 나머지는 rate_limit.default 값으로 생성한다.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, options: dict | None = None):
+        options = options or {}
+        self.enabled = options.get("enabled", True)
+        self.default = options.get("default", {}) or {}
+        self.hosts = options.get("hosts", {}) or {}
+        self._limiters: dict[str, HostRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "RateLimiterRegistry":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(Config.get("rate_limit", {}) or {})
+        return cls._instance
+
+    def for_host(self, host: str | None) -> HostRateLimiter | None:
+        if not self.enabled or not host:
+            return None
+
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(host)
+                if limiter is None:
+                    params = {**self.default, **(self.hosts.get(host) or {})}
+                    limiter = HostRateLimiter(host, **params)
+                    self._limiters[host] = limiter
+        return limiter
+
+    def for_url(self, url: str) -> HostRateLimiter | None:
+        return self.for_host(urlsplit(url).hostname)
+
+
+class RateLimitedSessionMixin:
+    """Session.request 앞뒤로 호스트별 rate limit 적용 (requests / curl_cffi 공용)"""
+
+    def request(self, method, url, *args, **kwargs):
+        host = urlsplit(str(url)).hostname or ""
+        limiter = RateLimiterRegistry.instance().for_host(host)
+        metrics = MetricsRegistry.instance()
+
+        if limiter is not None:
+            waited = limiter.acquire()
+            metrics.observe("crawler_rate_limit_wait_seconds", waited, host=host)
+
+        started = time.perf_counter()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except Exception as e:
+            status_code = getattr(getattr(e, "response", None), "status_code", None)
+            metrics.inc("crawler_fetch_total", host=host, status=status_code or "error")
+            if limiter is not None and is_throttle_status(status_code):
+                self._on_throttle(limiter, status_code)
+            raise
+        finally:
+            metrics.observe(
+                "crawler_fetch_seconds", time.perf_counter() - started, host=host
+            )
+
+        metrics.inc("crawler_fetch_total", host=host, status=response.status_code)
+        if limiter is None:
+            return response
+        if is_throttle_status(response.status_code):
+            self._on_throttle(limiter, response.status_code)
+        else:
+            limiter.on_success()
+        return response
+
+    @staticmethod
+    def _on_throttle(limiter: HostRateLimiter, status_code: int):
+        rate = limiter.on_throttle()
+        get_logger("RateLimiter").debug(
+            f"{limiter.host} {status_code} 응답 → 초당 {rate:.2f}건으로 감소"
+        )
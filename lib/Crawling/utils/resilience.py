@@ -0,0 +1,150 @@
+import threading
+import time
+
+from lib.Config.config import Config
+from lib.Logger.logger import get_logger
+
+
+class CircuitOpenError(Exception):
+    """circuit이 열려 있어 요청을 보내지 않고 즉시 실패"""
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(f"{host} circuit open ({retry_after:.0f}초 후 재시도 가능)")
+        self.host = host
+        self.retry_after = retry_after
+
+
+class RetryBudgetExceeded(Exception):
+    """크롤링 주기의 재시도 예산 소진"""
+
+
+class RetryDeadlineExceeded(Exception):
+    """재시도 대기 후 다음 실행 시각을 넘기게 되어 재시도 중단"""
+
+
+class CircuitBreaker:
+    """호스트별 circuit breaker (closed → open → half-open)
+
+    - closed: 연속 실패가 failure_threshold에 도달하면 open
+    - open: reset_timeout 동안 요청 없이 즉시 CircuitOpenError
+    - half-open: reset_timeout 경과 후 시험 요청 1건만 허용,
+      성공하면 closed, 실패하면 다시 open
+      (before_call 후에는 결과와 관계없이 record_success / record_failure 중 하나를 호출해야 함)
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0,
+        clock=time.monotonic,
+    ):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._clock = clock
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """요청 전 호출, 허용되지 않으면 CircuitOpenError"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+
+            elapsed = self._clock() - self._opened_at
+            if self.state == self.OPEN and elapsed >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probing = False
+
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True  # 시험 요청 1건만 통과
+                return
+
+            raise CircuitOpenError(self.host, max(0.0, self.reset_timeout - elapsed))
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    get_logger("CircuitBreaker").warning(
+                        f"{self.host} 연속 실패 {self._failures}회 → "
+                        f"{self.reset_timeout:.0f}초간 요청 차단"
+                    )
+                self.state = self.OPEN
+                self._opened_at = self._clock()
+                self._probing = False
+
+
+class CircuitBreakerRegistry:
+    """호스트별 CircuitBreaker를 프로세스 전체에서 공유 (resilience.circuit_breaker 설정)"""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, options: dict | None = None):
+        options = options or {}
+        self.enabled = options.get("enabled", True)
+        self.failure_threshold = options.get("failure_threshold", 5)
+        self.reset_timeout = options.get("reset_timeout", 60)
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "CircuitBreakerRegistry":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(
+                        Config.get("resilience.circuit_breaker", {}) or {}
+                    )
+        return cls._instance
+
+    def for_host(self, host: str | None) -> CircuitBreaker | None:
+        if not self.enabled or not host:
+            return None
+
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    host,
+                    CircuitBreaker(host, self.failure_threshold, self.reset_timeout),
+                )
+        return breaker
+
+
+class RetryBudget:
+    """크롤링 주기 하나에서 허용되는 전체 재시도 횟수 (스레드 간 공유)"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> "RetryBudget":
+        return cls(Config.get("resilience.retry_budget", 200))
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.used >= self.limit:
+                return False
+            self.used += 1
+            return True
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.limit - self.used)
@@ -2,6 +2,20 @@ import time, random
 from typing import Callable, Optional
 from logging import Logger as BaseLogger
 from lib.Logger.logger import get_logger
+from lib.Crawling.utils.resilience import (
+    CircuitBreaker,
+    RetryBudget,
+    RetryBudgetExceeded,
+    RetryDeadlineExceeded,
+)
+
+
+def _is_host_failure(e: Exception) -> bool:
+    """호스트 장애로 볼 예외인지 판별 (429를 제외한 4xx는 요청 자체의 문제)"""
+    status_code = getattr(getattr(e, "response", None), "status_code", None)
+    if status_code is None:
+        return True
+    return status_code == 429 or status_code >= 500
 
 
 def retry_with_exponential_backoff(
@@ -12,31 +26,62 @@ def retry_with_exponential_backoff(
     class_name=None,
     logger: Optional[BaseLogger] = None,
     *args,
+    circuit: Optional[CircuitBreaker] = None,
+    retry_budget: Optional[RetryBudget] = None,
+    deadline: Optional[float] = None,
     **kwargs,
 ):
     """
     - 예외가 발생하면: delay = min(base_delay * 2**attempt, max_delay) + 지터
     - 지터(jitter)는 0.0 ~ 0.5초 사이 난수
     - 마지막 재시도까지 실패하면 예외 그대로 raise
+    - circuit: 호스트 circuit이 열려 있으면 요청 없이 즉시 CircuitOpenError
+    - retry_budget: 크롤링 주기 전체 재시도 예산, 소진 시 RetryBudgetExceeded
+    - deadline: 다음 실행 시각 (epoch 초), 대기 후 이를 넘기면 RetryDeadlineExceeded
     """
     if logger is None:
         name = class_name or func.__name__
         logger = get_logger(name)
 
     for attempt in range(max_retries):
+        if circuit:
+            circuit.before_call()
+
         try:
-            return func(*args, **kwargs)
+            result = func(*args, **kwargs)
 
         except Exception as e:
+            if circuit:
+                # 4xx 등 요청 자체의 실패도 호스트는 응답한 것이므로 성공으로 기록
+                # (half-open 시험 요청이 기록되지 않아 circuit이 계속 열린 채 남는 것 방지)
+                if _is_host_failure(e):
+                    circuit.record_failure()
+                else:
+                    circuit.record_success()
+
             if attempt == max_retries - 1:  # 마지막 재시도도 실패 → 그대로 전달
                 raise
 
             delay = min(base_delay * (2**attempt), max_delay)
             delay += random.uniform(0, 0.5)  # 작은 지터로 충돌 완화
 
+            if deadline is not None and time.time() + delay >= deadline:
+                raise RetryDeadlineExceeded(
+                    f"다음 실행 시각 전 재시도 불가 → {type(e).__name__}: {e}"
+                ) from e
+            if retry_budget is not None and not retry_budget.try_spend():
+                raise RetryBudgetExceeded(
+                    f"재시도 예산 소진 ({retry_budget.limit}회) → {type(e).__name__}: {e}"
+                ) from e
+
             if logger:
                 logger.debug(
                     f"{delay:.1f}s 대기 후 재시도 [{attempt + 1}/{max_retries}]"
                 )
 
             time.sleep(delay)
+
+        else:
+            if circuit:
+                circuit.record_success()
+            return result
@@ -0,0 +1,221 @@
+import math
+import os
+import socket
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+
+from lib.Config.config import Config
+from lib.Logger.logger import get_logger
+
+
+def shard_of(ticker: str, shard_count: int) -> int:
+    """ticker가 속한 shard 번호 (프로세스/노드와 무관하게 항상 같은 값)"""
+    return zlib.crc32(ticker.upper().encode()) % shard_count
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ShardCoordinator:
+    """종목 universe를 shard_count개로 나누어 이 노드가 맡을 shard를 결정
+
+    - sharding.enabled가 false면 전체 종목 담당 (owned_shards → None)
+    - lease.enabled가 false면 shard_index 하나만 고정 담당
+    - lease 모드에서는 shard_leases 테이블로 shard를 점유하고,
+      heartbeat 스레드가 ttl/3마다 lease 갱신 및 재분배를 수행한다.
+      노드가 죽어 lease가 만료되면 남은 노드들이 shard를 나누어 인수하고,
+      새 노드가 들어오면 기존 노드가 몫(ceil(shard 수 / 노드 수))을 넘는 shard를 반납한다.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        shard_count: int = 1,
+        shard_index: int | None = 0,
+        lease: bool = False,
+        ttl: int = 300,
+        node_id: str = "",
+    ):
+        if shard_count < 1:
+            raise ValueError(f"shard_count는 1 이상이어야 함: {shard_count}")
+
+        self.shard_count = shard_count
+        self.shard_index = shard_index
+        self.lease = lease
+        self.ttl = ttl
+        self.node_id = node_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.logger = get_logger("ShardCoordinator")
+
+        self._owned: list[int] | None = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @classmethod
+    def instance(cls) -> "ShardCoordinator | None":
+        """sharding 설정으로 프로세스 공용 coordinator 생성 (비활성화 시 None)"""
+        options = Config.get("sharding", {}) or {}
+        if not options.get("enabled", False):
+            return None
+
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    lease = options.get("lease", {}) or {}
+                    cls._instance = cls(
+                        shard_count=options.get("shard_count", 1),
+                        shard_index=options.get("shard_index", 0),
+                        lease=lease.get("enabled", False),
+                        ttl=lease.get("ttl", 300),
+                        node_id=lease.get("node_id", ""),
+                    )
+        return cls._instance
+
+    # ── 담당 shard ──────────────────────────────────────────────────────
+    def owned_shards(self) -> list[int]:
+        """이 노드가 담당하는 shard 번호 목록"""
+        if not self.lease:
+            return [self.shard_index]
+
+        if self._owned is None:
+            self.acquire()
+            self._start_heartbeat()
+        return list(self._owned)
+
+    # ── lease ───────────────────────────────────────────────────────────
+    def acquire(self, now: datetime | None = None) -> list[int]:
+        """lease 갱신/반납/획득을 한 번 수행하고 담당 shard 목록 반환
+
+        획득은 조건부 UPDATE(빈 shard이거나 만료된 경우에만)로 처리해
+        여러 노드가 동시에 같은 shard를 가져가지 않는다.
+        """
+        from sqlalchemy import and_, or_, select, update
+
+        from lib.Distributor.secretary.models.core import CrawlerNode, ShardLease
+        from lib.Distributor.secretary.session import get_session
+
+        now = now or _utcnow()
+        expires_at = now + timedelta(seconds=self.ttl)
+        me = self.node_id
+
+        with self._lock, get_session() as db:
+            self._ensure_rows(db, ShardLease)
+            alive = self._heartbeat_node(db, CrawlerNode, now, expires_at)
+            rows = db.execute(
+                select(ShardLease.shard_index, ShardLease.owner, ShardLease.expires_at)
+                .where(ShardLease.shard_index < self.shard_count)
+                .order_by(ShardLease.shard_index)
+            ).all()
+
+            fair_share = math.ceil(self.shard_count / len(alive))
+
+            held = [i for i, owner, _ in rows if owner == me]
+            free = [
+                i
+                for i, owner, exp in rows
+                if owner != me and (owner is None or exp is None or exp <= now)
+            ]
+            # 고정 배정된 shard_index를 우선 유지/획득
+            preferred = self.shard_index
+            held.sort(key=lambda i: (i == preferred, -i))
+            free.sort(key=lambda i: i != preferred)
+
+            # 몫을 넘는 shard 반납 (다른 노드가 인수)
+            while len(held) > fair_share:
+                released = held.pop(0)
+                db.execute(
+                    update(ShardLease)
+                    .where(ShardLease.shard_index == released, ShardLease.owner == me)
+                    .values(owner=None, expires_at=None)
+                )
+
+            for index in free:
+                if len(held) >= fair_share:
+                    break
+                claimed = db.execute(
+                    update(ShardLease)
+                    .where(
+                        ShardLease.shard_index == index,
+                        or_(
+                            ShardLease.owner.is_(None),
+                            ShardLease.expires_at.is_(None),
+                            ShardLease.expires_at <= now,
+                        ),
+                    )
+                    .values(owner=me, expires_at=expires_at)
+                ).rowcount
+                if claimed:
+                    held.append(index)
+
+            if held:
+                db.execute(
+                    update(ShardLease)
+                    .where(
+                        and_(ShardLease.shard_index.in_(held), ShardLease.owner == me)
+                    )
+                    .values(expires_at=expires_at)
+                )
+            db.commit()
+
+        owned = sorted(held)
+        if owned != self._owned:
+            self.logger.info(
+                f"담당 shard 변경 → {owned} / {self.shard_count} (노드 {len(alive)}개)"
+            )
+        self._owned = owned
+        return owned
+
+    def _ensure_rows(self, db, model):
+        """shard_count만큼 lease 행 생성 (다른 노드가 먼저 만든 행은 무시)"""
+        from sqlalchemy import select
+        from sqlalchemy.exc import IntegrityError
+
+        existing = set(db.execute(select(model.shard_index)).scalars())
+        for index in range(self.shard_count):
+            if index in existing:
+                continue
+            try:
+                with db.begin_nested():
+                    db.add(model(shard_index=index))
+            except IntegrityError:
+                pass
+
+    def _heartbeat_node(self, db, model, now: datetime, expires_at: datetime) -> set:
+        """노드 생존 기록 갱신 후 살아 있는 노드 목록 반환 (shard가 없는 노드 포함)"""
+        from sqlalchemy import delete, select, update
+        from sqlalchemy.exc import IntegrityError
+
+        updated = db.execute(
+            update(model)
+            .where(model.node_id == self.node_id)
+            .values(expires_at=expires_at)
+        ).rowcount
+        if not updated:
+            try:
+                with db.begin_nested():
+                    db.add(model(node_id=self.node_id, expires_at=expires_at))
+            except IntegrityError:
+                pass
+
+        db.execute(delete(model).where(model.expires_at <= now))
+        return set(db.execute(select(model.node_id)).scalars()) | {self.node_id}
+
+    def _start_heartbeat(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._heartbeat, name="ShardLease", daemon=True
+            )
+            self._thread.start()
+
+    def _heartbeat(self):
+        interval = max(self.ttl / 3, 1)
+        while True:
+            time.sleep(interval)
+            try:
+                self.acquire()
+            except Exception as e:
+                self.logger.error(f"shard lease 갱신 실패 → {type(e).__name__}: {e}")
@@ -1,11 +1,22 @@
-import copy
-import yfinance as yf
+from typing import TYPE_CHECKING
+
 from sqlalchemy import text
 
 from lib.Distributor.notifier.Notifier import NotifierBase
-from lib.Distributor.socket.messages.request import news_item, news_requests_message
+from lib.Distributor.socket.messages.request import news_requests_message
+from lib.Distributor.socket.messages.builder import (
+    date_column,
+    float_column,
+    is_empty_section,
+    new_item,
+    transpose,
+)
 from lib.Distributor.secretary.session import get_session
 from lib.Crawling.config.MarketMap import MARKET_INDEX_TICKER
+from lib.Crawling.utils.concurrency import backoff_sleep
+
+if TYPE_CHECKING:  # 반환 타입 표기용 (실행 시에는 yf_with_backoff에서 로드)
+    import yfinance as yf
 
 
 class ArticleNotifier(NotifierBase):
@@ -17,7 +28,6 @@ class ArticleNotifier(NotifierBase):
 
     def _build_item(self, row):
         try:
-            item = copy.deepcopy(news_item)
             ticker = row.get("ticker")
             if not ticker:
                 self.logger.warning(f"ticker missing for {row.get('crawling_id')}")
@@ -34,33 +44,56 @@ class ArticleNotifier(NotifierBase):
             info = self._get_info(ticker)
 
             if (
-                not any(stock_history.values())
-                or not any(market_history.values())
-                or not any(income_statement.values())
-                or not any(info.values())
+                is_empty_section(stock_history)
+                or is_empty_section(market_history)
+                or is_empty_section(income_statement)
+                or is_empty_section(info)
             ):
                 return None
 
-            item["data"]["news_data"] = [content]
-            item["data"]["stock_history"] = stock_history
-            item["data"]["market_history"] = market_history
-            item["data"]["income_statement"] = income_statement
-            item["data"]["info"] = info
-
-            return item
+            return new_item(
+                "news",
+                news_data=[content],
+                stock_history=stock_history,
+                market_history=market_history,
+                income_statement=income_statement,
+                info=info,
+            )
 
         except Exception as e:
             self.logger.error(
                 f"예외 발생 → {e}: {row.get('ticker')}, {row.get('crawling_id')}"
             )
 
+    STOCK_FIELDS = (
+        "stock",
+        "Date",
+        "Open",
+        "Close",
+        "Adj Close",
+        "High",
+        "Low",
+        "Volume",
+        "Market Cap",
+    )
+    MARKET_FIELDS = (
+        "m_Symbol",
+        "Date",
+        "Open",
+        "Close",
+        "Adj Close",
+        "High",
+        "Low",
+        "Volume",
+    )
+
     def _get_stock_history(self, ticker: str) -> dict:
         try:
             with get_session() as session:
                 rows = session.execute(
                     text(
                         """
-                        SELECT * 
+                        SELECT posted_at, open, close, adj_close, high, low, volume, market_cap
                         FROM notifier_stock_vw 
                         WHERE ticker = :tag 
                         AND posted_at >= CURDATE() - INTERVAL 30 DAY
@@ -68,63 +101,27 @@ class ArticleNotifier(NotifierBase):
                         """
                     ),
                     {"tag": ticker},
-                )
-
-                result = {
-                    k: []
-                    for k in [
-                        "stock",
-                        "Date",
-                        "Open",
-                        "Close",
-                        "Adj Close",
-                        "High",
-                        "Low",
-                        "Volume",
-                        "Market Cap",
-                    ]
-                }
-
-                found = False
-                for r in rows:
-                    found = True
-                    result["stock"].append(ticker)
-                    result["Date"].append(
-                        r._mapping.get("posted_at").strftime("%Y-%m-%d")
-                        if r._mapping.get("posted_at")
-                        else ""
-                    )
-                    result["Open"].append(float(r._mapping.get("open") or 0))
-                    result["Close"].append(float(r._mapping.get("close") or 0))
-                    result["Adj Close"].append(float(r._mapping.get("adj_close") or 0))
-                    result["High"].append(float(r._mapping.get("high") or 0))
-                    result["Low"].append(float(r._mapping.get("low") or 0))
-                    result["Volume"].append(float(r._mapping.get("volume") or 0))
-                    result["Market Cap"].append(
-                        float(r._mapping.get("market_cap") or 0)
-                    )
+                ).all()
 
-                if not found:
-                    self.logger.debug(f"no data for {ticker}")
+            if not rows:
+                self.logger.debug(f"no data for {ticker}")
 
-                return result
+            posted_at, o, c, adj, h, l, v, cap = transpose(rows, 8)
+            return {
+                "stock": [ticker] * len(rows),
+                "Date": date_column(posted_at),
+                "Open": float_column(o, fill=0.0),
+                "Close": float_column(c, fill=0.0),
+                "Adj Close": float_column(adj, fill=0.0),
+                "High": float_column(h, fill=0.0),
+                "Low": float_column(l, fill=0.0),
+                "Volume": float_column(v, fill=0.0),
+                "Market Cap": float_column(cap, fill=0.0),
+            }
 
         except Exception as e:
             self.logger.error(f"예외 발생 {ticker}: {e}")
-            return {
-                k: []
-                for k in [
-                    "stock",
-                    "Date",
-                    "Open",
-                    "Close",
-                    "Adj Close",
-                    "High",
-                    "Low",
-                    "Volume",
-                    "Market Cap",
-                ]
-            }
+            return {k: [] for k in self.STOCK_FIELDS}
 
     def _get_market_history(self, ticker: str) -> dict:
         try:
@@ -134,61 +131,33 @@ class ArticleNotifier(NotifierBase):
 
             if not exchange:
                 self.logger.warning(f"Index symbol not found for {ticker}")
-                return {
-                    k: []
-                    for k in [
-                        "m_Symbol",
-                        "Date",
-                        "Open",
-                        "Close",
-                        "Adj Close",
-                        "High",
-                        "Low",
-                        "Volume",
-                    ]
-                }
+                return {k: [] for k in self.MARKET_FIELDS}
 
             with get_session() as session:
                 rows = session.execute(
                     text(
-                        "SELECT * FROM notifier_market_vw WHERE symbol = :tag ORDER BY date"
+                        """
+                        SELECT date, open, close, adj_close, high, low, volume
+                        FROM notifier_market_vw WHERE symbol = :tag ORDER BY date
+                        """
                     ),
                     {"tag": exchange},
-                )
+                ).all()
 
-                result = {
-                    k: []
-                    for k in [
-                        "m_Symbol",
-                        "Date",
-                        "Open",
-                        "Close",
-                        "Adj Close",
-                        "High",
-                        "Low",
-                        "Volume",
-                    ]
-                }
-                found = False
-
-                for r in rows:
-                    found = True
-                    r = r._mapping
-                    result["m_Symbol"].append(index_symbol)
-                    result["Date"].append(
-                        r.get("date").strftime("%Y-%m-%d") if r.get("date") else ""
-                    )
-                    result["Open"].append(float(r.get("open") or 0))
-                    result["Close"].append(float(r.get("close") or 0))
-                    result["Adj Close"].append(float(r.get("adj_close") or 0))
-                    result["High"].append(float(r.get("high") or 0))
-                    result["Low"].append(float(r.get("low") or 0))
-                    result["Volume"].append(float(r.get("volume") or 0))
-
-                if not found:
-                    self.logger.debug(f"no data for {exchange}")
+            if not rows:
+                self.logger.debug(f"no data for {exchange}")
 
-                return result
+            dates, o, c, adj, h, l, v = transpose(rows, 7)
+            return {
+                "m_Symbol": [index_symbol] * len(rows),
+                "Date": date_column(dates),
+                "Open": float_column(o, fill=0.0),
+                "Close": float_column(c, fill=0.0),
+                "Adj Close": float_column(adj, fill=0.0),
+                "High": float_column(h, fill=0.0),
+                "Low": float_column(l, fill=0.0),
+                "Volume": float_column(v, fill=0.0),
+            }
 
         except Exception as e:
             self.logger.error(f"예외 발생 {ticker}: {e}")
@@ -238,18 +207,21 @@ class ArticleNotifier(NotifierBase):
             self.logger.error(f"예외 발생 {ticker}: {e}")
             return {}
 
-    def yf_with_backoff(self, ticker_str: str, max_retries: int = 4) -> yf.Ticker:
-        import time
+    def yf_with_backoff(self, ticker_str: str, max_retries: int = 4) -> "yf.Ticker":
+        # yfinance/curl_cffi는 분석할 기사가 있을 때만 로드
+        import yfinance as yf
+
+        from lib.Crawling.utils.http_session import get_yf_session
 
         for retry in range(max_retries + 1):
             try:
-                ticker = yf.Ticker(ticker_str)
+                ticker = yf.Ticker(ticker_str, session=get_yf_session())
                 _ = ticker.info
                 return ticker
             except Exception as e:
                 if "401" in str(e):
-                    wait = 5 + retry * 5
-                    time.sleep(wait)
+                    # 요청 속도는 호스트별 rate limiter가 이미 낮췄으므로 짧게 대기
+                    backoff_sleep(retry)
                 else:
                     raise
         raise RuntimeError(f"{ticker_str} 요청 실패 (최대 재시도 초과)")
@@ -1,10 +1,14 @@
-import copy
+import numpy as np
 from sqlalchemy import text
 
 from lib.Distributor.notifier.Notifier import NotifierBase
-from lib.Distributor.socket.messages.request import (
-    finance_item,
-    finance_requests_message,
+from lib.Distributor.socket.messages.request import finance_requests_message
+from lib.Distributor.socket.messages.builder import (
+    date_column,
+    float_column,
+    is_empty_section,
+    new_item,
+    transpose,
 )
 from lib.Distributor.secretary.session import get_session
 
@@ -18,87 +22,93 @@ class FinancialNotifier(NotifierBase):
 
     def _build_item(self, row):
         try:
-            item = copy.deepcopy(finance_item)
             ticker = row["ticker"]
 
-            recent_rows = self._fetch_recent_quarter_rows(ticker)
+            recent_rows, columns = self._fetch_recent_quarter_rows(ticker)
+            matrix = self._to_matrix(recent_rows)
 
-            item["data"]["balance_sheet"] = self._build_section_fieldwise_padded(
-                recent_rows, self._bs_map()
+            balance_sheet = self._build_section_fieldwise_padded(
+                matrix, columns, self._bs_map()
             )
-            item["data"]["income_statement"] = self._build_section_fieldwise_padded(
-                recent_rows, self._is_map()
+            income_statement = self._build_section_fieldwise_padded(
+                matrix, columns, self._is_map()
             )
-            item["data"]["cash_flow"] = self._build_section_fieldwise_padded(
-                recent_rows, self._cf_map()
+            cash_flow = self._build_section_fieldwise_padded(
+                matrix, columns, self._cf_map()
             )
-            item["data"]["chart"] = self._get_chart_data(ticker)
-
-            def all_empty(section):
-                return not any(v for v in section.values() if v)
+            chart = self._get_chart_data(ticker)
 
             if (
-                all_empty(item["data"]["balance_sheet"])
-                or all_empty(item["data"]["income_statement"])
-                or all_empty(item["data"]["cash_flow"])
-                or not item["data"]["chart"]["timestamp"]
+                is_empty_section(balance_sheet)
+                or is_empty_section(income_statement)
+                or is_empty_section(cash_flow)
+                or not len(chart["timestamp"])
             ):
                 return None
 
-            return item
+            return new_item(
+                "finance",
+                balance_sheet=balance_sheet,
+                income_statement=income_statement,
+                cash_flow=cash_flow,
+                chart=chart,
+            )
 
         except Exception as e:
             self.logger.error(f"{e}: ticker={row.get('ticker', '?')}")
             return None
 
-    def _fetch_recent_quarter_rows(self, ticker: str) -> list[dict]:
+    def _fetch_recent_quarter_rows(self, ticker: str) -> tuple[list, list[str]]:
         try:
             with get_session() as session:
-                rows = (
-                    session.execute(
-                        text(
-                            """
-                        SELECT * FROM notifier_financial_vw
-                        WHERE ticker = :tag
-                        ORDER BY posted_at DESC
-                        LIMIT 5
+                result = session.execute(
+                    text(
                         """
-                        ),
-                        {"tag": ticker},
-                    )
-                    .mappings()
-                    .all()
+                    SELECT * FROM notifier_financial_vw
+                    WHERE ticker = :tag
+                    ORDER BY posted_at DESC
+                    LIMIT 5
+                    """
+                    ),
+                    {"tag": ticker},
                 )
-                return rows or []
+                return result.all(), list(result.keys())
         except Exception as e:
             self.logger.error(f"{ticker}: {e}")
-            return []
+            return [], []
+
+    @staticmethod
+    def _to_matrix(rows: list) -> np.ndarray:
+        """결과 행들을 (행 × 컬럼) object 행렬로 변환"""
+        if not rows:
+            return np.empty((0, 0), dtype=object)
+        return np.array(rows, dtype=object)
 
     def _build_section_fieldwise_padded(
-        self, rows: list[dict], mapping: dict[str, str]
-    ) -> dict | None:
-        section = {}
+        self, matrix: np.ndarray, columns: list[str], mapping: dict[str, str]
+    ) -> dict:
+        if matrix.shape[0] < 4:
+            return {}
 
-        for field, req_key in mapping.items():
-            values = []
-            for row in rows:
-                if row is None:
-                    continue
-                val = row.get(field)
-                if val is not None:
-                    try:
-                        values.append(float(val))
-                    except (ValueError, TypeError):
-                        values.append(val)
-
-                if len(values) == 4:
-                    break
-
-            if len(values) < 4:
+        index = {name: i for i, name in enumerate(columns)}
+        if any(field not in index for field in mapping):
+            return {}
+
+        block = matrix[:, [index[field] for field in mapping]]
+        try:
+            values = block.astype(np.float64)
+        except (ValueError, TypeError):
+            self.logger.debug("재무 데이터 숫자 변환 실패")
+            return {}
+
+        section = {}
+        valid = ~np.isnan(values)
+        for j, req_key in enumerate(mapping.values()):
+            column = values[valid[:, j], j]
+            if column.shape[0] < 4:
                 # 하나라도 4개 미만이면 전체를 None으로
                 return {}
-
-            section[req_key] = values
+            section[req_key] = column[:4]
 
         return section
 
@@ -116,23 +126,18 @@ class FinancialNotifier(NotifierBase):
                         """
                     ),
                     {"ticker": ticker},
-                )
-
-                chart = {"timestamp": [], "o": [], "c": []}
-                found = False
-                for r in rows:
-                    found = True
-                    chart["timestamp"].append(str(r.posted_at))
-                    chart["o"].append(float(r.open) if r.open is not None else None)
-                    chart["c"].append(float(r.close) if r.close is not None else None)
-
-                if not found:
-                    self.logger.debug(f"no data for {ticker}")
-
-                for key in chart:
-                    chart[key] = list(reversed(chart[key]))
-
-                return chart
+                ).all()
+
+            if not rows:
+                self.logger.debug(f"no data for {ticker}")
+
+            rows.reverse()
+            posted_at, o, c = transpose(rows, 3)
+            return {
+                "timestamp": date_column(posted_at, unit="s"),
+                "o": float_column(o),
+                "c": float_column(c),
+            }
 
         except Exception as e:
             self.logger.error(f"{ticker}: {e}")
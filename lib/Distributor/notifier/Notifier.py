@@ -1,16 +1,23 @@
 from sqlalchemy import text, update
-import copy, time, random
+import time, random
 from datetime import datetime, timedelta
 
 from lib.Logger.logger import get_logger
 from lib.Distributor.socket.Client import SocketClient
-from lib.Distributor.secretary.session import get_session
+from lib.Distributor.socket.messages.builder import RequestMessageBuilder
+from lib.Distributor.secretary.session import get_session, get_pool_stats
 from lib.Config.config import Config  # 설정 관리 클래스
+from lib.Metrics.profiling import CycleProfiler
 from lib.Distributor.secretary.models.financials import FinancialStatement
 from lib.Distributor.secretary.models.news import News
 
+# 배치 envelope를 처리하지 못하는 서버가 보내는 응답 코드 (Not Implemented)
+BATCH_UNSUPPORTED_STATUS = 501
+
 
 class NotifierBase:
+    _batch_supported = True  # 서버가 배치 미지원을 알리면 프로세스 전체에서 1건 모드 사용
+
     def __init__(self, name="NotifierBase"):
         self.client = SocketClient()
         self.logger = get_logger(name)
@@ -28,7 +35,10 @@ class NotifierBase:
 
                 for notifier in notifiers:
                     try:
-                        notifier.run()
+                        with CycleProfiler.instance().profile(
+                            notifier.__class__.__name__
+                        ):
+                            notifier.run()
                     except Exception as e:
                         notifier.logger.error(
                             f"{notifier.__class__.__name__} 실패: {e}"
@@ -36,6 +46,7 @@ class NotifierBase:
                     finally:
                         notifier.logger.log_summary()
 
+                self.logger.debug(f"DB 커넥션 풀 상태: {get_pool_stats()}")
                 self.logger.info(f"{self.interval_sec}sec 이후 재실행")
                 time.sleep(self.interval_sec)
 
@@ -52,11 +63,13 @@ class NotifierBase:
             self.logger.info(f"처리할 {source} 없음")
             return
 
+        builder = RequestMessageBuilder(base_message)
+        batch_size = max(1, int(Config.get("notifier_batch_size", 1) or 1))
+        pending = []  # (row, item)
+
         for row in rows:
             try:
-                requests_message = copy.deepcopy(base_message)
                 item = self._build_item(row)
-                requests_message["body"]["item"] = item
 
                 if not item:
                     self.logger.debug(f"no item in: {row.get('ticker')}")
@@ -65,36 +78,17 @@ class NotifierBase:
                     )
                     continue
 
-                if self.socket_condition:
-                    result = self.client.request_tcp(requests_message)
-
-                    status_code = result.get("status_code")
-                    message = result.get("message")
-
-                    if status_code != 200:
-                        if status_code == 400:
-                            msg = "데이터 입력 오류 (400)"
-                        elif status_code == 500:
-                            msg = "시스템 오류 (500)"
-                        else:
-                            msg = f"알 수 없는 상태 코드({status_code})"
-                        self.logger.error(f"{msg} → {message}: {row['ticker']}")
-                        continue
+                if not self.socket_condition:
+                    continue
 
-                    self.update_analysis_log_time(
-                        row.get("crawling_id"), row.get("ticker")
-                    )
+                if batch_size == 1 or not NotifierBase._batch_supported:
+                    self._send_single(builder, row, item, source)
+                    continue
 
-                    raw_result = result.get("item", {}).get("result")
-                    if raw_result is not None:
-                        try:
-                            index = int(float(raw_result))
-                            self._update_analysis(row["crawling_id"], index, source)
-                        except (ValueError, TypeError):
-                            self.logger.warning(f"분석 인덱스 변환 실패 → {raw_result}")
-                    else:
-                        self.logger.warning(f"분석 결과 없음 → {row['crawling_id']}")
-                    time.sleep(random.uniform(0.1, 0.4))
+                pending.append((row, item))
+                if len(pending) >= batch_size:
+                    self._send_batch(builder, pending, source)
+                    pending = []
 
             except Exception as e:
                 self.logger.error(
@@ -102,6 +96,115 @@ class NotifierBase:
                 )
                 time.sleep(1.0)
 
+        if pending:
+            self._send_batch(builder, pending, source)
+
+    def _send_single(self, builder, row: dict, item: dict, source: str):
+        """1건 요청 (기존 서버 호환 모드)"""
+        result = self.client.request_tcp(builder.build(item))
+        self._apply_result(
+            row,
+            result.get("status_code"),
+            result.get("message"),
+            result.get("item", {}).get("result"),
+            source,
+        )
+        time.sleep(random.uniform(0.1, 0.4))
+
+    def _send_batch(self, builder, pending: list[tuple[dict, dict]], source: str):
+        """여러 item을 하나의 요청으로 전송하고 (crawling_id, ticker)로 결과를 매칭"""
+        try:
+            result = self.client.request_tcp(
+                builder.build_batch(
+                    [
+                        (row.get("crawling_id"), row.get("ticker"), item)
+                        for row, item in pending
+                    ]
+                )
+            )
+        except Exception as e:
+            self.logger.error(f"배치 요청 실패 ({len(pending)}건): {e}")
+            time.sleep(1.0)
+            return
+
+        entries = result.get("items")
+        if not isinstance(entries, list):
+            status_code = result.get("status_code")
+            if not self._is_batch_unsupported(status_code):
+                # 배치 서버의 일시적 오류 → 배치 모드 유지, 항목은 다음 주기에 재시도
+                self.logger.error(
+                    f"배치 요청 오류({status_code}) → {result.get('message')}: "
+                    f"{len(pending)}건 다음 주기에 재시도"
+                )
+                time.sleep(1.0)
+                return
+
+            # 배치 envelope를 지원하지 않는 서버 → 1건 모드로 전환 후 재전송
+            self.logger.warning(f"배치 미지원 응답({status_code}) → 1건 모드로 전환")
+            NotifierBase._batch_supported = False
+            for row, item in pending:
+                try:
+                    self._send_single(builder, row, item, source)
+                except Exception as e:
+                    self.logger.error(
+                        f"예외 발생 → {e}: {row.get('ticker')}, {row.get('crawling_id')}"
+                    )
+            return
+
+        # analysis_log 행은 (crawling_id, ticker)로 구분 (같은 기사가 여러 종목에 연결됨)
+        by_key = {
+            (entry.get("crawling_id"), entry.get("ticker")): entry
+            for entry in entries
+            if isinstance(entry, dict)
+        }
+        for row, _ in pending:
+            entry = by_key.get((row.get("crawling_id"), row.get("ticker")))
+            if entry is None:
+                # 응답에서 누락된 항목은 다음 주기에 재시도
+                self.logger.error(
+                    f"배치 응답 누락 → {row.get('ticker')}, {row.get('crawling_id')}"
+                )
+                continue
+            self._apply_result(
+                row,
+                entry.get("status_code", result.get("status_code")),
+                entry.get("message"),
+                entry.get("result"),
+                source,
+            )
+
+        time.sleep(random.uniform(0.1, 0.4))
+
+    @staticmethod
+    def _is_batch_unsupported(status_code) -> bool:
+        """items 없는 응답이 배치 미지원을 뜻하는지 (2xx 또는 501만 해당)"""
+        if status_code == BATCH_UNSUPPORTED_STATUS:
+            return True
+        return isinstance(status_code, int) and 200 <= status_code < 300
+
+    def _apply_result(self, row: dict, status_code, message, raw_result, source: str):
+        """분석 서버 응답 1건 반영"""
+        if status_code != 200:
+            if status_code == 400:
+                msg = "데이터 입력 오류 (400)"
+            elif status_code == 500:
+                msg = "시스템 오류 (500)"
+            else:
+                msg = f"알 수 없는 상태 코드({status_code})"
+            self.logger.error(f"{msg} → {message}: {row['ticker']}")
+            return
+
+        self.update_analysis_log_time(row.get("crawling_id"), row.get("ticker"))
+
+        if raw_result is not None:
+            try:
+                index = int(float(raw_result))
+                self._update_analysis(row["crawling_id"], index, source)
+            except (ValueError, TypeError):
+                self.logger.warning(f"분석 인덱스 변환 실패 → {raw_result}")
+        else:
+            self.logger.warning(f"분석 결과 없음 → {row['crawling_id']}")
+
     def _fetch_unanalyzed_rows(self, view_name: str, days=1) -> list[dict]:
         try:
             threshold = datetime.now() - timedelta(days)
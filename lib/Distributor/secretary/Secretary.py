@@ -1,13 +1,23 @@
-import orjson
-import hashlib
+import threading
 import pandas as pd
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from datetime import datetime, timedelta, timezone
 
 from lib.Distributor.secretary.models.news import News
 from lib.Distributor.secretary.models.reports import Report
-from lib.Distributor.secretary.session import SessionLocal
+from lib.Distributor.secretary.hashing import ResultHasher
+from lib.Distributor.secretary.id_cache import warm_all as warm_id_caches
+from lib.Distributor.secretary.title_translator import TitleTranslator
+from lib.Distributor.secretary.session import (
+    OUTAGE_ERRORS,
+    get_session,
+    get_pool_stats,
+    warm_pool,
+)
+from lib.Crawling.Interfaces.CrawlResult import CrawlResult, InvalidCrawlResult
 from lib.Logger.logger import get_logger
+from lib.Metrics.registry import MetricsRegistry
+from lib.Config.config import Config
 from lib.Distributor.secretary.models.core import CrawlingLog, FailLog
 from lib.Distributor.secretary.handlers import (
     store_news,
@@ -17,19 +27,108 @@ from lib.Distributor.secretary.handlers import (
     store_income_statement,
     store_balance_sheet,
     store_cash_flow,
+    store_financial_batch,
+    frame_to_records,
+    chunked,
+    FINANCIAL_CHILDREN,
 )
 
 KST = timezone(timedelta(hours=9))
 
 
 class Secretary:
+    """크롤링 결과를 DB에 분배하는 프로세스 단위 서비스
+
+    프로세스당 하나의 인스턴스를 공유하며(`Secretary.instance()`),
+    distribute 호출마다 커넥션 풀에서 세션을 빌려 쓰고 반드시 반납한다.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
 
     def __init__(self):
-        self.db = SessionLocal()
         self.handlers = {}
         self.logger = get_logger("Secretary")  # 통합 로그 클래스 적용
+        self.hasher = ResultHasher.from_config()
+        self.metrics = MetricsRegistry.instance()
         self._auto_register()
 
+    @classmethod
+    def instance(cls) -> "Secretary":
+        """프로세스 공용 Secretary 반환 (최초 호출 시 생성 및 커넥션 풀 예열)"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    secretary = cls()
+                    try:
+                        warmed = warm_pool()
+                        secretary.logger.debug(f"DB 커넥션 풀 예열 완료 - {warmed}개")
+                        with get_session() as db:
+                            cached = warm_id_caches(db)
+                        secretary.logger.debug(f"태그/지표 id 캐시 예열 - {cached}개")
+                    except SQLAlchemyError as e:
+                        # 예열은 최선 노력: DB가 내려가 있어도 서비스는 시작 (첫 저장 시 재연결)
+                        secretary.logger.error(f"DB 커넥션 풀 예열 실패: {e}")
+                    secretary._start_replayer()
+                    secretary._register_gauges()
+                    cls._instance = secretary
+        return cls._instance
+
+    def _register_gauges(self):
+        """DB 커넥션 풀 사용량을 metrics gauge로 노출"""
+        for name in ("checkedout", "overflow"):
+            self.metrics.gauge_callback(
+                f"db_pool_{name}", lambda name=name: get_pool_stats().get(name, 0)
+            )
+
+    def _start_replayer(self):
+        """spool이 켜져 있으면 DB 복구 시 spool을 재생하는 스레드 시작"""
+        from lib.Distributor.secretary.spool import ResultSpool, SpoolReplayer
+
+        spool = ResultSpool.instance()
+        if spool is not None:
+            interval = Config.get("spool.replay_interval", 60)
+            SpoolReplayer(spool, interval).start()
+
+    def spool(
+        self,
+        results: list[CrawlResult],
+        crawling_ids: list | None = None,
+        reason: str = "",
+    ) -> bool:
+        """결과를 crawling_id와 함께 spool에 보관 (spool 비활성화 시 False)
+
+        재생 시 JSON 왕복으로 달라질 수 있는 ID를 다시 계산하지 않도록
+        분배 때와 같은 crawling_id를 기록한다 (news/reports는 재생 시 계산).
+        crawling_ids가 없으면 분배 전 결과로 보고 재무제표를 분기별로 나눈다.
+        """
+        from lib.Distributor.secretary.spool import ResultSpool
+
+        spool = ResultSpool.instance()
+        if spool is None:
+            self.logger.error(f"spool 비활성화 → {len(results)}건 유실 {reason}")
+            return False
+
+        if crawling_ids is None:
+            results = self._split_statement_rows(results)
+            crawling_ids = [None] * len(results)
+        crawling_ids = [
+            crawling_id or self._spool_crawling_id(r)
+            for r, crawling_id in zip(results, crawling_ids)
+        ]
+        written = spool.append(results, crawling_ids)
+        self.logger.warning(f"spool 보관 - {written}건 {reason}")
+        return True
+
+    @staticmethod
+    def session():
+        """풀에서 빌려오는 scoped 세션 (with 블록 종료 시 반납)"""
+        return get_session()
+
+    @staticmethod
+    def pool_stats() -> dict:
+        return get_pool_stats()
+
     def _auto_register(self):
         self.register("news", store_news)
         self.register("macro", store_macro)
@@ -43,57 +142,247 @@ class Secretary:
         self.handlers[tag] = handler_fn
 
     def _generate_hash_id(self, tag: str, df: list[dict]) -> str:
-        def convert(obj):
-            if isinstance(obj, pd.Timestamp):
-                return obj.isoformat()
-            if isinstance(obj, dict):
-                return {k: convert(v) for k, v in obj.items()}
-            if isinstance(obj, list):
-                return [convert(i) for i in obj]
-            return obj
-
-        cleaned_df = convert(df)
-
-        raw_bytes = orjson.dumps(
-            {"tag": tag, "df": cleaned_df},
-            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        return self.hasher.hash_rows(tag, df)
+
+    def _generate_frame_hash_id(self, tag: str, df: pd.DataFrame) -> str:
+        """DataFrame 결과용 crawling_id (행 단위 해시를 컬럼 연산으로 계산)"""
+        return self.hasher.hash_frame(tag, df)
+
+    def _spool_crawling_id(self, result: CrawlResult) -> str | None:
+        """분배 시 계산될 crawling_id (news/reports 등 DB 조회가 필요하면 None)"""
+        if result.failed:
+            return self._result_hash_id(result.tag, result, None)
+        if result.tag in {"news", "reports"} or result.tag not in self.handlers:
+            return None
+        df = self._handler_df(result.tag, result.df)
+        return None if df is None else self._result_hash_id(result.tag, result, df)
+
+    def _handler_df(self, tag: str, df):
+        """핸들러에 전달할 형태의 df (빈 DataFrame이면 None)"""
+        if isinstance(df, pd.DataFrame):
+            if df.empty:
+                return None
+            df = df.dropna(how="all")
+            if not getattr(self.handlers[tag], "columnar", False):
+                df = frame_to_records(df)  # dict가 필요한 핸들러만 변환
+        return df
+
+    def _result_hash_id(self, tag: str, result: CrawlResult, df) -> str:
+        if result.failed:
+            fail_df = [
+                {
+                    "err_message": result.fail_log.get("err_message"),
+                    "timestamp": datetime.now().isoformat(),
+                }
+            ]
+            return self._generate_hash_id(tag="fail_log", df=fail_df)
+        if isinstance(df, pd.DataFrame):
+            return self._generate_frame_hash_id(tag, df)
+        return self._generate_hash_id(tag, df)
+
+    def _precompute_hash_ids(self, results: list[CrawlResult]) -> list[str | None]:
+        """필터링 없이 저장되는 결과의 crawling_id를 일괄 계산
+
+        news/reports는 DB 조회로 행이 걸러진 뒤 해시하고,
+        fail_log는 시각이 포함되므로 분배 시점에 개별 계산한다 (None 반환).
+        """
+        crawling_ids = [None] * len(results)
+        targets = [
+            i
+            for i, r in enumerate(results)
+            if r.tag in self.handlers
+            and r.tag not in {"news", "reports"}
+            and not r.failed
+            and isinstance(r.df, list)
+        ]
+        hashed = self.hasher.hash_batch(
+            [(results[i].tag, results[i].df) for i in targets]
         )
-        return hashlib.sha256(raw_bytes).hexdigest()
-
-    def distribute(self, result: dict | list[dict]):
-        if isinstance(result, list):
-            for r in result:
+        for i, crawling_id in zip(targets, hashed):
+            crawling_ids[i] = crawling_id
+        return crawling_ids
+
+    def distribute(
+        self,
+        result: CrawlResult | dict | list,
+        crawling_ids: list | None = None,
+        spool: bool = True,
+    ):
+        """결과를 태그별 핸들러로 분배
+
+        Args:
+            result: 크롤링 결과 (단건 또는 리스트). dict 형식 결과는 CrawlResult로 변환한다.
+            crawling_ids: 미리 계산된 crawling_id (spool 재생 시 사용).
+            spool: DB 장애 시 남은 결과를 spool에 보관할지 여부.
+                False이면 장애 예외를 호출자에게 전달한다.
+        """
+        results = result if isinstance(result, list) else [result]
+        results, crawling_ids = self._coerce_results(results, crawling_ids)
+        if crawling_ids is None:
+            results = self._split_statement_rows(results)
+        crawling_ids = crawling_ids or self._precompute_hash_ids(results)
+
+        with get_session() as db:
+            batched = self._financial_batch_indices(results)
+            if batched:
                 try:
-                    self._distribute_single(r)
+                    self._distribute_financial_batch(
+                        db,
+                        [results[i] for i in batched],
+                        [crawling_ids[i] for i in batched],
+                    )
+                except OUTAGE_ERRORS as e:
+                    if not spool:
+                        raise
+                    self.logger.error(f"DB 연결 장애 → {type(e).__name__}: {e}")
+                    self.spool(results, crawling_ids, reason="(DB 연결 장애)")
+                    return
+                except SQLAlchemyError as e:
+                    # 동시 저장 등으로 일괄 저장 실패 → 결과별 저장으로 재시도
+                    db.rollback()
+                    self.logger.warning(f"재무제표 일괄 저장 실패 → 개별 저장: {e}")
+                    batched = set()
+
+            for i, (r, crawling_id) in enumerate(zip(results, crawling_ids)):
+                if i in batched:
+                    continue
+                try:
+                    self._distribute_single(db, r, crawling_id)
+                except OUTAGE_ERRORS as e:
+                    # 연결 장애: 남은 결과는 시도하지 않고 spool로
+                    if not spool:
+                        raise
+                    self.logger.error(f"DB 연결 장애 → {type(e).__name__}: {e}")
+                    self.spool(results[i:], crawling_ids[i:], reason="(DB 연결 장애)")
+                    return
                 except Exception as e:
                     self.logger.error(
                         f"데이터 처리 중 예외 발생 → {type(e).__name__}: {e}",
                     )
                     continue
-        else:
+
+        if Config.get("translation.enabled", True) and any(
+            r.tag in {"news", "reports"} for r in results
+        ):
+            TitleTranslator.instance().request_backfill()  # 트랜잭션 밖에서 제목 번역
+
+    def _coerce_results(
+        self, results: list, crawling_ids: list | None
+    ) -> tuple[list[CrawlResult], list | None]:
+        """결과를 CrawlResult로 변환하고 형식이 잘못된 결과는 (crawling_id와 함께) 제외"""
+        coerced, ids = [], []
+        for i, r in enumerate(results):
             try:
-                self._distribute_single(result)
-            except Exception as e:
-                self.logger.error(f"데이터 처리 중 예외 발생 → {type(e).__name__}: {e}")
+                coerced.append(CrawlResult.coerce(r))
+            except InvalidCrawlResult as e:
+                self.logger.error(f"잘못된 크롤링 결과 제외 → {e}")
+                continue
+            if crawling_ids is not None:
+                ids.append(crawling_ids[i])
+        return coerced, ids if crawling_ids is not None else None
+
+    @staticmethod
+    def _split_statement_rows(results: list[CrawlResult]) -> list[CrawlResult]:
+        """여러 분기가 담긴 재무제표 결과를 분기(행)별 결과로 분리
+
+        재무제표 1건(종목/종류/기준일)이 crawling_id 하나에 대응하므로
+        행마다 별도 결과로 나누어 기존과 같은 crawling_id가 계산되도록 한다.
+        """
+        split = []
+        for r in results:
+            rows = r.df
+            if (
+                r.tag in FINANCIAL_CHILDREN
+                and not r.failed
+                and isinstance(rows, list)
+                and len(rows) > 1
+            ):
+                split.extend(r.with_df([row]) for row in rows)
+            else:
+                split.append(r)
+        return split
+
+    def _financial_batch_indices(self, results: list[CrawlResult]) -> set[int]:
+        """일괄 저장할 재무제표 결과의 인덱스 (실패 로그/빈 결과는 개별 저장)"""
+        return {
+            i
+            for i, r in enumerate(results)
+            if r.tag in FINANCIAL_CHILDREN
+            and r.tag in self.handlers
+            and not r.failed
+            and isinstance(r.df, list)
+            and r.df
+        }
+
+    def _distribute_financial_batch(
+        self, db, results: list[CrawlResult], crawling_ids: list[str | None]
+    ):
+        """재무제표 결과를 한 트랜잭션으로 저장
+
+        crawling_id 중복 확인과 재무제표 키 중복 확인을 각각 한 번의 조회로 처리하고
+        CrawlingLog / FinancialStatement / 하위 테이블을 bulk insert 한다.
+        """
+        fresh = {}
+        for r, crawling_id in zip(results, crawling_ids):
+            crawling_id = crawling_id or self._result_hash_id(r.tag, r, r.df)
+            fresh.setdefault(crawling_id, r)
+
+        for chunk in chunked(list(fresh)):
+            for (crawling_id,) in db.execute(
+                select(CrawlingLog.crawling_id).where(
+                    CrawlingLog.crawling_id.in_(chunk)
+                )
+            ):
+                del fresh[crawling_id]  # 이미 처리된 결과 (기존 기본키 충돌과 동일)
+
+        if not fresh:
+            return
+
+        try_time = datetime.now(KST)
+        db.bulk_insert_mappings(
+            CrawlingLog,
+            [
+                {
+                    "crawling_id": crawling_id,
+                    "crawling_type": r.log.crawling_type,
+                    "status_code": r.log.status_code,
+                    "target_url": r.log.target_url,
+                    "try_time": try_time,
+                }
+                for crawling_id, r in fresh.items()
+            ],
+        )
+        with self.metrics.timer("db_write_seconds", handler="financial_batch"):
+            stored = store_financial_batch(
+                db,
+                [(r.tag, crawling_id, r.df) for crawling_id, r in fresh.items()],
+            )
+            db.commit()
+        self.logger.debug(
+            f"재무제표 일괄 저장 - 결과 {len(fresh)}건, 신규 재무제표 {stored}건"
+        )
 
-    def _distribute_single(self, result: dict):
-        log = result.get("log", {})
-        tag = result.get("tag")
+    def _distribute_single(
+        self, db, result: CrawlResult, crawling_id: str | None = None
+    ):
+        log = result.log
+        tag = result.tag
 
-        if not tag or tag not in self.handlers:
+        if tag not in self.handlers:
             self.logger.warning(f"등록되지 않은 tag: {tag}")
             return
 
-        df = result.get("df")
-        if isinstance(df, pd.DataFrame):
-            if df.empty:
-                self.logger.warning(f"{tag}: 빈 DataFrame")
-                return
-            df = df.dropna(how="all").to_dict(orient="records")
+        if result.df is None and not result.failed:
+            self.logger.warning(f"{tag}: 내용 없는 결과 ({log.target_url})")
+            return
+        df = self._handler_df(tag, result.df)
+        if df is None and not result.failed:
+            self.logger.warning(f"{tag}: 빈 DataFrame")
+            return
 
         # ✅ 필터링: CrawlingLog 기록 전에 수행
-        if tag in {"news", "reports"}:
-            valid_ticker_map = get_valid_ticker_map(self.db)
+        if tag in {"news", "reports"} and not result.failed:
+            valid_ticker_map = get_valid_ticker_map(db)
             filtered_df = []
 
             for row in df:
@@ -102,7 +391,7 @@ class Secretary:
                     continue
 
                 model = News if tag == "news" else Report
-                if self.db.execute(select(model).where(model.title == title)).first():
+                if db.execute(select(model).where(model.title == title)).first():
                     continue
 
                 tags = row.get("tag", "")
@@ -120,55 +409,48 @@ class Secretary:
             if not df:
                 return
 
-        if "fail_log" in result:
-            fail_df = [
-                {
-                    "err_message": result["fail_log"].get("err_message"),
-                    "timestamp": datetime.now().isoformat(),
-                }
-            ]
-            crawling_id = self._generate_hash_id(tag="fail_log", df=fail_df)
-        else:
-            crawling_id = self._generate_hash_id(tag, df)
+        if crawling_id is None:  # spool 재생 시에는 최초 분배 때 계산된 ID 유지
+            crawling_id = self._result_hash_id(tag, result, df)
 
         try:
             crawling_log = CrawlingLog(
                 crawling_id=crawling_id,
-                crawling_type=log.get("crawling_type"),
-                status_code=log.get("status_code"),
-                target_url=log.get("target_url"),
+                crawling_type=log.crawling_type,
+                status_code=log.status_code,
+                target_url=log.target_url,
                 try_time=datetime.now(KST),
             )
-            self.db.add(crawling_log)
-            self.db.flush()
+            db.add(crawling_log)
+            db.flush()
 
         except IntegrityError:
-            self.db.rollback()
+            db.rollback()
             return
         except SQLAlchemyError as e:
-            self.db.rollback()
+            db.rollback()
             raise
 
         try:
-            if "fail_log" in result:
-                self.db.add(
+            if result.failed:
+                db.add(
                     FailLog(
                         crawling_id=crawling_id,
-                        err_message=result["fail_log"].get("err_message"),
+                        err_message=result.fail_log.get("err_message"),
                     )
                 )
-                self.db.commit()
+                db.commit()
                 return
 
-            self.handlers[tag](self.db, crawling_id, df)
-            self.db.commit()
+            with self.metrics.timer("db_write_seconds", handler=tag):
+                self.handlers[tag](db, crawling_id, df)
+                db.commit()
 
         except SQLAlchemyError as e:
-            self.db.rollback()
+            db.rollback()
             raise
 
         except Exception as e:
-            self.db.rollback()
+            db.rollback()
             raise
 
 
@@ -1,8 +1,9 @@
-from sqlalchemy import select, func
+import pandas as pd
+from sqlalchemy import select, func, tuple_
 
-from lib.Distributor.secretary.models.news import News, NewsTag
-from lib.Distributor.secretary.models.macro import MacroIndex, MacroEconomics
-from lib.Distributor.secretary.models.reports import Report, ReportTag
+from lib.Distributor.secretary.models.news import News
+from lib.Distributor.secretary.models.macro import MacroEconomics
+from lib.Distributor.secretary.models.reports import Report
 from lib.Distributor.secretary.models.stock import Stock
 from lib.Distributor.secretary.models.financials import (
     FinancialStatement,
@@ -10,7 +11,52 @@ from lib.Distributor.secretary.models.financials import (
     BalanceSheet,
     CashFlow,
 )
-from lib.Distributor.secretary.title_translator import translate_title
+from lib.Distributor.secretary.id_cache import (
+    news_tag_ids,
+    report_tag_ids,
+    macro_index_ids,
+)
+from lib.Distributor.secretary.title_translator import TitleTranslator
+
+
+def columnar(handler):
+    """DataFrame을 그대로 받는 핸들러 표시 (Secretary가 dict 변환을 생략)"""
+    handler.columnar = True
+    return handler
+
+
+def frame_to_records(df: pd.DataFrame, columns: dict | None = None) -> list[dict]:
+    """DataFrame → executemany 파라미터 (NaN→None 변환은 컬럼 단위로 일괄 처리)
+
+    Args:
+        df: 변환할 DataFrame.
+        columns: {DataFrame 컬럼: 파라미터 키}. None이면 모든 컬럼을 그대로 사용.
+    """
+    if columns is None:
+        columns = {name: name for name in df.columns}
+    frame = df.reindex(columns=list(columns))
+    values = frame.astype(object).where(frame.notna(), None)
+    keys = list(columns.values())
+    return [dict(zip(keys, row)) for row in values.itertuples(index=False, name=None)]
+
+
+def upsert_statement(db, model, keys: list[str], update_columns: list[str]):
+    """DB 종류에 맞는 insert ... on duplicate/conflict update 구문"""
+    if db.get_bind().dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        stmt = sqlite_insert(model)
+        return stmt.on_conflict_do_update(
+            index_elements=keys,
+            set_={name: stmt.excluded[name] for name in update_columns},
+        )
+
+    from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+    stmt = mysql_insert(model)
+    return stmt.on_duplicate_key_update(
+        {name: stmt.inserted[name] for name in update_columns}
+    )
 
 
 def store_news(db, crawling_id, data):
@@ -26,15 +72,11 @@ def store_news(db, crawling_id, data):
         if not chosen_tag:
             continue
 
-        # 태그부터 저장하고 태그 id를 가져와서 뉴스에 tag_id로 넣기 (crawling_id는 태그에 넣지 않음)
-        tag = db.query(NewsTag).filter_by(tag=chosen_tag).first()
-        if not tag:
-            tag = NewsTag(tag=chosen_tag)
-            db.add(tag)
-            db.flush()
-            db.refresh(tag)
+        # 태그 id는 캐시에서 조회, 없으면 생성 (crawling_id는 태그에 넣지 않음)
+        tag_id = news_tag_ids.get_or_create(db, chosen_tag)
 
-        transed_title = translate_title(title)
+        # 캐시에 없으면 NULL로 저장 → 커밋 후 backfill 스레드가 번역
+        transed_title = TitleTranslator.instance().cached(title)
 
         news = News(
             crawling_id=crawling_id,
@@ -45,7 +87,7 @@ def store_news(db, crawling_id, data):
             posted_at=row.get("posted_at"),
             content=row.get("content"),
             hits=row.get("hits"),
-            tag_id=tag.tag_id,
+            tag_id=tag_id,
         )
         db.add(news)
 
@@ -63,15 +105,11 @@ def store_reports(db, crawling_id, data):
         if not chosen_tag:
             continue
 
-        # 태그부터 저장하고 태그 id를 가져와서 리포트에 tag_id로 넣기 (crawling_id는 태그에 넣지 않음)
-        tag = db.query(ReportTag).filter_by(tag=chosen_tag).first()
-        if not tag:
-            tag = ReportTag(tag=chosen_tag)
-            db.add(tag)
-            db.flush()
-            db.refresh(tag)
+        # 태그 id는 캐시에서 조회, 없으면 생성 (crawling_id는 태그에 넣지 않음)
+        tag_id = report_tag_ids.get_or_create(db, chosen_tag)
 
-        transed_title = translate_title(title)
+        # 캐시에 없으면 NULL로 저장 → 커밋 후 backfill 스레드가 번역
+        transed_title = TitleTranslator.instance().cached(title)
 
         report = Report(
             crawling_id=crawling_id,
@@ -81,7 +119,7 @@ def store_reports(db, crawling_id, data):
             hits=row.get("hits"),
             posted_at=row.get("posted_at"),
             content=row.get("content"),
-            tag_id=tag.tag_id,
+            tag_id=tag_id,
         )
         db.add(report)
 
@@ -90,71 +128,56 @@ def store_macro(db, crawling_id, data):
     for row in data:
         index_name = row.get("index_name")
 
-        # index_name으로 MacroIndex 조회 or 생성
-        index = db.query(MacroIndex).filter_by(index_name=index_name).first()
-        if not index:
-            index = MacroIndex(index_name=index_name)
-            db.add(index)
-            db.flush()  # index_id 확보
-            db.refresh(index)
+        # index_name으로 MacroIndex id 조회 or 생성 (캐시)
+        index_id = macro_index_ids.get_or_create(db, index_name)
 
         db.add(
             MacroEconomics(
                 crawling_id=crawling_id,
                 country=row.get("country"),
-                index_id=index.index_id,
+                index_id=index_id,
                 index_value=float(row.get("index_value")),
                 posted_at=row.get("posted_at"),
             )
         )
 
 
+# 크롤링 컬럼 → stock 테이블 컬럼
+STOCK_COLUMNS = {
+    "company_id": "company_id",
+    "posted_at": "posted_at",
+    "Open": "open",
+    "High": "high",
+    "Low": "low",
+    "Close": "close",
+    "Volume": "volume",
+    "Change": "change",
+}
+
+
+@columnar
 def store_stock(db, crawling_id, data):
-    from collections import defaultdict
-    from sqlalchemy.dialects.mysql import insert as mysql_insert
-    import pandas as pd
+    if not isinstance(data, pd.DataFrame):
+        data = pd.DataFrame(data or [])
 
-    if isinstance(data, pd.DataFrame):
-        records = data.dropna(how="all").to_dict(orient="records")
-    else:
-        records = [row for row in (data or []) if row.get("posted_at")]
+    if data.empty or "posted_at" not in data.columns:
+        return
 
-    if not records:
+    frame = data[data["posted_at"].notna()]
+    if frame.empty:
         return
 
-    grouped = defaultdict(list)
-    for row in records:
-        grouped[row["company_id"]].append(row)
-
-    for company_id, rows in grouped.items():
-        for row in rows:
-            stmt = (
-                mysql_insert(Stock)
-                .values(
-                    crawling_id=crawling_id,
-                    company_id=company_id,
-                    posted_at=row["posted_at"],
-                    open=row.get("Open"),
-                    high=row.get("High"),
-                    low=row.get("Low"),
-                    close=row.get("Close"),
-                    volume=row.get("Volume"),
-                    change=row.get("Change"),
-                )
-                .on_duplicate_key_update(
-                    crawling_id=crawling_id,
-                    open=row.get("Open"),
-                    high=row.get("High"),
-                    low=row.get("Low"),
-                    close=row.get("Close"),
-                    volume=row.get("Volume"),
-                    change=row.get("Change"),
-                    posted_at=row["posted_at"],
-                )
-            )
-            db.execute(stmt)
+    records = frame_to_records(frame, STOCK_COLUMNS)
+    for record in records:
+        record["crawling_id"] = crawling_id
 
-    db.commit()
+    stmt = upsert_statement(
+        db,
+        Stock,
+        keys=["crawling_id"],
+        update_columns=["crawling_id", *list(STOCK_COLUMNS.values())[1:]],
+    )
+    db.execute(stmt, records)  # executemany
 
 
 from datetime import datetime, date
@@ -204,7 +227,66 @@ def store_financial_statement_meta(db, crawling_id: str, row: dict) -> bool:
     return True
 
 
-def store_income_statement(db, crawling_id: str, data: list[dict]) -> None:
+def _income_statement_mapping(crawling_id: str, row: dict) -> dict:
+    return {
+        "crawling_id": crawling_id,
+        "total_revenue": row.get("Total Revenue"),
+        "operating_income": row.get("Operating Income"),
+        "net_income": row.get("Net Income"),
+        "ebitda": row.get("EBITDA"),
+        "diluted_eps": row.get("Diluted EPS"),
+        "gross_profit": row.get("Gross Profit"),
+        "cost_of_revenue": row.get("Cost Of Revenue"),
+        "sgna": row.get("Selling General And Administration"),
+        "reconciled_depreciation": row.get("Reconciled Depreciation"),
+        "other_non_operating_income_expenses": row.get(
+            "Other Non Operating Income Expenses"
+        ),
+        "normalized_income": row.get("Normalized Income"),
+    }
+
+
+def _balance_sheet_mapping(crawling_id: str, row: dict) -> dict:
+    return {
+        "crawling_id": crawling_id,
+        "total_assets": row.get("Total Assets"),
+        "total_liabilities": row.get("Total Liabilities Net Minority Interest"),
+        "stockholders_equity": row.get("Stockholders Equity"),
+        "current_assets": row.get("Current Assets"),
+        "current_liabilities": row.get("Current Liabilities"),
+        "retained_earnings": row.get("Retained Earnings"),
+        "cash_and_cash_equivalents": row.get("Cash And Cash Equivalents"),
+        "accounts_receivable": row.get("Accounts Receivable"),
+        "inventory": row.get("Inventory"),
+        "cash_cash_equivalents_and_short_term_investments": row.get(
+            "Cash Cash Equivalents And Short Term Investments"
+        ),
+        "cash_equivalents": row.get("Cash Equivalents"),
+        "cash_financial": row.get("Cash Financial"),
+        "other_short_term_investments": row.get("Other Short Term Investments"),
+    }
+
+
+def _cash_flow_mapping(crawling_id: str, row: dict) -> dict:
+    return {
+        "crawling_id": crawling_id,
+        "operating_cash_flow": row.get("Operating Cash Flow"),
+        "investing_cash_flow": row.get("Investing Cash Flow"),
+        "financing_cash_flow": row.get("Financing Cash Flow"),
+        "free_cash_flow": row.get("Free Cash Flow"),
+        "capital_expenditure": row.get("Capital Expenditure"),
+    }
+
+
+# 재무제표 tag → (하위 테이블 모델, 행 매핑 함수)
+FINANCIAL_CHILDREN = {
+    "income_statement": (IncomeStatement, _income_statement_mapping),
+    "balance_sheet": (BalanceSheet, _balance_sheet_mapping),
+    "cash_flow": (CashFlow, _cash_flow_mapping),
+}
+
+
+def _store_financial(db, tag: str, crawling_id: str, data: list[dict]) -> None:
     if not data:
         return
 
@@ -213,85 +295,103 @@ def store_income_statement(db, crawling_id: str, data: list[dict]) -> None:
 
     db.flush()
 
-    db.bulk_insert_mappings(
-        IncomeStatement,
-        [
-            {
-                "crawling_id": crawling_id,
-                "total_revenue": row.get("Total Revenue"),
-                "operating_income": row.get("Operating Income"),
-                "net_income": row.get("Net Income"),
-                "ebitda": row.get("EBITDA"),
-                "diluted_eps": row.get("Diluted EPS"),
-                "gross_profit": row.get("Gross Profit"),
-                "cost_of_revenue": row.get("Cost Of Revenue"),
-                "sgna": row.get("Selling General And Administration"),
-                "reconciled_depreciation": row.get("Reconciled Depreciation"),
-                "other_non_operating_income_expenses": row.get(
-                    "Other Non Operating Income Expenses"
-                ),
-                "normalized_income": row.get("Normalized Income"),
-            }
-            for row in data
-        ],
-    )
+    model, mapping = FINANCIAL_CHILDREN[tag]
+    db.bulk_insert_mappings(model, [mapping(crawling_id, row) for row in data])
+
+
+def store_income_statement(db, crawling_id: str, data: list[dict]) -> None:
+    _store_financial(db, "income_statement", crawling_id, data)
 
 
 def store_balance_sheet(db, crawling_id: str, data: list[dict]) -> None:
-    if not data:
-        return
+    _store_financial(db, "balance_sheet", crawling_id, data)
 
-    if not store_financial_statement_meta(db, crawling_id, data[0]):
-        return
 
-    db.flush()
+def store_cash_flow(db, crawling_id: str, data: list[dict]) -> None:
+    _store_financial(db, "cash_flow", crawling_id, data)
 
-    db.bulk_insert_mappings(
-        BalanceSheet,
-        [
-            {
-                "crawling_id": crawling_id,
-                "total_assets": row.get("Total Assets"),
-                "total_liabilities": row.get("Total Liabilities Net Minority Interest"),
-                "stockholders_equity": row.get("Stockholders Equity"),
-                "current_assets": row.get("Current Assets"),
-                "current_liabilities": row.get("Current Liabilities"),
-                "retained_earnings": row.get("Retained Earnings"),
-                "cash_and_cash_equivalents": row.get("Cash And Cash Equivalents"),
-                "accounts_receivable": row.get("Accounts Receivable"),
-                "inventory": row.get("Inventory"),
-                "cash_cash_equivalents_and_short_term_investments": row.get(
-                    "Cash Cash Equivalents And Short Term Investments"
-                ),
-                "cash_equivalents": row.get("Cash Equivalents"),
-                "cash_financial": row.get("Cash Financial"),
-                "other_short_term_investments": row.get("Other Short Term Investments"),
-            }
-            for row in data
-        ],
-    )
 
+# ── 재무제표 일괄 저장 ──────────────────────────────────────────────────
+IN_CLAUSE_CHUNK = 1000  # IN 절 하나에 넣을 최대 값 수
 
-def store_cash_flow(db, crawling_id: str, data: list[dict]) -> None:
-    if not data:
-        return
 
-    if not store_financial_statement_meta(db, crawling_id, data[0]):
-        return
+def chunked(values: list, size: int = IN_CLAUSE_CHUNK):
+    for i in range(0, len(values), size):
+        yield values[i : i + size]
+
+
+def financial_statement_key(row: dict) -> tuple:
+    """FinancialStatement 중복 판단 키 (company, posted_at, financial_type)"""
+    posted_at = normalize_posted_at(row.get("posted_at"))
+    if isinstance(posted_at, pd.Timestamp):
+        posted_at = posted_at.to_pydatetime()
+    return row.get("Symbol"), posted_at, row.get("financial_type")
 
-    db.flush()
+
+def existing_financial_keys(db, keys: list[tuple]) -> set[tuple]:
+    """이미 저장된 재무제표 키를 tuple-IN 조회로 한 번에 확인"""
+    columns = (
+        FinancialStatement.company,
+        FinancialStatement.posted_at,
+        FinancialStatement.financial_type,
+    )
+    existing = set()
+    for chunk in chunked(keys):
+        rows = db.execute(select(*columns).where(tuple_(*columns).in_(chunk))).all()
+        existing.update(tuple(row) for row in rows)
+    return existing
+
+
+def store_financial_batch(db, entries: list[tuple[str, str, list[dict]]]) -> int:
+    """여러 재무제표 결과를 한 번에 저장 (CrawlingLog는 호출자가 기록)
+
+    Args:
+        entries: (tag, crawling_id, 행 목록) 목록.
+
+    Returns:
+        int: 새로 저장된 재무제표 수.
+    """
+    candidates = {}
+    for tag, crawling_id, data in entries:
+        if data:
+            # 같은 크롤링에서 중복된 키는 첫 결과만 사용 (기존 순차 저장과 동일)
+            candidates.setdefault(
+                financial_statement_key(data[0]), (tag, crawling_id, data)
+            )
+
+    existing = existing_financial_keys(db, list(candidates))
+    new_entries = [
+        (key, entry) for key, entry in candidates.items() if key not in existing
+    ]
+    if not new_entries:
+        return 0
 
     db.bulk_insert_mappings(
-        CashFlow,
+        FinancialStatement,
         [
             {
                 "crawling_id": crawling_id,
-                "operating_cash_flow": row.get("Operating Cash Flow"),
-                "investing_cash_flow": row.get("Investing Cash Flow"),
-                "financing_cash_flow": row.get("Financing Cash Flow"),
-                "free_cash_flow": row.get("Free Cash Flow"),
-                "capital_expenditure": row.get("Capital Expenditure"),
+                "company": company,
+                "financial_type": financial_type,
+                "posted_at": posted_at,
+                "ai_analysis": data[0].get("ai_analysis"),
             }
-            for row in data
+            for (company, posted_at, financial_type), (
+                _,
+                crawling_id,
+                data,
+            ) in new_entries
         ],
     )
+
+    for tag, (model, mapping) in FINANCIAL_CHILDREN.items():
+        rows = [
+            mapping(crawling_id, row)
+            for _, (entry_tag, crawling_id, data) in new_entries
+            if entry_tag == tag
+            for row in data
+        ]
+        if rows:
+            db.bulk_insert_mappings(model, rows)
+
+    return len(new_entries)
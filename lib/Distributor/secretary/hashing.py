@@ -0,0 +1,135 @@
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import pandas as pd
+
+from lib.Config.config import Config
+
+ALGORITHMS = ("sha256", "blake2b", "xxh3")
+HASH_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    """orjson이 직렬화하지 못하는 pd.Timestamp를 isoformat 문자열로 변환
+
+    기존 재귀 변환(convert)과 같은 바이트를 만들어 sha256 crawling_id가 유지된다.
+    """
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    raise TypeError(f"해시 직렬화 불가 타입: {type(obj).__name__}")
+
+
+def canonical_bytes(tag: str, df) -> bytes:
+    """crawling_id 계산 대상 바이트 (키 정렬 JSON)"""
+    return orjson.dumps({"tag": tag, "df": df}, default=_default, option=HASH_OPTIONS)
+
+
+class _XXH3:
+    """xxh3_128 두 개(seed 0, 1)를 이어 64자리 hex를 만드는 hashlib 호환 객체"""
+
+    def __init__(self, xxhash):
+        self._parts = [xxhash.xxh3_128(seed=0), xxhash.xxh3_128(seed=1)]
+
+    def update(self, data: bytes):
+        for part in self._parts:
+            part.update(data)
+
+    def hexdigest(self) -> str:
+        return "".join(part.hexdigest() for part in self._parts)
+
+
+class ResultHasher:
+    """crawling_id 해시 계산기
+
+    - sha256: 기존 crawling_id와 동일 (기본값, DataFrame 결과 포함)
+    - blake2b: digest_size=32, key 지정 시 keyed hash
+    - xxh3: xxhash 패키지 필요, 가장 빠름
+
+    모든 방식이 64자리 hex를 반환하므로 crawling_id 컬럼(VARCHAR(64))에 그대로 저장된다.
+    """
+
+    def __init__(
+        self,
+        algorithm: str = "sha256",
+        key: str = "",
+        workers: int = 4,
+        batch_min: int = 256,
+    ):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"지원하지 않는 해시 방식: {algorithm}")
+
+        if algorithm == "xxh3":
+            import xxhash  # 선택 의존성
+
+            self._new = lambda: _XXH3(xxhash)
+        elif algorithm == "blake2b":
+            key_bytes = key.encode() if key else b""
+            self._new = lambda: hashlib.blake2b(digest_size=32, key=key_bytes)
+        else:
+            self._new = hashlib.sha256
+
+        self.algorithm = algorithm
+        self.workers = workers
+        self.batch_min = batch_min
+
+    @classmethod
+    def from_config(cls) -> "ResultHasher":
+        """hashing 설정으로 생성 (xxhash 미설치 시 sha256 사용)"""
+        options = Config.get("hashing", {}) or {}
+        kwargs = dict(
+            key=options.get("key", "") or "",
+            workers=options.get("workers", 4),
+            batch_min=options.get("batch_min", 256),
+        )
+        try:
+            return cls(options.get("algorithm", "sha256"), **kwargs)
+        except ImportError:
+            from lib.Logger.logger import get_logger
+
+            get_logger("ResultHasher").warning("xxhash 미설치 → sha256으로 해시 계산")
+            return cls("sha256", **kwargs)
+
+    def digest(self, *chunks: bytes) -> str:
+        h = self._new()
+        for chunk in chunks:
+            h.update(chunk)
+        return h.hexdigest()
+
+    def hash_rows(self, tag: str, df: list[dict]) -> str:
+        """dict 행 결과의 crawling_id"""
+        return self.digest(canonical_bytes(tag, df))
+
+    def hash_frame(self, tag: str, df: pd.DataFrame) -> str:
+        """DataFrame 결과의 crawling_id
+
+        sha256은 기존 crawling_id(to_dict 행 목록의 해시)와 같도록 행으로 변환해 해시하고,
+        그 외 방식은 행 단위 해시를 컬럼 연산으로 계산한다.
+        """
+        if self.algorithm == "sha256":
+            return self.hash_rows(tag, df.to_dict(orient="records"))
+        return self.digest(
+            tag.encode(),
+            orjson.dumps([str(c) for c in df.columns]),
+            pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes(),
+        )
+
+    def hash(self, tag: str, df) -> str:
+        if isinstance(df, pd.DataFrame):
+            return self.hash_frame(tag, df)
+        return self.hash_rows(tag, df)
+
+    def hash_batch(self, items: list[tuple[str, object]]) -> list[str]:
+        """(tag, df) 목록을 한 번에 해시
+
+        batch_min 이상이면 스레드 풀에서 나누어 계산한다.
+        (hashlib은 큰 입력에서 GIL을 놓으므로 직렬화와 다이제스트가 겹쳐 실행됨)
+        """
+        if len(items) < self.batch_min or self.workers <= 1:
+            return [self.hash(tag, df) for tag, df in items]
+
+        size = -(-len(items) // self.workers)
+        chunks = [items[i : i + size] for i in range(0, len(items), size)]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            parts = executor.map(lambda c: [self.hash(t, d) for t, d in c], chunks)
+        return [crawling_id for part in parts for crawling_id in part]
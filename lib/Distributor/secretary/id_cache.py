@@ -0,0 +1,109 @@
+import threading
+
+from sqlalchemy import event, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from lib.Distributor.secretary.models.macro import MacroIndex
+from lib.Distributor.secretary.models.news import NewsTag
+from lib.Distributor.secretary.models.reports import ReportTag
+
+PENDING_KEY = "id_cache_pending"
+
+
+class IdCache:
+    """이름 → id 프로세스 공용 캐시 (get-or-create)
+
+    - 캐시에 없으면 DB를 조회하고, 그래도 없으면 savepoint 안에서 생성
+    - 다른 프로세스와 동시에 생성해 unique 제약에 걸리면 savepoint만 되돌리고 재조회
+    - 새로 생성한 id는 트랜잭션이 커밋된 뒤에만 캐시에 반영 (롤백 시 폐기)
+    """
+
+    def __init__(self, model, name_column: str, id_column: str):
+        self.model = model
+        self.name_column = getattr(model, name_column)
+        self.id_column = getattr(model, id_column)
+        self._name_key = name_column
+        self._ids: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def warm(self, db) -> int:
+        """전체 이름/id를 한 번에 적재
+
+        Returns:
+            int: 적재된 항목 수.
+        """
+        rows = db.execute(select(self.name_column, self.id_column)).all()
+        with self._lock:
+            self._ids.update((name, id_) for name, id_ in rows)
+        return len(rows)
+
+    def get_or_create(self, db, name: str) -> int:
+        id_ = self._ids.get(name)
+        if id_ is not None:
+            return id_
+
+        pending = db.info.setdefault(PENDING_KEY, {})
+        if (self, name) in pending:  # 같은 트랜잭션에서 생성한 항목
+            return pending[(self, name)]
+
+        id_ = self._select(db, name)
+        if id_ is None:
+            id_ = self._create(db, name)
+            pending[(self, name)] = id_
+        else:
+            self._publish(name, id_)
+        return id_
+
+    def _select(self, db, name: str) -> int | None:
+        return db.execute(
+            select(self.id_column).where(self.name_column == name)
+        ).scalar()
+
+    def _create(self, db, name: str) -> int:
+        try:
+            with db.begin_nested():
+                row = self.model(**{self._name_key: name})
+                db.add(row)
+                db.flush()
+                return getattr(row, self.id_column.key)
+        except IntegrityError:
+            # 다른 프로세스가 먼저 생성 → savepoint만 롤백되었으므로 재조회
+            id_ = self._select(db, name)
+            if id_ is None:
+                raise
+            return id_
+
+    def _publish(self, name: str, id_: int):
+        with self._lock:
+            self._ids[name] = id_
+
+    def __len__(self):
+        return len(self._ids)
+
+
+news_tag_ids = IdCache(NewsTag, "tag", "tag_id")
+report_tag_ids = IdCache(ReportTag, "tag", "tag_id")
+macro_index_ids = IdCache(MacroIndex, "index_name", "index_id")
+
+ALL_CACHES = (news_tag_ids, report_tag_ids, macro_index_ids)
+
+
+def warm_all(db) -> int:
+    """모든 id 캐시 예열 (시작 시 1회)"""
+    return sum(cache.warm(db) for cache in ALL_CACHES)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session):
+    if session.in_nested_transaction():  # savepoint 해제는 커밋이 아님
+        return
+    for (cache, name), id_ in session.info.pop(PENDING_KEY, {}).items():
+        cache._publish(name, id_)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    if session.in_nested_transaction():
+        return
+    session.info.pop(PENDING_KEY, None)
@@ -27,3 +27,22 @@ class FailLog(Base):
         nullable=False,
     )
     err_message = Column(Text, nullable=False)
+
+
+class CrawlerNode(Base):
+    """sharding에 참여 중인 크롤러 노드 (heartbeat로 expires_at 갱신)"""
+
+    __tablename__ = "crawler_nodes"
+
+    node_id = Column(String(255), primary_key=True)
+    expires_at = Column(DateTime, nullable=False)
+
+
+class ShardLease(Base):
+    """종목 shard 점유 정보 (노드별 lease, 만료 시 다른 노드가 인수)"""
+
+    __tablename__ = "shard_leases"
+
+    shard_index = Column(Integer, primary_key=True, autoincrement=False)
+    owner = Column(String(255))
+    expires_at = Column(DateTime)
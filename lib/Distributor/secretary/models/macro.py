@@ -24,4 +24,4 @@ class MacroIndex(Base):
     __tablename__ = "macroeconomic_index"
 
     index_id = Column(Integer, primary_key=True, autoincrement=True, nullable=False)
-    index_name = Column(VARCHAR(255), nullable=False)
+    index_name = Column(VARCHAR(255), nullable=False, unique=True)
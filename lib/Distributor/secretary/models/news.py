@@ -28,4 +28,4 @@ class NewsTag(Base):
     __tablename__ = "news_tag"
 
     tag_id = Column(Integer, primary_key=True, nullable=False, autoincrement=True)
-    tag = Column(VARCHAR(50), ForeignKey("company.ticker"), nullable=False)
+    tag = Column(VARCHAR(50), ForeignKey("company.ticker"), nullable=False, unique=True)
@@ -26,4 +26,4 @@ class ReportTag(Base):
     __tablename__ = "reports_tag"
 
     tag_id = Column(Integer, primary_key=True, nullable=True, autoincrement=True)
-    tag = Column(VARCHAR(50), ForeignKey("company.ticker"), nullable=False)
+    tag = Column(VARCHAR(50), ForeignKey("company.ticker"), nullable=False, unique=True)
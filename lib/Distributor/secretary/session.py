@@ -1,4 +1,12 @@
+import threading
+
 from sqlalchemy import create_engine
+from sqlalchemy.exc import (
+    DisconnectionError,
+    InterfaceError,
+    OperationalError,
+    TimeoutError as PoolTimeoutError,
+)
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
 
@@ -7,18 +15,95 @@ from lib.Config.config import Config  # YAML 기반 설정 클래스
 if not Config._config:
     Config.init()
 
-# ✅ 설정에서 DB URL 불러오기
-db_url = Config.get("database.url", default="sqlite:///:memory:")
+# DB 연결 장애로 보는 예외 (데이터 오류와 달리 재시도하면 성공할 수 있음)
+OUTAGE_ERRORS = (OperationalError, InterfaceError, DisconnectionError, PoolTimeoutError)
+
+
+def _engine_options(url: str) -> dict:
+    """database.pool 설정으로 커넥션 풀 옵션 구성"""
+    options = {"echo": False, "pool_pre_ping": True}
+    if url.startswith("sqlite"):
+        return options  # sqlite는 전용 풀 사용 (크기 옵션 미지원)
+
+    pool = Config.get("database.pool", {}) or {}
+    options.update(
+        pool_size=pool.get("size", 5),
+        max_overflow=pool.get("max_overflow", 10),
+        pool_recycle=pool.get("recycle", 1800),  # MySQL wait_timeout 이전에 재연결
+        pool_timeout=pool.get("timeout", 30),
+    )
+    return options
+
+
+# ✅ SQLAlchemy 세션 설정 (DB 드라이버 로드/엔진 생성은 첫 사용 시)
+_engine = None
+_session_factory = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """프로세스 공용 엔진 (최초 호출 시 database.url 설정으로 생성)"""
+    global _engine, _session_factory
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                db_url = Config.get("database.url", default="sqlite:///:memory:")
+                engine = create_engine(db_url, **_engine_options(db_url))
+                _session_factory = sessionmaker(
+                    bind=engine, autocommit=False, autoflush=False
+                )
+                _engine = engine
+    return _engine
+
 
-# ✅ SQLAlchemy 세션 설정
-engine = create_engine(db_url, echo=False, pool_pre_ping=True)
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+def __getattr__(name: str):
+    """기존 `from session import engine, SessionLocal` 호환 (접근 시 엔진 생성)"""
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        get_engine()
+        return _session_factory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @contextmanager
 def get_session():
-    session = SessionLocal()
+    get_engine()
+    session = _session_factory()
     try:
         yield session
     finally:
         session.close()
+
+
+def warm_pool(size: int | None = None) -> int:
+    """커넥션 풀 예열 (미리 연결을 열었다가 풀에 반납)
+
+    Args:
+        size (int | None): 예열할 커넥션 수. None이면 database.pool.pre_warm 사용.
+
+    Returns:
+        int: 예열된 커넥션 수.
+    """
+    if size is None:
+        size = (Config.get("database.pool", {}) or {}).get("pre_warm", 0)
+
+    connections = []
+    try:
+        for _ in range(size):
+            connections.append(get_engine().connect())
+    finally:
+        for conn in connections:
+            conn.close()
+    return len(connections)
+
+
+def get_pool_stats() -> dict:
+    """커넥션 풀 상태 (QueuePool이 아니면 status 문자열만 반환)"""
+    pool = get_engine().pool
+    stats = {"status": pool.status()}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        fn = getattr(pool, name, None)
+        if callable(fn):
+            stats[name] = fn()
+    return stats
@@ -0,0 +1,239 @@
+import glob
+import os
+import struct
+import threading
+import time
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import orjson
+import pandas as pd
+import zstandard as zstd
+
+from lib.Config.config import Config
+from lib.Crawling.Interfaces.CrawlResult import CrawlResult
+from lib.Logger.logger import get_logger
+from lib.Metrics.registry import MetricsRegistry
+
+# 레코드: length(4) | crc32(4) | zstd(orjson({"crawling_id", "result"}))
+RECORD_HEADER = struct.Struct("!II")
+SEGMENT_PREFIX = "spool-"
+SEGMENT_SUFFIX = ".seg"
+
+
+def _default(obj):
+    """orjson이 직접 처리하지 못하는 크롤링 결과 타입 변환"""
+    if isinstance(obj, CrawlResult):
+        return obj.to_dict()  # 재생 시 Secretary가 CrawlResult로 다시 변환
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if isinstance(obj, pd.DataFrame):
+        return obj.replace({np.nan: None}).to_dict(orient="records")
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"spool 직렬화 불가 타입: {type(obj).__name__}")
+
+
+def restore_result(result: dict) -> dict:
+    """spool에서 읽은 결과의 posted_at을 크롤링 직후와 같은 Timestamp로 복원"""
+    df = result.get("df")
+    if isinstance(df, list):
+        for row in df:
+            if isinstance(row, dict) and isinstance(row.get("posted_at"), str):
+                row["posted_at"] = pd.to_datetime(row["posted_at"])
+    return result
+
+
+class ResultSpool:
+    """DB 장애 시 크롤링 결과를 보관하는 append-only 세그먼트 파일
+
+    - 레코드는 길이/CRC 헤더가 붙은 zstd 압축 JSON
+    - 세그먼트가 segment_bytes를 넘으면 다음 세그먼트로 교체
+    - 비정상 종료로 잘린 마지막 레코드는 읽을 때 무시
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        directory: str = "spool",
+        segment_bytes: int = 16 * 1024 * 1024,
+        fsync: bool = False,
+    ):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.fsync = fsync
+        self.logger = get_logger("ResultSpool")
+        self._lock = threading.Lock()
+        self._file = None
+        self._cctx = zstd.ZstdCompressor(level=3)
+
+    @classmethod
+    def instance(cls) -> "ResultSpool | None":
+        """spool 설정이 켜져 있으면 프로세스 공용 spool 반환"""
+        options = Config.get("spool", {}) or {}
+        if not options.get("enabled", True):
+            return None
+
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(
+                        directory=options.get("directory", "spool"),
+                        segment_bytes=options.get("segment_bytes", 16 * 1024 * 1024),
+                        fsync=options.get("fsync", False),
+                    )
+        return cls._instance
+
+    # ── 쓰기 ────────────────────────────────────────────────────────────
+    def append(
+        self, results: list[CrawlResult], crawling_ids: list | None = None
+    ) -> int:
+        """결과들을 spool에 기록
+
+        Returns:
+            int: 기록된 레코드 수.
+        """
+        crawling_ids = crawling_ids or [None] * len(results)
+        records = []
+        for result, crawling_id in zip(results, crawling_ids):
+            try:
+                payload = orjson.dumps(
+                    {"crawling_id": crawling_id, "result": result},
+                    default=_default,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                )
+            except TypeError as e:
+                self.logger.error(f"spool 직렬화 실패 → {e}")
+                continue
+            body = self._cctx.compress(payload)
+            records.append(RECORD_HEADER.pack(len(body), zlib.crc32(body)) + body)
+
+        if not records:
+            return 0
+
+        with self._lock:
+            f = self._active_file()
+            f.write(b"".join(records))
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+            if f.tell() >= self.segment_bytes:
+                self._close_active()
+
+        MetricsRegistry.instance().inc("spool_records_total", len(records))
+        return len(records)
+
+    def _active_file(self):
+        if self._file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            name = f"{SEGMENT_PREFIX}{time.time_ns():020d}{SEGMENT_SUFFIX}"
+            self._file = open(os.path.join(self.directory, name), "ab")
+        return self._file
+
+    def _close_active(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ── 읽기 ────────────────────────────────────────────────────────────
+    def sealed_segments(self) -> list[str]:
+        """더 이상 쓰지 않는 세그먼트 목록 (현재 쓰는 세그먼트는 닫아서 포함)
+
+        lock 밖에서 목록을 만들면 그 사이 append가 연 새 세그먼트까지 재생 후
+        삭제되어 이후 기록이 유실되므로, 목록도 lock 안에서 만든다.
+        """
+        pattern = os.path.join(self.directory, f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}")
+        with self._lock:
+            self._close_active()
+            return sorted(glob.glob(pattern))
+
+    @staticmethod
+    def read_segment(path: str):
+        """세그먼트의 레코드를 순서대로 반환 (손상/잘린 레코드에서 중단)"""
+        dctx = zstd.ZstdDecompressor()
+        with open(path, "rb") as f:
+            data = f.read()
+
+        offset = 0
+        while offset + RECORD_HEADER.size <= len(data):
+            length, crc = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            body = data[start : start + length]
+            if len(body) < length or zlib.crc32(body) != crc:
+                break  # 기록 중 종료된 마지막 레코드
+            yield orjson.loads(dctx.decompress(body))
+            offset = start + length
+
+
+class SpoolReplayer:
+    """DB 복구 후 spool 레코드를 Secretary로 다시 분배
+
+    crawling_id 중복은 CrawlingLog 기본키로 걸러지므로 여러 번 재생해도 안전하다.
+    세그먼트는 모든 레코드가 처리된 뒤에만 삭제한다.
+    """
+
+    def __init__(self, spool: ResultSpool, interval: float = 60.0):
+        self.spool = spool
+        self.interval = interval
+        self.logger = get_logger("SpoolReplayer")
+        self._thread = None
+        self._stop = threading.Event()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._loop, name="SpoolReplayer", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.replay()
+            except Exception as e:
+                self.logger.error(f"spool 재생 중 예외 발생 → {type(e).__name__}: {e}")
+
+    def replay(self, secretary=None) -> int:
+        """봉인된 세그먼트를 재생
+
+        Returns:
+            int: 재생된 레코드 수 (DB 장애가 계속되면 중단).
+        """
+        from lib.Distributor.secretary.session import OUTAGE_ERRORS
+
+        if secretary is None:
+            from lib.Distributor.secretary.Secretary import Secretary
+
+            secretary = Secretary.instance()
+        replayed = 0
+
+        for path in self.spool.sealed_segments():
+            records = list(self.spool.read_segment(path))
+            try:
+                secretary.distribute(
+                    [restore_result(r["result"]) for r in records],
+                    crawling_ids=[r.get("crawling_id") for r in records],
+                    spool=False,
+                )
+            except OUTAGE_ERRORS as e:
+                self.logger.debug(f"DB 미복구 → spool 재생 보류: {e}")
+                break
+
+            os.remove(path)
+            replayed += len(records)
+            self.logger.info(
+                f"spool 재생 완료 - {os.path.basename(path)}: {len(records)}건"
+            )
+
+        return replayed
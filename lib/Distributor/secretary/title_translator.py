@@ -1,17 +1,251 @@
-import deepl
+import hashlib
+import os
+import sqlite3
+import threading
+
 from lib.Config.config import Config
+from lib.Logger.logger import get_logger
+
+
+def title_key(title: str, target_lang: str) -> str:
+    """번역 캐시 키 (대상 언어 + 제목 해시)"""
+    return hashlib.sha256(f"{target_lang}\x00{title}".encode()).hexdigest()
+
+
+class TranslationCache:
+    """제목 해시 → 번역문을 저장하는 sqlite 기반 영구 캐시"""
+
+    def __init__(self, path: str = "cache/translations.sqlite3"):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, translated TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        found = {}
+        with self._lock:
+            for i in range(0, len(keys), 500):  # sqlite 바인딩 변수 수 제한
+                chunk = keys[i : i + 500]
+                rows = self._conn.execute(
+                    "SELECT key, translated FROM translations WHERE key IN "
+                    f"({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def put_many(self, items: dict[str, str]):
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (key, translated) VALUES (?, ?)",
+                items.items(),
+            )
+            self._conn.commit()
+
+
+class DeepLTranslator:
+    """하나의 deepl.Translator를 재사용하며 여러 제목을 한 번의 API 호출로 번역"""
+
+    def __init__(self, api_key: str):
+        import deepl  # 번역 사용 시에만 필요
+
+        self._client = deepl.Translator(api_key)
+
+    def translate_batch(self, titles: list[str], target_lang: str) -> list[str]:
+        results = self._client.translate_text(
+            titles, source_lang="EN", target_lang=target_lang
+        )
+        return [r.text for r in results]
+
+
+class FakeTranslator:
+    """테스트용 로컬 번역기 (API 호출 없이 호출 기록만 남김)"""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def translate_batch(self, titles: list[str], target_lang: str) -> list[str]:
+        self.calls.append(list(titles))
+        return [f"[{target_lang}] {title}" for title in titles]
+
+
+class TitleTranslator:
+    """뉴스/리포트 제목 번역 서비스
+
+    - 번역 결과는 제목 해시 기준으로 영구 캐시
+    - 캐시에 없는 제목만 batch_size개씩 묶어 번역 API 호출
+    - DB 저장 시에는 캐시만 조회하고, 나머지는 커밋 이후 backfill 스레드가
+      transed_title을 채운다 (API 호출 중 DB 트랜잭션을 잡지 않음)
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        translator=None,
+        cache: TranslationCache | None = None,
+        target_lang: str = "KO",
+        batch_size: int = 50,
+    ):
+        self.translator = translator
+        self.cache = cache or TranslationCache(":memory:")
+        self.target_lang = target_lang
+        self.batch_size = batch_size
+        self.logger = get_logger("TitleTranslator")
+
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def instance(cls) -> "TitleTranslator":
+        """translation 설정으로 프로세스 공용 번역 서비스 생성"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    options = Config.get("translation", {}) or {}
+                    cls._instance = cls(
+                        translator=cls._make_translator(
+                            options.get("provider", "deepl")
+                        ),
+                        cache=TranslationCache(
+                            options.get("cache_path", "cache/translations.sqlite3")
+                        ),
+                        target_lang=options.get("target_lang", "KO"),
+                        batch_size=options.get("batch_size", 50),
+                    )
+        return cls._instance
+
+    @staticmethod
+    def _make_translator(provider: str):
+        if provider == "fake":
+            return FakeTranslator()
+
+        api_key = Config.get("API_KEYS.deepl")
+        if not api_key:
+            get_logger("TitleTranslator").warning("DeepL API 키 없음 → 번역 생략")
+            return None
+        return DeepLTranslator(api_key)
+
+    # ── 번역 ────────────────────────────────────────────────────────────
+    def cached(self, title: str) -> str | None:
+        """캐시된 번역만 조회 (API 호출 없음)"""
+        key = title_key(title, self.target_lang)
+        return self.cache.get_many([key]).get(key)
+
+    def translate_many(self, titles: list[str]) -> dict[str, str]:
+        """제목들을 번역 (캐시 우선, 실패한 제목은 결과에서 제외)
+
+        Returns:
+            dict[str, str]: {원문 제목: 번역문}.
+        """
+        keys = {title: title_key(title, self.target_lang) for title in set(titles)}
+        cached = self.cache.get_many(list(keys.values()))
+        translated = {t: cached[k] for t, k in keys.items() if k in cached}
+
+        missing = [t for t in keys if t not in translated]
+        if not missing or self.translator is None:
+            return translated
+
+        for i in range(0, len(missing), self.batch_size):
+            batch = missing[i : i + self.batch_size]
+            try:
+                texts = self.translator.translate_batch(batch, self.target_lang)
+            except Exception as e:
+                self.logger.warning(f"제목 번역 실패 ({len(batch)}건) → {e}")
+                continue
+
+            self.cache.put_many({keys[t]: text for t, text in zip(batch, texts)})
+            translated.update(zip(batch, texts))
+
+        return translated
+
+    # ── backfill ────────────────────────────────────────────────────────
+    def backfill(self, limit: int = 500) -> int:
+        """transed_title이 비어 있는 뉴스/리포트 제목을 번역해 채움
+
+        조회와 갱신은 각각 짧은 트랜잭션으로 처리하고,
+        번역 API 호출 동안에는 커넥션을 잡지 않는다.
+
+        Returns:
+            int: 갱신된 행 수.
+        """
+        from sqlalchemy import select, update
+
+        from lib.Distributor.secretary.models.news import News
+        from lib.Distributor.secretary.models.reports import Report
+        from lib.Distributor.secretary.session import get_session
+
+        targets = [(News, News.news_id), (Report, Report.report_id)]
+
+        pending = {}
+        with get_session() as db:
+            for model, pk in targets:
+                pending[model] = db.execute(
+                    select(pk, model.title)
+                    .where(model.transed_title.is_(None))
+                    .order_by(pk.desc())
+                    .limit(limit)
+                ).all()
+
+        titles = [title for rows in pending.values() for _, title in rows]
+        if not titles:
+            return 0
+        translated = self.translate_many(titles)
+
+        updated = 0
+        with get_session() as db:
+            for model, pk in targets:
+                params = [
+                    {pk.key: row_id, "transed_title": translated[title]}
+                    for row_id, title in pending[model]
+                    if title in translated
+                ]
+                if params:
+                    db.execute(update(model), params)  # 기본키 기준 일괄 UPDATE
+                    updated += len(params)
+            db.commit()
+
+        self.logger.debug(f"제목 번역 backfill - {updated}/{len(titles)}건")
+        return updated
+
+    def request_backfill(self):
+        """backfill 스레드를 깨움 (최초 호출 시 스레드 시작)"""
+        if self._thread is None:
+            with self._instance_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._loop, name="TitleBackfill", daemon=True
+                    )
+                    self._thread.start()
+        self._wakeup.set()
+
+    def _loop(self):
+        options = Config.get("translation", {}) or {}
+        interval = options.get("backfill_interval", 300)
+        limit = options.get("backfill_limit", 500)
+
+        while True:
+            self._wakeup.wait(interval)
+            self._wakeup.clear()
+            try:
+                self.backfill(limit)
+            except Exception as e:
+                self.logger.error(
+                    f"제목 번역 backfill 중 예외 발생 → {type(e).__name__}: {e}"
+                )
 
 
 def translate_title(title: str, target_lang: str = "KO") -> str:
-    api_key = Config.get("API_KEYS.deepl")
-    if not api_key:
-        raise RuntimeError("DeepL API key is missing in config.")
-
-    try:
-        translator = deepl.Translator(api_key)
-        result = translator.translate_text(
-            title, source_lang="EN", target_lang=target_lang
+    """단일 제목 번역 (실패 시 원문 반환)"""
+    service = TitleTranslator.instance()
+    if target_lang != service.target_lang:
+        raise ValueError(
+            f"설정된 대상 언어({service.target_lang})와 다름: {target_lang}"
         )
-        return result.text
-    except Exception as e:
-        return title
+    return service.translate_many([title]).get(title, title)
@@ -0,0 +1,193 @@
+import queue
+import threading
+import time
+
+from lib.Config.config import Config
+from lib.Logger.logger import get_logger
+from lib.Metrics.registry import MetricsRegistry
+
+
+class WriteBehindQueue:
+    """크롤러와 DB 저장을 분리하는 write-behind 큐
+
+    크롤러 스레드는 결과 묶음을 bounded 큐에 넣고 바로 반환하며,
+    전용 writer 스레드가 여러 묶음을 모아 Secretary로 일괄 분배한다.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        maxsize: int = 64,
+        workers: int = 2,
+        batch_size: int = 500,
+        put_timeout: float = 5.0,
+    ):
+        self.logger = get_logger("WriteBehindQueue")
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.put_timeout = put_timeout
+
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "enqueued": 0,  # 큐에 들어간 결과 묶음 수
+            "written": 0,  # 분배 완료된 결과 수
+            "failed": 0,  # 분배 중 예외로 저장되지 않은 결과 수
+            "rejected": 0,  # 큐 포화로 거절된 묶음 수
+            "blocked_puts": 0,  # 대기 후에야 들어간 묶음 수
+            "put_wait_sec": 0.0,  # put 대기 누적 시간
+            "max_depth": 0,
+            "last_write_sec": 0.0,  # 마지막 일괄 분배 소요 시간
+        }
+
+    @classmethod
+    def instance(cls) -> "WriteBehindQueue":
+        """프로세스 공용 큐 반환 (최초 호출 시 write_behind 설정으로 생성 및 시작)"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    options = Config.get("write_behind", {}) or {}
+                    writer = cls(
+                        maxsize=options.get("maxsize", 64),
+                        workers=options.get("workers", 2),
+                        batch_size=options.get("batch_size", 500),
+                        put_timeout=options.get("put_timeout", 5.0),
+                    )
+                    writer.start()
+                    cls._instance = writer
+        return cls._instance
+
+    @classmethod
+    def shutdown_all(cls, timeout: float = 30.0):
+        """생성된 큐가 있으면 남은 결과를 모두 저장하고 종료"""
+        if cls._instance is not None:
+            cls._instance.shutdown(timeout)
+
+    def start(self):
+        MetricsRegistry.instance().gauge_callback(
+            "write_behind_queue_depth", self.queue.qsize
+        )
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._worker, name=f"DBWriter-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def put(self, result: list[dict]) -> bool:
+        """결과 묶음을 큐에 추가
+
+        Returns:
+            bool: put_timeout 내에 추가되면 True, 큐가 가득 차 있으면 False.
+        """
+        if not result:
+            return True
+
+        started = time.monotonic()
+        try:
+            self.queue.put_nowait(result)
+            blocked = False
+        except queue.Full:
+            try:
+                self.queue.put(result, timeout=self.put_timeout)
+                blocked = True
+            except queue.Full:
+                with self._stats_lock:
+                    self._stats["rejected"] += 1
+                return False
+
+        with self._stats_lock:
+            self._stats["enqueued"] += 1
+            if blocked:
+                self._stats["blocked_puts"] += 1
+                self._stats["put_wait_sec"] += time.monotonic() - started
+            self._stats["max_depth"] = max(self._stats["max_depth"], self.queue.qsize())
+        return True
+
+    def stats(self) -> dict:
+        """backpressure 지표"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["depth"] = self.queue.qsize()
+        stats["maxsize"] = self.queue.maxsize
+        return stats
+
+    def _take_batch(self) -> tuple[list[dict], int]:
+        """큐에서 batch_size까지 결과를 모아 반환 (묶음 수 포함)"""
+        first = self.queue.get(timeout=0.5)
+        batch, taken = list(first), 1
+
+        while len(batch) < self.batch_size:
+            try:
+                batch.extend(self.queue.get_nowait())
+                taken += 1
+            except queue.Empty:
+                break
+        return batch, taken
+
+    def _worker(self):
+        from lib.Distributor.secretary.Secretary import Secretary
+
+        while not (self._stop.is_set() and self.queue.empty()):
+            try:
+                batch, taken = self._take_batch()
+            except queue.Empty:
+                continue
+
+            started = time.monotonic()
+            written = False
+            try:
+                # Secretary 생성도 예외 처리 안에서 (실패해도 스레드는 유지, 다음 묶음에서 재시도)
+                Secretary.instance().distribute(batch)
+                written = True
+            except Exception as e:
+                self.logger.error(f"일괄 저장 중 예외 발생 → {type(e).__name__}: {e}")
+            finally:
+                with self._stats_lock:
+                    self._stats["written" if written else "failed"] += len(batch)
+                    self._stats["last_write_sec"] = time.monotonic() - started
+                for _ in range(taken):
+                    self.queue.task_done()
+
+    def shutdown(self, timeout: float = 30.0):
+        """큐를 비울 때까지 대기 후 writer 스레드 종료
+
+        timeout 안에 저장하지 못하고 큐에 남은 결과는 spool에 보관한다
+        (spool 비활성화 시 동기 저장).
+        """
+        from lib.Distributor.secretary.Secretary import Secretary
+
+        deadline = time.monotonic() + timeout
+        self._stop.set()
+
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+
+        remaining = self._drain()
+        if not remaining:
+            self.logger.info(f"DB 저장 대기열 정리 완료: {self.stats()}")
+            return
+
+        self.logger.warning(f"종료 대기 시간 초과 - 미저장 결과 {len(remaining)}건")
+        try:
+            secretary = Secretary.instance()
+            if not secretary.spool(remaining, reason="(종료 시 미저장)"):
+                secretary.distribute(remaining)
+        except Exception as e:
+            self.logger.error(
+                f"종료 시 미저장 결과 보관 실패 → {type(e).__name__}: {e}"
+            )
+
+    def _drain(self) -> list[dict]:
+        """큐에 남은 결과 묶음을 모두 꺼내 하나의 목록으로 반환"""
+        remaining = []
+        while True:
+            try:
+                remaining.extend(self.queue.get_nowait())
+            except queue.Empty:
+                return remaining
+            self.queue.task_done()
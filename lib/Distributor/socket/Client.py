@@ -1,57 +1,122 @@
 import socket
-import copy
-import json
-import base64
-import zstandard as zstd
+import orjson
 
 # Bridge
 from lib.Distributor.socket.Interface import SocketInterface
+from lib.Distributor.socket.messages.builder import dumps
+from lib.Distributor.socket.compression import PayloadCodec
+from lib.Distributor.socket.framing import FrameReader
+from lib.Config.config import Config
 from lib.Logger.logger import get_logger
+from lib.Metrics.registry import MetricsRegistry
 
 
 class SocketClient(SocketInterface):
     def __init__(self):
         self.logger = get_logger(self.__class__.__name__)
-        self.cctx = zstd.ZstdCompressor(level=9)
+        self.codec = PayloadCodec.from_config()
+        self._negotiated = not self.codec.raw_frames  # legacy 모드는 협상 불필요
+        self.connect_timeout = Config.get("socket.connect_timeout", 5)
+        self.read_timeout = Config.get("socket.read_timeout", 60)
+        self.hello_timeout = Config.get("socket.hello_timeout", 5)
+        self.max_frame_size = Config.get("socket.max_frame_size", 8 * 1024 * 1024)
 
     @staticmethod
     def resolve_addr(message=None):
         return "msiwol.iptime.org", 4006
 
-    def request_tcp(self, requests_message):
-        """
-        item을 입력으로 받아 request_message를 만들어 요청하고,
-        정상적인 JSON 응답을 반환
-        """
+    def _exchange(
+        self,
+        datagram: bytes,
+        codec: PayloadCodec | None = None,
+        read_timeout: float | None = None,
+    ) -> dict:
+        """datagram 전송 후 JSON 응답 수신
 
-        client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        Args:
+            codec (PayloadCodec | None): 응답 복원용 코덱. None이면 협상된 코덱 사용.
+            read_timeout (float | None): 응답 대기 시간. None이면 socket.read_timeout.
+        """
+        codec = codec or self.codec
+        read_timeout = read_timeout or self.read_timeout
         addr, port = self.resolve_addr()
         self.logger.debug(f"Connecting to {addr}:{port}")
-        client_socket.connect((addr, port))
+        client_socket = socket.create_connection(
+            (addr, port), timeout=self.connect_timeout
+        )
 
         try:
-            # 1. 요청 메시지 압축 + 인코딩 + 종료 토큰
-            datagram = self.cctx.compress(json.dumps(requests_message).encode())
-            datagram = base64.b64encode(datagram) + b"<END>"
             self.logger.debug(f"Datagram len: {len(datagram)}")
-
+            client_socket.settimeout(read_timeout)
             client_socket.sendall(datagram)
             self.logger.debug("Datagram sent, waiting for response...")
 
-            # 2. 응답 수신 (한 번에 수신, 최대 4096 바이트까지)
-            data = client_socket.recv(4096)
-            if not data:
-                raise ValueError("서버에서 응답이 없습니다 (빈 응답)")
+            # 응답 수신 (프레임 완료 또는 read deadline까지 누적)
+            reader = FrameReader(
+                client_socket,
+                max_frame_size=self.max_frame_size,
+                read_timeout=read_timeout,
+                chunk_size=self.SOCKET_BYTE,
+            )
+            payload = codec.decode(reader.read(), self.max_frame_size)
+            self.logger.debug(f"Received response successfully. ({len(payload)} bytes)")
+            return orjson.loads(payload)
+
+        finally:
+            client_socket.close()
+            self.logger.debug("Socket closed")
+
+    def negotiate(self) -> PayloadCodec:
+        """바이너리 프레임 및 zstd 사전 ID 협상 후 이번 요청에 사용할 코덱 반환
+
+        서버 응답 예: {"status_code": 200, "raw_frames": true, "zstd_dict_id": 123}
+        서버가 거부하거나 hello_timeout 안에 응답하지 않으면(<END> 없는 HELLO를
+        기다리는 legacy 서버) 기존 base64 방식으로 고정한다. 연결 거부/리셋일 때만
+        이번 요청을 base64 방식으로 보내고 다음 요청에서 다시 협상한다.
+        """
+        if self._negotiated:
+            return self.codec
+
+        try:
+            reply = self._exchange(
+                self.codec.hello_frame(), read_timeout=self.hello_timeout
+            )
+        except ConnectionError as e:
+            self.logger.warning(f"프레임 협상 실패 → 다음 요청에서 재협상: {e}")
+            return self.codec.as_legacy()
+        except Exception as e:
+            self.logger.warning(f"바이너리 프레임 미지원 서버 → legacy 모드 사용: {e}")
+            reply = {}
 
-            message_str = data.decode(errors="replace").strip()
-            self.logger.debug("Received response successfully.")
-            message = json.loads(message_str)
-            return message
+        if reply.get("status_code") != 200 or not reply.get("raw_frames"):
+            self.codec = self.codec.as_legacy()
+        elif reply.get("zstd_dict_id") != self.codec.dict_id:
+            self.logger.warning(
+                f"서버 사전 불일치 (client={self.codec.dict_id}, "
+                f"server={reply.get('zstd_dict_id')}) → 사전 없이 전송"
+            )
+            self.codec = self.codec.without_dictionary()
+
+        self.logger.debug(
+            f"협상 완료: raw_frames={self.codec.raw_frames}, dict_id={self.codec.dict_id}"
+        )
+        self._negotiated = True
+        return self.codec
+
+    def request_tcp(self, requests_message):
+        """
+        item을 입력으로 받아 request_message를 만들어 요청하고,
+        정상적인 JSON 응답을 반환
+        """
+        codec = self.negotiate()
+
+        try:
+            # 요청 메시지 압축 + 프레이밍
+            datagram = codec.encode(dumps(requests_message))
+            with MetricsRegistry.instance().timer("notifier_rtt_seconds"):
+                return self._exchange(datagram, codec)
 
         except Exception as e:
+            MetricsRegistry.instance().inc("notifier_errors_total")
             self.logger.error(f"TCP 오류: {e}")
             raise
-
-        finally:
-            client_socket.close()
-            self.logger.debug("Socket closed")
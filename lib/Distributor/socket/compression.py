@@ -0,0 +1,177 @@
+import argparse
+import base64
+import glob
+import os
+import struct
+from uuid import uuid4
+
+import zstandard as zstd
+
+from lib.Config.config import Config
+
+# 바이너리 프레임: magic(4) | flags(1) | dict_id(4) | length(4) | zstd payload
+FRAME_MAGIC = b"COB1"
+FRAME_HEADER = struct.Struct("!4sBII")
+FLAG_HELLO = 0x01  # 사전 협상 요청 (payload 없음)
+FLAG_DICT = 0x02  # payload가 사전으로 압축됨
+
+LEGACY_TERMINATOR = b"<END>"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def load_dictionary(path: str) -> zstd.ZstdCompressionDict:
+    """학습된 zstd 사전을 파일에서 로드"""
+    with open(path, "rb") as f:
+        return zstd.ZstdCompressionDict(f.read())
+
+
+def train_dictionary(samples: list[bytes], dict_size: int = 16384):
+    """notifier 페이로드 샘플로 zstd 사전 학습
+
+    Args:
+        samples (list[bytes]): 직렬화된 요청 메시지 샘플.
+        dict_size (int): 사전 최대 크기 (bytes).
+
+    Returns:
+        zstd.ZstdCompressionDict: 학습된 사전.
+    """
+    if len(samples) < 10:
+        raise ValueError(f"학습 샘플 부족: {len(samples)}개 (최소 10개)")
+    return zstd.train_dictionary(dict_size, samples)
+
+
+class PayloadCodec:
+    """요청 페이로드 압축 및 프레이밍 코덱
+
+    - legacy: base64(zstd(json)) + <END> (기존 서버 호환)
+    - raw_frames: 길이 헤더가 붙은 바이너리 프레임, 선택적으로 학습된 사전 사용
+    """
+
+    def __init__(
+        self,
+        level: int = 9,
+        dictionary: zstd.ZstdCompressionDict | None = None,
+        raw_frames: bool = False,
+        capture_dir: str | None = None,
+        capture_max_files: int = 1000,
+        capture_max_bytes: int = 1024 * 1024,
+    ):
+        self.level = level
+        self.dictionary = dictionary
+        self.raw_frames = raw_frames
+        self.capture_dir = capture_dir
+        self.capture_max_files = capture_max_files
+        self.capture_max_bytes = capture_max_bytes
+        self._captured = None  # capture_dir의 샘플 수 (첫 저장 시 계산)
+
+        if dictionary is not None:
+            dictionary.precompute_compress(level=level)
+            self.cctx = zstd.ZstdCompressor(level=level, dict_data=dictionary)
+            self.dctx = zstd.ZstdDecompressor(dict_data=dictionary)
+        else:
+            self.cctx = zstd.ZstdCompressor(level=level)
+            self.dctx = zstd.ZstdDecompressor()
+
+    @classmethod
+    def from_config(cls) -> "PayloadCodec":
+        """settings.yaml의 socket.compression 설정으로 코덱 생성"""
+        options = Config.get("socket.compression", {}) or {}
+        dict_path = options.get("dictionary")
+
+        return cls(
+            level=options.get("level", 9),
+            dictionary=load_dictionary(dict_path) if dict_path else None,
+            raw_frames=options.get("raw_frames", False),
+            capture_dir=options.get("capture_dir"),
+            capture_max_files=options.get("capture_max_files", 1000),
+            capture_max_bytes=options.get("capture_max_bytes", 1024 * 1024),
+        )
+
+    @property
+    def dict_id(self) -> int:
+        return self.dictionary.dict_id() if self.dictionary is not None else 0
+
+    def without_dictionary(self) -> "PayloadCodec":
+        """서버가 사전을 거부했을 때 사용할 사전 없는 코덱"""
+        return PayloadCodec(self.level, None, self.raw_frames, *self._capture_options())
+
+    def as_legacy(self) -> "PayloadCodec":
+        """서버가 바이너리 프레임을 지원하지 않을 때 사용할 기존 방식 코덱"""
+        return PayloadCodec(self.level, None, False, *self._capture_options())
+
+    def _capture_options(self) -> tuple:
+        return self.capture_dir, self.capture_max_files, self.capture_max_bytes
+
+    def hello_frame(self) -> bytes:
+        """사전 ID 협상용 프레임"""
+        flags = FLAG_HELLO | (FLAG_DICT if self.dictionary is not None else 0)
+        return FRAME_HEADER.pack(FRAME_MAGIC, flags, self.dict_id, 0)
+
+    def encode(self, payload: bytes) -> bytes:
+        """직렬화된 요청 메시지를 전송용 datagram으로 변환"""
+        if self.capture_dir:
+            self._capture(payload)
+
+        compressed = self.cctx.compress(payload)
+        if not self.raw_frames:
+            return base64.b64encode(compressed) + LEGACY_TERMINATOR
+
+        flags = FLAG_DICT if self.dictionary is not None else 0
+        header = FRAME_HEADER.pack(FRAME_MAGIC, flags, self.dict_id, len(compressed))
+        return header + compressed
+
+    def decode(self, payload: bytes, max_size: int) -> bytes:
+        """응답 payload 복원 (zstd 압축된 응답이면 해제, 아니면 그대로)"""
+        if payload[:4] != ZSTD_MAGIC:
+            return payload
+        return self.dctx.decompress(payload, max_output_size=max_size)
+
+    def _capture(self, payload: bytes):
+        """사전 학습용 샘플 저장 (capture_max_bytes 초과 payload 제외, 최대 capture_max_files개)"""
+        if len(payload) > self.capture_max_bytes:
+            return
+        if self._captured is None:
+            os.makedirs(self.capture_dir, exist_ok=True)
+            self._captured = len(glob.glob(os.path.join(self.capture_dir, "*.json")))
+        if self._captured >= self.capture_max_files:
+            return
+
+        self._captured += 1
+        path = os.path.join(self.capture_dir, f"{uuid4().hex}.json")
+        with open(path, "wb") as f:
+            f.write(payload)
+
+
+def main():
+    """오프라인 사전 학습 CLI
+
+    python -m lib.Distributor.socket.compression --samples Datas/zstd_samples --out notifier.dict
+    """
+    parser = argparse.ArgumentParser(description="notifier 페이로드 zstd 사전 학습")
+    parser.add_argument("--samples", required=True, help="샘플 JSON 디렉토리")
+    parser.add_argument("--out", required=True, help="저장할 사전 파일 경로")
+    parser.add_argument("--size", type=int, default=16384, help="사전 크기 (bytes)")
+    parser.add_argument("--level", type=int, default=9, help="비교용 압축 레벨")
+    args = parser.parse_args()
+
+    samples = []
+    for path in sorted(glob.glob(os.path.join(args.samples, "*.json"))):
+        with open(path, "rb") as f:
+            samples.append(f.read())
+
+    dictionary = train_dictionary(samples, args.size)
+    with open(args.out, "wb") as f:
+        f.write(dictionary.as_bytes())
+
+    plain = zstd.ZstdCompressor(level=args.level)
+    trained = zstd.ZstdCompressor(level=args.level, dict_data=dictionary)
+    raw = sum(len(s) for s in samples)
+    before = sum(len(plain.compress(s)) for s in samples)
+    after = sum(len(trained.compress(s)) for s in samples)
+
+    print(f"dict_id={dictionary.dict_id()} samples={len(samples)}")
+    print(f"raw={raw}B zstd={before}B zstd+dict={after}B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import socket
+import time
+
+import orjson
+
+from lib.Distributor.socket.compression import (
+    FRAME_HEADER,
+    FRAME_MAGIC,
+    LEGACY_TERMINATOR,
+)
+
+
+class FrameTooLarge(ValueError):
+    """응답 프레임이 최대 크기를 초과했을 때 발생"""
+
+
+class FrameReader:
+    """소켓 응답을 프레임 단위로 누적해서 읽는 리더
+
+    다음 중 먼저 만족하는 조건에서 프레임을 완료한다.
+    - 바이너리 프레임: 헤더에 선언된 길이만큼 수신
+    - 종료 토큰(<END>) 수신
+    - 종료 토큰 없는 기존 JSON 응답: 완결된 JSON 수신 또는 연결 종료
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        max_frame_size: int = 8 * 1024 * 1024,
+        read_timeout: float = 60.0,
+        chunk_size: int = 4096,
+    ):
+        self.sock = sock
+        self.max_frame_size = max_frame_size
+        self.read_timeout = read_timeout
+        self.chunk_size = chunk_size
+
+    def read(self) -> bytes:
+        """프레임 payload 반환
+
+        Raises:
+            TimeoutError: read deadline 초과.
+            FrameTooLarge: 최대 프레임 크기 초과.
+            ValueError: 서버가 아무것도 보내지 않고 연결을 종료.
+        """
+        deadline = time.monotonic() + self.read_timeout
+        buffer = bytearray(self.chunk_size * 4)
+        view = memoryview(buffer)
+        filled = 0
+        expected = None  # 바이너리 프레임의 전체 길이 (헤더 포함)
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"응답 대기 시간 초과 ({self.read_timeout}s)")
+                self.sock.settimeout(remaining)
+
+                if filled == len(buffer):
+                    if len(buffer) >= self.max_frame_size + FRAME_HEADER.size:
+                        raise FrameTooLarge(
+                            f"응답 크기 초과 (max {self.max_frame_size} bytes)"
+                        )
+                    view.release()
+                    buffer.extend(bytes(len(buffer)))  # 2배 확장
+                    view = memoryview(buffer)
+
+                try:
+                    received = self.sock.recv_into(view[filled:])
+                except socket.timeout:
+                    raise TimeoutError(f"응답 대기 시간 초과 ({self.read_timeout}s)")
+
+                if received == 0:  # 연결 종료
+                    if filled == 0:
+                        raise ValueError("서버에서 응답이 없습니다 (빈 응답)")
+                    if expected is not None and filled < expected:
+                        raise ValueError(
+                            f"프레임 수신 중 연결 종료 ({filled}/{expected})"
+                        )
+                    return bytes(view[:filled]).strip()
+
+                scan_from = max(0, filled - len(LEGACY_TERMINATOR) + 1)
+                filled += received
+
+                if expected is None and filled >= FRAME_HEADER.size:
+                    if bytes(view[:4]) == FRAME_MAGIC:
+                        _, _, _, length = FRAME_HEADER.unpack_from(buffer)
+                        if length > self.max_frame_size:
+                            raise FrameTooLarge(
+                                f"선언된 응답 크기 초과 ({length} > {self.max_frame_size})"
+                            )
+                        expected = FRAME_HEADER.size + length
+
+                if expected is not None:
+                    if filled >= expected:
+                        return bytes(view[FRAME_HEADER.size : expected])
+                    continue
+
+                end = buffer.find(LEGACY_TERMINATOR, scan_from, filled)
+                if end != -1:
+                    return bytes(view[:end]).strip()
+
+                if filled > self.max_frame_size:
+                    raise FrameTooLarge(
+                        f"응답 크기 초과 (max {self.max_frame_size} bytes)"
+                    )
+
+                if self._is_complete_json(view[:filled]):
+                    return bytes(view[:filled]).strip()
+        finally:
+            view.release()
+
+    @staticmethod
+    def _is_complete_json(data: memoryview) -> bool:
+        """종료 토큰 없는 JSON 응답이 완결되었는지 확인"""
+        tail = bytes(data[-8:]).rstrip()
+        if not tail.endswith(b"}"):
+            return False
+        try:
+            orjson.loads(data)
+            return True
+        except orjson.JSONDecodeError:
+            return False
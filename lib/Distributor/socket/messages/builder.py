@@ -0,0 +1,91 @@
+from typing import Any, Sequence
+
+import numpy as np
+import orjson
+
+
+def float_column(values: Sequence[Any], fill: float | None = None) -> np.ndarray:
+    """DB 결과 컬럼을 float64 배열로 변환
+
+    Args:
+        values (Sequence[Any]): DB 결과 컬럼 (Decimal, int, float, None 혼재 가능).
+        fill (float | None): None/NaN 대체값. None이면 NaN 유지(직렬화 시 null).
+
+    Returns:
+        np.ndarray: 사전 할당된 float64 배열.
+    """
+    column = np.empty(len(values), dtype=np.float64)
+    column[:] = values
+    if fill is not None:
+        np.nan_to_num(column, copy=False, nan=fill)
+    return column
+
+
+def date_column(values: Sequence[Any], unit: str = "D", sep: str = " ") -> list[str]:
+    """DB 결과 날짜 컬럼을 문자열 리스트로 변환 (None → 빈 문자열)
+
+    Args:
+        values (Sequence[Any]): datetime/date 컬럼.
+        unit (str): 출력 단위 ("D": yyyy-mm-dd, "s": yyyy-mm-dd HH:MM:SS).
+        sep (str): 날짜와 시간 사이 구분자.
+    """
+    stamps = np.asarray(values, dtype=f"datetime64[{unit}]")
+    strings = np.datetime_as_string(stamps, unit=unit)
+    strings[np.isnat(stamps)] = ""
+    if unit != "D":
+        strings = np.char.replace(strings, "T", sep)
+    return strings.tolist()
+
+
+def transpose(rows: Sequence[Sequence[Any]], width: int) -> list[tuple]:
+    """행 단위 DB 결과를 컬럼 단위로 전치"""
+    if not rows:
+        return [()] * width
+    return list(zip(*rows))
+
+
+def is_empty_section(section: dict | None) -> bool:
+    """섹션의 모든 컬럼이 비어 있는지 확인"""
+    if not section:
+        return True
+    return not any(len(column) for column in section.values())
+
+
+def new_item(event_type: str, **sections) -> dict:
+    """deepcopy 없이 요청 item 생성"""
+    return {"event_type": event_type, "data": sections}
+
+
+def dumps(message: dict) -> bytes:
+    """요청 메시지를 JSON bytes로 직렬화 (NumPy 배열 직접 지원)"""
+    return orjson.dumps(
+        message, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+
+
+class RequestMessageBuilder:
+    """요청 템플릿의 header를 공유하며 메시지를 조립하는 빌더"""
+
+    def __init__(self, template: dict):
+        # header는 읽기 전용으로 공유 (메시지마다 복사하지 않음)
+        self.header = template["header"]
+
+    def build(self, item: dict | None) -> dict:
+        return {"header": self.header, "body": {"item": item}}
+
+    def build_batch(self, entries: list[tuple[str, str, dict]]) -> dict:
+        """여러 item을 담는 배치 메시지 생성
+
+        entries는 (crawling_id, ticker, item) 목록이다. 응답은
+        {"status_code": 200, "items": [{"crawling_id", "ticker", "status_code", "result"}]}
+        형식이며, 각 결과는 (crawling_id, ticker)로 요청 item과 매칭된다.
+        """
+        return {
+            "header": self.header,
+            "body": {
+                "items": [
+                    {"crawling_id": crawling_id, "ticker": ticker, "item": item}
+                    for crawling_id, ticker, item in entries
+                ]
+            },
+        }
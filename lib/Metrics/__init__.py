@@ -0,0 +1,3 @@
+from lib.Metrics.registry import MetricsRegistry
+
+__all__ = ["MetricsRegistry"]
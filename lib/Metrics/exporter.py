@@ -0,0 +1,111 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from lib.Config.config import Config
+from lib.Logger.logger import get_logger
+from lib.Metrics.registry import MetricsRegistry
+
+
+def _make_handler(registry: MetricsRegistry):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body = registry.render_prometheus().encode()
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif self.path == "/metrics.json":
+                body = json.dumps(registry.snapshot(), ensure_ascii=False).encode()
+                content_type = "application/json"
+            else:
+                self.send_error(404)
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # 요청마다 stderr에 출력하지 않음
+
+    return MetricsHandler
+
+
+class MetricsExporter:
+    """계측 값을 외부로 노출
+
+    - port 지정 시 로컬 HTTP 서버: /metrics (Prometheus text), /metrics.json
+    - dump_path 지정 시 dump_interval 초마다 JSON 파일로 덤프
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        host: str = "127.0.0.1",
+        port: int | None = None,
+        dump_path: str | None = None,
+        dump_interval: float = 60.0,
+    ):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.dump_path = dump_path
+        self.dump_interval = dump_interval
+        self.logger = get_logger("MetricsExporter")
+        self.server = None
+        self._stop = threading.Event()
+
+    @classmethod
+    def from_config(cls) -> "MetricsExporter | None":
+        """metrics 설정으로 생성 (비활성화 시 None)"""
+        options = Config.get("metrics", {}) or {}
+        if not options.get("enabled", False):
+            return None
+        return cls(
+            MetricsRegistry.instance(),
+            host=options.get("host", "127.0.0.1"),
+            port=options.get("port", 9108),
+            dump_path=options.get("dump_path"),
+            dump_interval=options.get("dump_interval", 60),
+        )
+
+    def start(self):
+        if self.port is not None:
+            self.server = ThreadingHTTPServer(
+                (self.host, self.port), _make_handler(self.registry)
+            )
+            self.port = self.server.server_address[1]  # port 0이면 임의 포트
+            threading.Thread(
+                target=self.server.serve_forever, name="MetricsServer", daemon=True
+            ).start()
+            self.logger.info(f"metrics 노출 - http://{self.host}:{self.port}/metrics")
+
+        if self.dump_path:
+            threading.Thread(
+                target=self._dump_loop, name="MetricsDump", daemon=True
+            ).start()
+
+    def dump(self):
+        """현재 값을 JSON 파일로 기록 (임시 파일 기록 후 교체)"""
+        os.makedirs(os.path.dirname(self.dump_path) or ".", exist_ok=True)
+        temp_path = f"{self.dump_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.registry.snapshot(), f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.dump_path)
+
+    def _dump_loop(self):
+        while not self._stop.wait(self.dump_interval):
+            try:
+                self.dump()
+            except Exception as e:
+                self.logger.error(f"metrics 덤프 실패 → {type(e).__name__}: {e}")
+
+    def stop(self):
+        self._stop.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        if self.dump_path:
+            self.dump()  # 종료 시점 값 기록
@@ -0,0 +1,215 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+from lib.Config.config import Config
+from lib.Logger.logger import get_logger
+
+PROFILE_MODES = ("cprofile", "sampling")
+
+
+class SamplingProfiler:
+    """sys._current_frames()를 주기적으로 읽는 저부하 샘플링 프로파일러
+
+    측정 대상 스레드에 hook을 걸지 않으므로 작업자 스레드 풀까지 포함해
+    모든 스레드의 호출 스택을 "스레드;함수;함수 ... 횟수" (collapsed) 형식으로 집계한다.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples = 0
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="SamplingProfiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(
+                        f"{code.co_name} ({os.path.basename(code.co_filename)}:"
+                        f"{code.co_firstlineno})"
+                    )
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """flamegraph 도구용 collapsed stack 텍스트"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+    def summary(self, top: int = 40) -> str:
+        """함수별 self/total 샘플 수 상위 목록"""
+        own, total = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")[1:]  # 첫 항목은 스레드 이름
+            if not frames:
+                continue
+            own[frames[-1]] += count
+            for frame in set(frames):
+                total[frame] += count
+
+        lines = [f"samples: {self.samples} (interval {self.interval}s)", ""]
+        lines.append(f"{'self':>8} {'total':>8}  function")
+        for frame, count in total.most_common(top):
+            lines.append(f"{own[frame]:>8} {count:>8}  {frame}")
+        return "\n".join(lines) + "\n"
+
+
+class CycleProfiler:
+    """설정으로 지정한 크롤러/notifier의 다음 N회 실행 주기를 프로파일링
+
+    profiling.targets의 {이름: 횟수} 항목이 바뀌면 그 시점부터 N회를 측정한다.
+    settings.yaml은 변경 시 다시 읽히므로 서비스 재시작 없이 켜고 끌 수 있다.
+    결과는 output_dir에 <이름>-<시각>-cycle<k> 이름으로
+    .prof / .collapsed (원본), .txt (요약), .json (주기 메타데이터)로 기록된다.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.logger = get_logger("CycleProfiler")
+        self._seen: dict[str, object] = {}  # 이름 → 마지막으로 반영한 설정 값
+        self._remaining: dict[str, int] = {}
+        self._cycles: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "CycleProfiler":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _options(self) -> dict:
+        return Config.get("profiling", {}) or {}
+
+    def _claim(self, name: str, options: dict) -> int | None:
+        """이번 주기를 측정할지 결정
+
+        Returns:
+            int | None: 측정할 경우 이 이름의 몇 번째 측정 주기인지, 아니면 None.
+        """
+        requested = (options.get("targets") or {}).get(name)
+        with self._lock:
+            if requested != self._seen.get(name):
+                self._seen[name] = requested
+                self._remaining[name] = int(requested or 0)
+                self._cycles[name] = 0
+
+            if self._remaining.get(name, 0) <= 0:
+                return None
+            self._remaining[name] -= 1
+            self._cycles[name] += 1
+            return self._cycles[name]
+
+    @contextmanager
+    def profile(self, name: str, **metadata):
+        """대상이면 블록 실행을 프로파일링하고 보고서 기록 (아니면 그대로 실행)"""
+        options = self._options()
+        cycle = self._claim(name, options)
+        if cycle is None:
+            yield
+            return
+
+        mode = options.get("mode", "cprofile")
+        if mode not in PROFILE_MODES:
+            self.logger.warning(f"지원하지 않는 프로파일링 방식: {mode} → cprofile")
+            mode = "cprofile"
+
+        if mode == "sampling":
+            profiler = SamplingProfiler(options.get("interval", 0.005))
+            profiler.start()
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        started_at = datetime.now()
+        started = time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            if mode == "sampling":
+                profiler.stop()
+            else:
+                profiler.disable()
+
+            meta = {
+                "name": name,
+                "mode": mode,
+                "cycle": cycle,
+                "remaining": self._remaining.get(name, 0),
+                "started_at": started_at.isoformat(),
+                "duration_sec": round(time.perf_counter() - started, 3),
+                "pid": os.getpid(),
+                "thread": threading.current_thread().name,
+                "error": error,
+                **metadata,
+            }
+            try:
+                path = self._write(profiler, meta, options)
+                self.logger.info(
+                    f"{name} 프로파일 기록 ({cycle}번째, {meta['duration_sec']}s) → {path}"
+                )
+            except Exception as e:
+                self.logger.error(
+                    f"{name} 프로파일 기록 실패 → {type(e).__name__}: {e}"
+                )
+
+    def _write(self, profiler, meta: dict, options: dict) -> str:
+        output_dir = options.get("output_dir", "logs/profiles")
+        top = options.get("top", 40)
+        os.makedirs(output_dir, exist_ok=True)
+
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = os.path.join(output_dir, f"{meta['name']}-{stamp}-cycle{meta['cycle']}")
+
+        if isinstance(profiler, SamplingProfiler):
+            with open(f"{base}.collapsed", "w", encoding="utf-8") as f:
+                f.write(profiler.collapsed())
+            summary = profiler.summary(top)
+        else:
+            profiler.dump_stats(f"{base}.prof")  # snakeviz / pstats로 열람
+            buffer = io.StringIO()
+            pstats.Stats(profiler, stream=buffer).sort_stats("cumulative").print_stats(
+                top
+            )
+            summary = buffer.getvalue()
+
+        with open(f"{base}.txt", "w", encoding="utf-8") as f:
+            f.write(json.dumps(meta, ensure_ascii=False, indent=2) + "\n\n" + summary)
+        with open(f"{base}.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+        return base
@@ -0,0 +1,203 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+# 지연 시간 histogram 기본 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: tuple, extra: tuple = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in pairs
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size  # 구간별 (누적 아님), 마지막은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+
+class MetricsRegistry:
+    """프로세스 공용 계측 저장소 (counter / gauge / histogram)
+
+    - inc: 누적 카운터 (요청 수, 생성 행 수 등)
+    - set_gauge / gauge_callback: 현재 값 (큐 깊이 등, callback은 조회 시점에 계산)
+    - observe / timer: 지연 시간 histogram
+
+    이름과 label 조합별로 값을 저장하며 render_prometheus()는 Prometheus text 형식,
+    snapshot()은 JSON 덤프용 dict를 반환한다.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counters: dict[str, dict[tuple, float]] = {}
+        self._gauges: dict[str, dict[tuple, float]] = {}
+        self._callbacks: dict[str, dict[tuple, callable]] = {}
+        self._histograms: dict[str, dict[tuple, _Histogram]] = {}
+        self._help: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "MetricsRegistry":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    # ── 기록 ────────────────────────────────────────────────────────────
+    def describe(self, name: str, help_text: str):
+        self._help[name] = help_text
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, **labels):
+        with self._lock:
+            self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def gauge_callback(self, name: str, fn, **labels):
+        """조회 시점에 fn()을 호출해 값을 구하는 gauge 등록"""
+        with self._lock:
+            self._callbacks.setdefault(name, {})[_label_key(labels)] = fn
+
+    def observe(self, name: str, value: float, **labels):
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = _Histogram(len(self.buckets) + 1)
+            hist.counts[index] += 1
+            hist.sum += value
+            hist.count += 1
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """블록 실행 시간을 histogram에 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    # ── 조회 ────────────────────────────────────────────────────────────
+    def _copy(self) -> tuple[dict, dict]:
+        """counter / histogram 값 복사본 (조회 중 기록과 경합하지 않도록)"""
+        with self._lock:
+            counters = {n: dict(s) for n, s in self._counters.items()}
+            histograms = {
+                name: {
+                    key: (list(h.counts), h.sum, h.count) for key, h in series.items()
+                }
+                for name, series in self._histograms.items()
+            }
+        return counters, histograms
+
+    def _gauge_values(self) -> dict[str, dict[tuple, float]]:
+        with self._lock:
+            gauges = {name: dict(series) for name, series in self._gauges.items()}
+            callbacks = {name: dict(series) for name, series in self._callbacks.items()}
+        for name, series in callbacks.items():
+            for key, fn in series.items():
+                try:
+                    gauges.setdefault(name, {})[key] = float(fn())
+                except Exception:
+                    continue  # 수집 실패한 gauge는 생략
+        return gauges
+
+    def snapshot(self) -> dict:
+        """JSON 덤프용 현재 값
+
+        Returns:
+            dict: {"counters"|"gauges": {이름: [{labels, value}]},
+                   "histograms": {이름: [{labels, count, sum, avg, buckets}]}}.
+        """
+        counters, histograms = self._copy()
+
+        def entries(series):
+            return [
+                {"labels": dict(key), "value": value} for key, value in series.items()
+            ]
+
+        bounds = [str(b) for b in self.buckets] + ["+Inf"]
+        return {
+            "timestamp": time.time(),
+            "counters": {name: entries(s) for name, s in counters.items()},
+            "gauges": {name: entries(s) for name, s in self._gauge_values().items()},
+            "histograms": {
+                name: [
+                    {
+                        "labels": dict(key),
+                        "count": count,
+                        "sum": total,
+                        "avg": total / count if count else 0.0,
+                        "buckets": dict(zip(bounds, counts)),
+                    }
+                    for key, (counts, total, count) in series.items()
+                ]
+                for name, series in histograms.items()
+            },
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition 형식 (version 0.0.4)"""
+        lines = []
+
+        def header(name: str, kind: str):
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        counters, histograms = self._copy()
+
+        for name, series in sorted(counters.items()):
+            header(name, "counter")
+            for key, value in series.items():
+                lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+
+        for name, series in sorted(self._gauge_values().items()):
+            header(name, "gauge")
+            for key, value in series.items():
+                lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for name, series in sorted(histograms.items()):
+            header(name, "histogram")
+            for key, (counts, total, count) in series.items():
+                cumulative = 0
+                for bound, bucket_count in zip(bounds, counts):
+                    cumulative += bucket_count
+                    labels = _format_labels(key, (("le", bound),))
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(key)} {_format_value(total)}")
+                lines.append(f"{name}_count{_format_labels(key)} {count}")
+
+        return "\n".join(lines) + "\n"
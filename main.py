@@ -1,10 +1,11 @@
+import signal
+import sys
 from threading import Thread
 
 
 # Import local modules
-from lib.Crawling import run as run_crawling  # 크롤링 실행 함수
+# 크롤러/notifier 모듈은 run_condition에서 켜진 것만 run()에서 import (지연 로드)
 from lib.Config.config import Config  # 설정 로드
-from lib.Distributor.notifier import run as run_notifier  # notifier
 from lib.Logger.logger import get_logger
 
 
@@ -15,17 +16,50 @@ def run():
     logger = get_logger("Main")
     logger.register_global_hooks()
 
-    if Config.get("run_condition.crawler", True):
-        threads.append(Thread(target=run_crawling, name="CrawlerThread"))
+    crawler_enabled = Config.get("run_condition.crawler", True)
+    notifier_enabled = Config.get("run_condition.notifier", True)
 
-    if Config.get("run_condition.notifier", True):
-        threads.append(Thread(target=run_notifier, name="NotifierThread"))
+    # 프로세스 공용 Secretary 생성 및 커넥션 풀 예열 (크롤링 결과 저장용)
+    if crawler_enabled:
+        from lib.Distributor.secretary.Secretary import Secretary
+
+        Secretary.instance()
+
+    # 계측 값 노출 (metrics.enabled일 때 /metrics 서버 및 JSON 덤프)
+    from lib.Metrics.exporter import MetricsExporter
+
+    exporter = MetricsExporter.from_config()
+    if exporter is not None:
+        exporter.start()
+
+    # SIGTERM(docker stop)도 정상 종료 경로를 거치도록 변환
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    if crawler_enabled:
+        from lib.Crawling import run as run_crawling  # 크롤링 실행 함수
+
+        threads.append(Thread(target=run_crawling, name="CrawlerThread", daemon=True))
+
+    if notifier_enabled:
+        from lib.Distributor.notifier import run as run_notifier  # notifier
+
+        threads.append(Thread(target=run_notifier, name="NotifierThread", daemon=True))
 
     for t in threads:
         t.start()
 
-    for t in threads:
-        t.join()
+    try:
+        for t in threads:
+            t.join()
+    finally:
+        # write-behind 대기열에 남은 결과 저장
+        if crawler_enabled:
+            from lib.Distributor.secretary.writer import WriteBehindQueue
+
+            WriteBehindQueue.shutdown_all()
+
+        if exporter is not None:
+            exporter.stop()
 
 
 def main():
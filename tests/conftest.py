@@ -0,0 +1,14 @@
+import os
+import pytest
+from unittest.mock import patch
+import lib.Config.config as config
+
+# 테스트 설정 파일 경로
+TEST_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "test_settings.yaml")
+
+
+@pytest.fixture(autouse=True)
+def patch_config_path():
+    """모든 테스트에서 Config 설정 파일 경로를 테스트용으로 패치"""
+    with patch.object(config.Config, "_config_path", TEST_CONFIG_PATH):
+        yield
@@ -0,0 +1,32 @@
+import glob
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+
+def _result(title, posted_at):
+    return {
+        "tag": "news",
+        "log": {"crawling_type": "news", "status_code": 200},
+        "df": [{"title": title, "posted_at": pd.Timestamp(posted_at), "score": 1.5}],
+    }
+
+
+def test_partitions_by_tag_and_date_and_compacts(tmp_path):
+    """태그/날짜 파티션으로 기록하고 임계치에서 하나의 파일로 병합하는지 테스트"""
+    from lib.Crawling.utils.columnar import ColumnarStore  # 설정 패치 이후 import
+
+    store = ColumnarStore(str(tmp_path), file_format="parquet", compact_threshold=3)
+
+    for i in range(3):
+        store.write([_result(f"a{i}", "2025-05-01 09:00"), _result("b", "2025-05-02")])
+
+    first = glob.glob(os.path.join(tmp_path, "news", "date=2025-05-01", "*.parquet"))
+    assert len(first) == 1 and os.path.basename(first[0]).startswith("compact-")
+
+    table = store._read_table(first[0]).to_pandas()
+    assert sorted(table["title"]) == ["a0", "a1", "a2"]
+    assert str(table["posted_at"].dtype).startswith("datetime64")
@@ -0,0 +1,55 @@
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def concurrency():
+    from lib.Crawling.utils import concurrency  # 설정 패치 이후 import
+
+    return concurrency
+
+
+def test_limiter_increases_on_success_and_halves_on_throttle(concurrency):
+    """성공 누적 시 1씩 증가하고 rate limit 시 절반으로 줄어드는지 테스트"""
+    limiter = concurrency.AdaptiveLimiter(initial=4, minimum=1, maximum=6)
+
+    for _ in range(4 + 5):
+        limiter.on_success()
+    assert limiter.limit == 6
+
+    assert limiter.on_throttle() == 3
+    assert limiter.on_throttle() == 1
+    assert limiter.on_throttle() == 1
+
+
+def test_limiter_bounds_concurrency(concurrency):
+    """동시에 slot에 들어간 작업 수가 limit을 넘지 않는지 테스트"""
+    limiter = concurrency.AdaptiveLimiter(initial=2, maximum=2)
+    active, peak = 0, 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal active, peak
+        with limiter.slot():
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak == 2
+
+
+def test_is_throttled(concurrency):
+    """429/401 응답 예외를 rate limit으로 판별하는지 테스트"""
+    assert concurrency.is_throttled(Exception("429 Client Error: Too Many Requests"))
+    assert concurrency.is_throttled(Exception("401 Unauthorized: Invalid Crumb"))
+    assert not concurrency.is_throttled(ValueError("No data found"))
@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+from lib.Crawling.Interfaces.CrawlResult import (
+    CrawlLog,
+    CrawlResult,
+    InvalidCrawlResult,
+)
+
+
+def test_malformed_results_are_rejected_on_creation():
+    """잘못된 결과는 생성 시점에 InvalidCrawlResult로 걸러지는지 테스트"""
+    log = CrawlLog("stock", 200)
+    malformed = [
+        lambda: CrawlResult("", log, df=[]),
+        lambda: CrawlResult("stock", {"crawling_type": "stock"}, df=[]),
+        lambda: CrawlResult("stock", log, df=[{"a": 1}], fail_log={"err_message": "x"}),
+        lambda: CrawlResult("stock", log, fail_log={"reason": "x"}),
+        lambda: CrawlResult("stock", log, df=[("a", 1)]),
+        lambda: CrawlResult("stock", log, df="a,b"),
+        lambda: CrawlLog("stock", "200"),
+        lambda: CrawlResult.from_dict({"tag": "stock", "df": []}),
+        lambda: CrawlResult.from_dict({"tag": "stock", "log": {}, "extra": 1}),
+    ]
+    for build in malformed:
+        with pytest.raises(InvalidCrawlResult):
+            build()
+
+    result = CrawlResult.success("stock", pd.DataFrame({"a": [1]}))
+    assert not hasattr(result, "__dict__") and not hasattr(result.log, "__dict__")
+
+
+def test_dict_adapter_round_trip():
+    """dict 형식과 상호 변환되고 dict처럼 읽는 코드도 동작하는지 테스트"""
+    legacy = {
+        "tag": "macro",
+        "log": {"crawling_type": "macro", "status_code": 500, "target_url": "Fred_API"},
+        "fail_log": {"index_name": "GDP", "err_message": "timeout"},
+    }
+    result = CrawlResult.from_dict(legacy)
+
+    assert result.failed and result.log.status_code == 500
+    assert result.to_dict() == legacy
+    assert "fail_log" in result and "df" not in result
+    assert result["log"]["target_url"] == "Fred_API"
+    assert result.get("df", []) == []
+    assert CrawlResult.coerce(result) is result
+
+
+def test_secretary_drops_malformed_results_with_their_ids():
+    """Secretary가 잘못된 결과를 crawling_id와 함께 제외하는지 테스트"""
+    from lib.Distributor.secretary.Secretary import Secretary
+
+    rows = [{"Symbol": "AAPL"}]
+    results, ids = Secretary()._coerce_results(
+        [
+            {"tag": "cash_flow", "log": {"status_code": 200}, "df": rows},
+            {
+                "tag": "cash_flow",
+                "log": {"crawling_type": "financials", "status_code": 200},
+                "df": rows,
+            },
+            CrawlResult.success("cash_flow", rows, crawling_type="financials"),
+        ],
+        ["id-a", "id-b", "id-c"],
+    )
+
+    assert ids == ["id-b", "id-c"]
+    assert all(isinstance(r, CrawlResult) for r in results)
@@ -0,0 +1,101 @@
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def secretary():
+    """sqlite 메모리 DB에 재무제표 관련 테이블만 생성"""
+    from lib.Distributor.secretary.Secretary import Secretary
+    from lib.Distributor.secretary.models.core import Base, CrawlingLog, FailLog
+    from lib.Distributor.secretary.models.financials import (
+        BalanceSheet,
+        CashFlow,
+        FinancialStatement,
+        IncomeStatement,
+    )
+    from lib.Distributor.secretary.session import engine
+
+    tables = [
+        CrawlingLog.__table__,
+        FailLog.__table__,
+        FinancialStatement.__table__,
+        IncomeStatement.__table__,
+        BalanceSheet.__table__,
+        CashFlow.__table__,
+    ]
+    Base.metadata.create_all(engine, tables=tables)
+    yield Secretary()
+    Base.metadata.drop_all(engine, tables=tables)
+
+
+def _result(tag, symbol, posted_at, **values):
+    row = {
+        "Symbol": symbol,
+        "financial_type": "Q",
+        "posted_at": pd.Timestamp(posted_at),
+    }
+    row.update(values)
+    return {
+        "tag": tag,
+        "log": {"crawling_type": "financials", "status_code": 200},
+        "df": [row],
+    }
+
+
+def test_financial_results_are_stored_in_one_batch(secretary):
+    """기존/중복 재무제표는 건너뛰고 신규 재무제표와 하위 테이블만 일괄 저장하는지 테스트"""
+    from lib.Distributor.secretary.models.core import CrawlingLog
+    from lib.Distributor.secretary.models.financials import (
+        CashFlow,
+        FinancialStatement,
+        IncomeStatement,
+    )
+
+    existing = _result("income_statement", "MSFT", "2025-03-31", **{"Net Income": 1})
+    secretary.distribute([existing])
+
+    results = [
+        _result("income_statement", "AAPL", "2025-03-31", **{"Net Income": 10}),
+        _result("income_statement", "AAPL", "2025-03-31", **{"Net Income": 11}),
+        _result("cash_flow", "AAPL", "2024-12-31", **{"Free Cash Flow": 5}),
+        _result("income_statement", "MSFT", "2025-03-31", **{"Net Income": 2}),
+        {
+            "tag": "cash_flow",
+            "log": {"crawling_type": "financials", "status_code": 404},
+            "fail_log": {"err_message": "no data"},
+        },
+    ]
+    secretary.distribute(results)
+    secretary.distribute(results[:4])  # 재실행 시 추가 저장 없음
+
+    with secretary.session() as db:
+        assert db.query(FinancialStatement).count() == 3
+        assert sorted(v for (v,) in db.query(IncomeStatement.net_income)) == [1, 10]
+        assert db.query(CashFlow.free_cash_flow).scalar() == 5
+        assert db.query(CrawlingLog).count() == 6
+        assert db.get(
+            CrawlingLog,
+            secretary._generate_hash_id("cash_flow", results[2]["df"]),
+        )
+
+
+def test_statement_result_is_split_per_quarter(secretary):
+    """여러 분기가 담긴 재무제표 결과가 분기별 crawling_id로 저장되는지 테스트"""
+    from lib.Distributor.secretary.models.core import CrawlingLog
+    from lib.Distributor.secretary.models.financials import FinancialStatement
+
+    rows = [
+        _result("cash_flow", "AAPL", date, **{"Free Cash Flow": value})["df"][0]
+        for date, value in [("2025-03-31", 7), ("2024-12-31", 5)]
+    ]
+    statement = {
+        "tag": "cash_flow",
+        "log": {"crawling_type": "financials", "status_code": 200},
+        "df": rows,
+    }
+    secretary.distribute([statement])
+
+    with secretary.session() as db:
+        assert db.query(FinancialStatement).count() == 2
+        for row in rows:
+            assert db.get(CrawlingLog, secretary._generate_hash_id("cash_flow", [row]))
@@ -0,0 +1,96 @@
+import math
+
+import pandas as pd
+
+
+def _fill_per_row(row: dict, fields: set) -> dict:
+    """행 단위 파생 계산 (기존 구현과 같은 규칙)"""
+    if "Cash Equivalents" in fields and row.get("Cash Equivalents") is None:
+        if row.get("Cash And Cash Equivalents") is not None:
+            row["Cash Equivalents"] = row["Cash And Cash Equivalents"]
+    ce = row.get("Cash Equivalents") or row.get("Cash And Cash Equivalents")
+    osti = row.get("Other Short Term Investments")
+    for name in ("Cash Financial", "Cash Cash Equivalents And Short Term Investments"):
+        if name in fields and row.get(name) is None:
+            if ce is not None and osti is not None:
+                row[name] = ce + osti
+    tr = row.get("Total Revenue")
+    if "Cost Of Revenue" in fields and row.get("Cost Of Revenue") is None:
+        if tr is not None and row.get("Gross Profit") is not None:
+            row["Cost Of Revenue"] = tr - row["Gross Profit"]
+    if "Gross Profit" in fields and row.get("Gross Profit") is None:
+        if tr is not None and row.get("Cost Of Revenue") is not None:
+            row["Gross Profit"] = tr - row["Cost Of Revenue"]
+    if "EBITDA" in fields and row.get("EBITDA") is None:
+        oi, rd = row.get("Operating Income"), row.get("Reconciled Depreciation")
+        if oi is not None and rd is not None:
+            row["EBITDA"] = oi + rd
+    for field in fields:
+        row.setdefault(field, None)
+    return row
+
+
+def _raw_statement(items: dict) -> pd.DataFrame:
+    """yfinance 형식 원본 제표 (행: 항목, 열: 기준일)"""
+    dates = pd.to_datetime(["2025-03-31", "2024-12-31"])
+    return pd.DataFrame(items, index=dates).T
+
+
+def test_shape_statements_matches_per_row_derivation():
+    """컬럼 연산 가공 결과가 행 단위 계산과 같고 종목별 결과 1건으로 묶이는지 테스트"""
+    from lib.Crawling.Financial.Finance import SECTION_FIELDS, YFinancialCrawler
+    from lib.Logger.logger import get_logger
+
+    crawler = YFinancialCrawler.__new__(YFinancialCrawler)
+    crawler.tag = "financials"
+    crawler.logger = get_logger("test")
+
+    nan = float("nan")
+    frames = [
+        (
+            "AAPL",
+            _raw_statement(
+                {
+                    "Cash And Cash Equivalents": [10.0, 0.0],
+                    "Other Short Term Investments": [5.0, 3.0],
+                }
+            ),
+        ),
+        (
+            "MSFT",
+            _raw_statement(
+                {
+                    "Cash Equivalents": [0.0, nan],
+                    "Cash And Cash Equivalents": [4.0, nan],
+                    "Other Short Term Investments": [1.0, 2.0],
+                    "Inventory": [7.0, 8.0],
+                }
+            ),
+        ),
+        ("EMPTY", pd.DataFrame()),
+    ]
+
+    results = crawler.shape_statements(frames, "balance_sheet")
+
+    failed = [r for r in results if "fail_log" in r]
+    shaped = {r["df"][0]["Symbol"]: r["df"] for r in results if "df" in r}
+    assert len(failed) == 1 and set(shaped) == {"AAPL", "MSFT"}
+
+    fields = SECTION_FIELDS["balance_sheet"]
+    for symbol, df_raw in frames[:2]:
+        latest = crawler.extract_recent_quarters(df_raw, symbol, "balance_sheet")
+        expected = [
+            _fill_per_row(
+                {k: None if pd.isna(v) else v for k, v in row.to_dict().items()},
+                fields,
+            )
+            for _, row in latest.iterrows()
+        ]
+        assert len(shaped[symbol]) == len(expected)
+        for got, want in zip(shaped[symbol], expected):
+            assert got.keys() == want.keys()
+            for key, value in want.items():
+                if isinstance(value, float):
+                    assert math.isclose(got[key], value)
+                else:
+                    assert got[key] == value
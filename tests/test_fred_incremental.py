@@ -0,0 +1,88 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def macro_db():
+    """sqlite 메모리 DB에 거시지표 테이블만 생성"""
+    from lib.Distributor.secretary.models.core import Base, CrawlingLog
+    from lib.Distributor.secretary.models.macro import MacroEconomics, MacroIndex
+    from lib.Distributor.secretary.session import engine, get_session
+
+    tables = [CrawlingLog.__table__, MacroIndex.__table__, MacroEconomics.__table__]
+    Base.metadata.create_all(engine, tables=tables)
+
+    stored = {
+        "GDP": ["2024-07-01", "2024-10-01", "2025-01-01", "2025-01-01"],
+        "CPI": ["2025-03-01"],  # 관측값이 하나뿐 → 기본 기간 사용
+    }
+    with get_session() as db:
+        for index_id, (name, dates) in enumerate(stored.items(), start=1):
+            db.add(MacroIndex(index_id=index_id, index_name=name))
+            for date in dates:
+                db.add(
+                    MacroEconomics(
+                        crawling_id=f"{name}-{date}",
+                        country="US",
+                        index_id=index_id,
+                        index_value=1,
+                        posted_at=datetime.fromisoformat(date),
+                    )
+                )
+        db.commit()
+    yield
+    Base.metadata.drop_all(engine, tables=tables)
+
+
+class StubFred:
+    """observation_start 이후 관측값만 돌려주는 fredapi.Fred 대체"""
+
+    def __init__(self, history: dict[str, list[str]]):
+        self.history = history
+        self.calls = []
+
+    def get_series(self, series_id, **kwargs):
+        self.calls.append((series_id, kwargs.get("observation_start")))
+        dates = pd.to_datetime(self.history[series_id])
+        if "observation_start" in kwargs:
+            dates = dates[dates >= pd.Timestamp(kwargs["observation_start"])]
+        return pd.Series(range(len(dates)), index=dates, dtype=float)
+
+
+def test_only_last_two_stored_observations_are_refetched(macro_db):
+    """저장된 최근 두 관측일부터만 조회하고, 2개 미만이면 전체 이력을 조회하는지 테스트"""
+    from lib.Crawling.Financial.Fred import FredCrawler, get_observation_starts
+
+    starts = get_observation_starts(["GDP", "CPI", "UNRATE"])
+    assert starts == {"GDP": datetime(2024, 10, 1)}
+
+    crawler = FredCrawler("Fred", "test-api-key")
+    crawler.series_dict = {"GDP": "GDP", "CPI": "CPIAUCSL"}
+    crawler.lookback_days = 30  # CPI 기본 조회 기간에는 관측값 1개뿐
+    crawler.fred = StubFred(
+        {
+            "GDP": ["2024-04-01", "2024-07-01", "2024-10-01", "2025-01-01"],
+            "CPIAUCSL": ["2024-01-01", "2024-02-01", datetime.now().date().isoformat()],
+        }
+    )
+
+    results = crawler.crawl()
+
+    calls = {}
+    for series_id, start in crawler.fred.calls:
+        calls.setdefault(series_id, []).append(start)
+    assert calls["GDP"] == ["2024-10-01"]
+    cpi_start, fallback = calls["CPIAUCSL"]
+    assert cpi_start is not None and fallback is None  # 관측값 부족 → 전체 이력
+    posted = sorted(
+        (r["df"]["index_name"][0], r["df"]["posted_at"][0].date().isoformat())
+        for r in results
+    )
+    assert posted == [
+        ("CPI", "2024-02-01"),
+        ("CPI", datetime.now().date().isoformat()),
+        ("GDP", "2024-10-01"),
+        ("GDP", "2025-01-01"),
+    ]
@@ -0,0 +1,71 @@
+import hashlib
+
+import numpy as np
+import orjson
+import pandas as pd
+
+from lib.Distributor.secretary.hashing import ResultHasher
+
+
+def _legacy_hash_id(tag, df):
+    """기존 Secretary._generate_hash_id (재귀 변환 후 sha256)"""
+
+    def convert(obj):
+        if isinstance(obj, pd.Timestamp):
+            return obj.isoformat()
+        if isinstance(obj, dict):
+            return {k: convert(v) for k, v in obj.items()}
+        if isinstance(obj, list):
+            return [convert(i) for i in obj]
+        return obj
+
+    raw_bytes = orjson.dumps(
+        {"tag": tag, "df": convert(df)},
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+    return hashlib.sha256(raw_bytes).hexdigest()
+
+
+ROWS = [
+    {
+        "index_name": "Real GDP",
+        "country": "US",
+        "index_value": "23542.349",
+        "posted_at": pd.Timestamp("2025-01-01"),
+        "extra": {"nested": [pd.Timestamp("2025-01-02 09:30", tz="UTC")], 1: None},
+    }
+]
+
+
+def test_sha256_reproduces_existing_ids():
+    """sha256 모드가 기존 crawling_id와 같은 값을 만드는지 테스트"""
+    assert ResultHasher("sha256").hash_rows("macro", ROWS) == _legacy_hash_id(
+        "macro", ROWS
+    )
+
+
+def test_sha256_frame_ids_match_existing_record_ids():
+    """DataFrame 결과도 sha256에서는 기존 방식(to_dict 행 목록)과 같은 crawling_id인지 테스트"""
+    df = pd.DataFrame(
+        {
+            "Symbol": ["AAPL", "MSFT"],
+            "Close": [201.5, np.nan],
+            "Volume": [1000, 2000],
+            "posted_at": pd.to_datetime(["2025-05-01", "2025-05-02"]),
+        }
+    )
+    legacy = _legacy_hash_id("stock", df.to_dict(orient="records"))
+
+    assert ResultHasher("sha256").hash_frame("stock", df) == legacy
+    assert ResultHasher("blake2b").hash_frame("stock", df) != legacy
+
+
+def test_fast_algorithms_keep_64_hex_and_batch_matches():
+    """blake2b가 64자리 hex를 반환하고, 일괄 해시가 개별 해시와 같은지 테스트"""
+    hasher = ResultHasher("blake2b", key="secret", workers=4, batch_min=2)
+    crawling_id = hasher.hash_rows("macro", ROWS)
+    assert len(crawling_id) == 64 and int(crawling_id, 16) >= 0
+    assert crawling_id != ResultHasher("blake2b").hash_rows("macro", ROWS)
+
+    items = [("macro", [dict(ROWS[0], index_value=str(i))]) for i in range(10)]
+    assert hasher.hash_batch(items) == [hasher.hash(tag, df) for tag, df in items]
@@ -0,0 +1,131 @@
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+@pytest.fixture
+def server():
+    """요청마다 호출 횟수를 본문으로 돌려주는 로컬 HTTP 서버 (/missing은 404)"""
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            status = 404 if self.path.startswith("/missing") else 200
+            body = f'{{"hit": {len(hits)}}}'.encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", hits
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _use(monkeypatch, archive):
+    from lib.Crawling.utils.http_archive import HttpArchive
+
+    monkeypatch.setattr(HttpArchive, "instance", classmethod(lambda cls: archive))
+
+
+def test_session_record_then_replay_without_network(server, tmp_path, monkeypatch):
+    """기록한 응답을 순서대로 재생하고, 무시할 파라미터가 달라도 같은 요청으로 보는지 테스트"""
+    from lib.Crawling.utils.http_archive import ArchiveMiss, HttpArchive
+    from lib.Crawling.utils.http_session import (
+        RateLimitedCurlSession,
+        RateLimitedRequestsSession,
+    )
+
+    base_url, hits = server
+    path = str(tmp_path / "archive.bin")
+
+    recorder = HttpArchive(path, mode="record")
+    _use(monkeypatch, recorder)
+    session = RateLimitedRequestsSession()
+    for _ in range(2):
+        session.get(f"{base_url}/quote", params={"symbol": "AAPL", "crumb": "a"})
+    recorder.close()
+    assert len(hits) == 2
+
+    slept = []
+    replayer = HttpArchive(path, mode="replay", speed=2.0, sleep=slept.append)
+    _use(monkeypatch, replayer)
+    url = f"{base_url}/quote?crumb=b&symbol=AAPL"
+    replayed = [RateLimitedRequestsSession().get(url).json()["hit"] for _ in range(3)]
+
+    assert replayed == [1, 2, 1]  # 기록 순서대로 반복
+    assert len(hits) == 2  # 재생 중에는 서버에 요청하지 않음
+    assert len(slept) == 3 and all(s >= 0 for s in slept)
+
+    response = RateLimitedCurlSession().get(url)
+    assert response.status_code == 200 and response.json() == {"hit": 2}
+
+    with pytest.raises(ArchiveMiss):
+        RateLimitedRequestsSession().get(f"{base_url}/quote?symbol=MSFT")
+
+
+def test_urlopen_record_then_replay(server, tmp_path):
+    """urlopen 요청(fredapi)도 기록/재생되고 오류 응답은 재생 시에도 HTTPError인지 테스트"""
+    from lib.Crawling.utils.http_archive import ArchiveHandler, HttpArchive
+
+    base_url, hits = server
+    path = str(tmp_path / "archive.bin")
+
+    recorder = HttpArchive(path, mode="record")
+    opener = urllib.request.build_opener(ArchiveHandler(recorder))
+    assert opener.open(f"{base_url}/series?id=GDP").read() == b'{"hit": 1}'
+    with pytest.raises(urllib.error.HTTPError):
+        opener.open(f"{base_url}/missing")
+    recorder.close()
+
+    replayer = HttpArchive(path, mode="replay")
+    opener = urllib.request.build_opener(ArchiveHandler(replayer))
+    assert opener.open(f"{base_url}/series?id=GDP").read() == b'{"hit": 1}'
+    with pytest.raises(urllib.error.HTTPError) as e:
+        opener.open(f"{base_url}/missing")
+    assert e.value.code == 404
+    assert len(hits) == 2
+
+
+def test_api_key_is_not_stored_or_part_of_replay_key(server, tmp_path):
+    """api_key는 파일에 기록되지 않고, 다른 key로 재생해도 같은 요청으로 보는지 테스트"""
+    import zstandard as zstd
+
+    from lib.Crawling.utils.http_archive import (
+        RECORD_HEADER,
+        ArchiveHandler,
+        HttpArchive,
+    )
+
+    base_url, hits = server
+    path = tmp_path / "archive.bin"
+
+    recorder = HttpArchive(str(path), mode="record", ignore_params=["crumb"])
+    opener = urllib.request.build_opener(ArchiveHandler(recorder))
+    opener.open(f"{base_url}/series?series_id=GDP&api_key=secret-1").read()
+    recorder.close()
+
+    data, offset, records = path.read_bytes(), 0, []
+    while offset < len(data):
+        length, _ = RECORD_HEADER.unpack_from(data, offset)
+        offset += RECORD_HEADER.size
+        records.append(
+            zstd.ZstdDecompressor().decompress(data[offset : offset + length])
+        )
+        offset += length
+    assert len(records) == 1 and b"secret-1" not in records[0]
+
+    replayer = HttpArchive(str(path), mode="replay")
+    opener = urllib.request.build_opener(ArchiveHandler(replayer))
+    response = opener.open(f"{base_url}/series?series_id=GDP&api_key=secret-2")
+    assert response.read() == b'{"hit": 1}' and len(hits) == 1
@@ -0,0 +1,46 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from lib.Distributor.secretary.id_cache import IdCache
+from lib.Distributor.secretary.models.macro import MacroIndex
+
+
+def _engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ids.db'}")
+    MacroIndex.__table__.create(engine)
+    return engine
+
+
+def test_created_id_is_cached_only_after_commit(tmp_path):
+    """롤백된 트랜잭션에서 만든 id는 캐시되지 않고, 커밋 후에는 조회 없이 반환되는지 테스트"""
+    engine = _engine(tmp_path)
+    cache = IdCache(MacroIndex, "index_name", "index_id")
+
+    with Session(engine) as db:
+        first = cache.get_or_create(db, "Real GDP")
+        assert cache.get_or_create(db, "Real GDP") == first
+        db.rollback()
+    assert len(cache) == 0
+
+    with Session(engine) as db:
+        created = cache.get_or_create(db, "Real GDP")
+        db.commit()
+    assert len(cache) == 1
+
+    with Session(engine) as db:
+        db.execute(MacroIndex.__table__.delete())  # 캐시 적중 시 DB를 보지 않음
+        assert cache.get_or_create(db, "Real GDP") == created
+
+
+def test_concurrent_insert_falls_back_to_existing_row(tmp_path):
+    """다른 프로세스가 먼저 생성해 unique 제약에 걸리면 기존 id를 사용하는지 테스트"""
+    engine = _engine(tmp_path)
+    with Session(engine) as other:
+        other.add(MacroIndex(index_name="CPI"))
+        other.commit()
+        existing = other.query(MacroIndex.index_id).scalar()
+
+    cache = IdCache(MacroIndex, "index_name", "index_id")
+    with Session(engine) as db:
+        assert cache._create(db, "CPI") == existing
+        assert cache.warm(db) == 1
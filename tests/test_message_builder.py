@@ -0,0 +1,64 @@
+import datetime
+from decimal import Decimal
+
+import orjson
+
+from lib.Distributor.socket.messages.builder import (
+    RequestMessageBuilder,
+    date_column,
+    dumps,
+    float_column,
+    is_empty_section,
+    new_item,
+    transpose,
+)
+from lib.Distributor.socket.messages.request import news_requests_message
+
+
+def test_float_column_fill():
+    """None/Decimal이 섞인 컬럼이 float64로 변환되는지 테스트"""
+    rows = [(Decimal("1.5"), None), (Decimal("2"), 3)]
+    first, second = transpose(rows, 2)
+
+    assert float_column(first).tolist() == [1.5, 2.0]
+    assert float_column(second, fill=0.0).tolist() == [0.0, 3.0]
+
+
+def test_date_column_format():
+    """날짜 컬럼이 기존 문자열 형식과 동일하게 변환되는지 테스트"""
+    values = [datetime.datetime(2025, 1, 2, 3, 4, 5), None]
+
+    assert date_column(values) == ["2025-01-02", ""]
+    assert date_column(values, unit="s") == ["2025-01-02 03:04:05", ""]
+
+
+def test_builder_serializes_numpy_without_template_mutation():
+    """템플릿을 변경하지 않고 NumPy 배열을 직렬화하는지 테스트"""
+    builder = RequestMessageBuilder(news_requests_message)
+    item = new_item("news", chart={"o": float_column([1, None])})
+
+    payload = orjson.loads(dumps(builder.build(item)))
+
+    assert payload["body"]["item"]["data"]["chart"]["o"] == [1.0, None]
+    assert payload["header"] == news_requests_message["header"]
+    assert news_requests_message["body"]["item"] == {}
+
+
+def test_is_empty_section():
+    assert is_empty_section({})
+    assert is_empty_section({"a": [], "b": float_column([])})
+    assert not is_empty_section({"a": [None]})
+
+
+def test_build_batch_shares_header_and_keeps_crawling_ids():
+    """배치 메시지가 header를 공유하고 item마다 crawling_id와 ticker를 담는지 테스트"""
+    builder = RequestMessageBuilder(news_requests_message)
+    message = builder.build_batch(
+        [("id-1", "AAPL", {"a": 1}), ("id-1", "MSFT", {"b": 2})]
+    )
+
+    assert message["header"] is news_requests_message["header"]
+    assert message["body"]["items"] == [
+        {"crawling_id": "id-1", "ticker": "AAPL", "item": {"a": 1}},
+        {"crawling_id": "id-1", "ticker": "MSFT", "item": {"b": 2}},
+    ]
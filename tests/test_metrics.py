@@ -0,0 +1,50 @@
+import json
+import urllib.request
+
+from lib.Metrics.registry import MetricsRegistry
+
+
+def test_registry_renders_prometheus_text():
+    """counter/gauge/histogram이 Prometheus text 형식으로 출력되는지 테스트"""
+    registry = MetricsRegistry(buckets=(0.1, 1))
+    registry.inc("crawler_rows_total", 3, crawler="Fred", tag="macro")
+    registry.inc("crawler_rows_total", 2, crawler="Fred", tag="macro")
+    registry.gauge_callback("write_behind_queue_depth", lambda: 7)
+    registry.observe("db_write_seconds", 0.05, handler="stock")
+    registry.observe("db_write_seconds", 2.0, handler="stock")
+
+    text = registry.render_prometheus()
+
+    assert 'crawler_rows_total{crawler="Fred",tag="macro"} 5' in text
+    assert "write_behind_queue_depth 7" in text
+    assert 'db_write_seconds_bucket{handler="stock",le="0.1"} 1' in text
+    assert 'db_write_seconds_bucket{handler="stock",le="1"} 1' in text
+    assert 'db_write_seconds_bucket{handler="stock",le="+Inf"} 2' in text
+    assert 'db_write_seconds_count{handler="stock"} 2' in text
+
+    (entry,) = registry.snapshot()["histograms"]["db_write_seconds"]
+    assert entry["labels"] == {"handler": "stock"}
+    assert entry["avg"] == 1.025
+
+
+def test_exporter_serves_metrics(tmp_path):
+    """로컬 HTTP 서버와 JSON 덤프로 계측 값이 노출되는지 테스트"""
+    from lib.Metrics.exporter import MetricsExporter
+
+    registry = MetricsRegistry()
+    registry.inc("notifier_errors_total")
+    exporter = MetricsExporter(
+        registry, port=0, dump_path=str(tmp_path / "metrics.json")
+    )
+    exporter.start()
+    try:
+        base = f"http://127.0.0.1:{exporter.port}"
+        with urllib.request.urlopen(f"{base}/metrics") as response:
+            assert "notifier_errors_total 1" in response.read().decode()
+        with urllib.request.urlopen(f"{base}/metrics.json") as response:
+            assert json.load(response)["counters"]["notifier_errors_total"]
+    finally:
+        exporter.stop()
+
+    dumped = json.loads((tmp_path / "metrics.json").read_text())
+    assert dumped["counters"]["notifier_errors_total"][0]["value"] == 1
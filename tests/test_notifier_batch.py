@@ -0,0 +1,131 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+import lib.Config.config as config
+
+TEST_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "test_settings.yaml")
+
+
+@pytest.fixture(autouse=True)
+def patch_config_path():
+    """Config 클래스의 설정 파일 경로를 테스트용으로 패치"""
+    with patch.object(config.Config, "_config_path", TEST_CONFIG_PATH):
+        yield
+
+
+class FakeClient:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    def request_tcp(self, message):
+        self.sent.append(message)
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def notifier(monkeypatch):
+    """분석 결과 반영을 기록하는 NotifierBase (DB/소켓 없음)"""
+    from lib.Distributor.notifier import Notifier
+    from lib.Distributor.notifier.Notifier import NotifierBase
+
+    monkeypatch.setattr(Notifier.time, "sleep", lambda s: None)
+    monkeypatch.setattr(NotifierBase, "_batch_supported", True)
+
+    notifier = NotifierBase()
+    notifier.applied = []
+    monkeypatch.setattr(
+        notifier,
+        "update_analysis_log_time",
+        lambda crawling_id, ticker: notifier.applied.append(
+            ("tried", crawling_id, ticker)
+        ),
+    )
+    monkeypatch.setattr(
+        notifier,
+        "_update_analysis",
+        lambda crawling_id, index, source: notifier.applied.append(
+            (crawling_id, index)
+        ),
+    )
+    return notifier
+
+
+def _pending(*crawling_ids, ticker="AAPL"):
+    return [({"crawling_id": c, "ticker": ticker}, {"id": c}) for c in crawling_ids]
+
+
+def _builder():
+    from lib.Distributor.socket.messages.builder import RequestMessageBuilder
+    from lib.Distributor.socket.messages.request import news_requests_message
+
+    return RequestMessageBuilder(news_requests_message)
+
+
+def test_batch_results_are_matched_by_crawling_id(notifier):
+    """응답 순서와 무관하게 crawling_id로 결과를 반영하고 누락/실패 항목은 건너뛰는지 테스트"""
+    notifier.client = FakeClient(
+        {
+            "status_code": 200,
+            "items": [
+                {"crawling_id": "c", "ticker": "AAPL", "status_code": 500},
+                {"crawling_id": "a", "ticker": "AAPL", "result": "2.0"},
+            ],
+        }
+    )
+    notifier._send_batch(_builder(), _pending("a", "b", "c"), "news")
+
+    assert notifier.applied == [("tried", "a", "AAPL"), ("a", 2)]
+    assert [e["crawling_id"] for e in notifier.client.sent[0]["body"]["items"]] == [
+        "a",
+        "b",
+        "c",
+    ]
+
+
+def test_same_crawling_id_is_matched_per_ticker(notifier):
+    """같은 기사(crawling_id)의 종목별 항목이 각자의 결과로 반영되는지 테스트"""
+    notifier.client = FakeClient(
+        {
+            "status_code": 200,
+            "items": [
+                {"crawling_id": "a", "ticker": "MSFT", "status_code": 200, "result": 3},
+                {"crawling_id": "a", "ticker": "AAPL", "status_code": 500},
+            ],
+        }
+    )
+    pending = _pending("a") + _pending("a", ticker="MSFT")
+    notifier._send_batch(_builder(), pending, "news")
+
+    assert notifier.applied == [("tried", "a", "MSFT"), ("a", 3)]
+    assert [
+        (e["crawling_id"], e["ticker"])
+        for e in notifier.client.sent[0]["body"]["items"]
+    ] == [("a", "AAPL"), ("a", "MSFT")]
+
+
+def test_error_envelope_keeps_batch_mode(notifier):
+    """items 없는 오류 응답은 배치 모드를 유지하고, 2xx 응답만 1건 모드로 전환하는지 테스트"""
+    from lib.Distributor.notifier.Notifier import NotifierBase
+
+    notifier.client = FakeClient({"status_code": 500, "message": "busy"})
+    notifier._send_batch(_builder(), _pending("a", "b"), "news")
+
+    assert NotifierBase._batch_supported and notifier.applied == []
+
+    notifier.client = FakeClient(
+        {"status_code": 200, "message": "ok"},
+        {"status_code": 200, "item": {"result": 1}},
+        {"status_code": 200, "item": {"result": 3}},
+    )
+    notifier._send_batch(_builder(), _pending("a", "b"), "news")
+
+    assert not NotifierBase._batch_supported
+    assert notifier.applied == [
+        ("tried", "a", "AAPL"),
+        ("a", 1),
+        ("tried", "b", "AAPL"),
+        ("b", 3),
+    ]
@@ -0,0 +1,40 @@
+import glob
+import json
+import time
+
+from lib.Metrics.profiling import CycleProfiler
+
+
+def _busy():
+    total = 0
+    for i in range(20000):
+        total += i * i
+    time.sleep(0.03)
+    return total
+
+
+def test_profiles_next_n_cycles_and_rearms_on_change(tmp_path):
+    """설정된 횟수만큼만 측정하고, 설정 값이 바뀌면 다시 측정하는지 테스트"""
+    options = {"output_dir": str(tmp_path), "targets": {"Job": 2}}
+    profiler = CycleProfiler()
+    profiler._options = lambda: options
+
+    for _ in range(3):
+        with profiler.profile("Job", crawler_name="job"):
+            _busy()
+        with profiler.profile("Other"):
+            _busy()
+
+    reports = sorted(glob.glob(str(tmp_path / "Job-*.json")))
+    assert len(reports) == 2
+    assert not glob.glob(str(tmp_path / "Other-*"))
+    meta = json.loads(open(reports[0], encoding="utf-8").read())
+    assert meta["mode"] == "cprofile" and meta["crawler_name"] == "job"
+    assert glob.glob(str(tmp_path / "Job-*.prof"))
+
+    options.update(mode="sampling", interval=0.001, targets={"Job": 1})
+    with profiler.profile("Job"):
+        _busy()
+
+    (collapsed,) = glob.glob(str(tmp_path / "Job-*.collapsed"))
+    assert "_busy" in open(collapsed, encoding="utf-8").read()
@@ -0,0 +1,78 @@
+import pytest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def limiter():
+    from lib.Crawling.utils.rate_limit import HostRateLimiter
+
+    clock = FakeClock()
+    return HostRateLimiter(
+        "query1.finance.yahoo.com",
+        rate=2.0,
+        burst=2.0,
+        increase=0.5,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+
+def test_token_bucket_paces_requests(limiter):
+    """burst 이후 요청은 rate 간격으로 대기하는지 테스트"""
+    waits = [limiter.acquire() for _ in range(4)]
+    assert waits == [0.0, 0.0, 0.5, 0.5]
+
+
+def test_rate_is_adjusted_aimd(limiter):
+    """성공 시 가산 증가, 429/5xx 시 절반 감소 (cooldown 내 중복 감소 없음)"""
+    limiter.on_response(200)
+    assert limiter.rate == 2.5
+
+    limiter.on_response(429)
+    limiter.on_response(503)  # 같은 시점의 실패는 한 번만 반영
+    assert limiter.rate == 1.25
+
+    limiter._clock.now += 1.0
+    limiter.on_response(401)
+    assert limiter.rate == 0.625
+
+
+def test_session_mixin_shares_limiter_per_host(monkeypatch):
+    """세션 요청이 호스트별 limiter를 거치고 응답 코드로 rate가 조정되는지 테스트"""
+    from lib.Crawling.utils.rate_limit import (
+        RateLimitedSessionMixin,
+        RateLimiterRegistry,
+    )
+
+    registry = RateLimiterRegistry(
+        {"default": {"rate": 100, "burst": 100}, "hosts": {"a.com": {"rate": 8}}}
+    )
+    monkeypatch.setattr(RateLimiterRegistry, "_instance", registry)
+
+    class Response:
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+    class BaseSession:
+        def request(self, method, url, **kwargs):
+            return Response(kwargs.get("status", 200))
+
+    class Session(RateLimitedSessionMixin, BaseSession):
+        pass
+
+    session = Session()
+    session.request("GET", "https://a.com/x", status=429)
+    session.request("GET", "https://b.com/y")
+
+    assert registry.for_host("a.com").rate == 4
+    assert registry.for_host("b.com").rate == 100.05
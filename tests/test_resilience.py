@@ -0,0 +1,119 @@
+import pytest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _failing(counter):
+    def fn():
+        counter.append(1)
+        raise ConnectionError("down")
+
+    return fn
+
+
+def test_circuit_breaker_opens_and_half_opens():
+    """연속 실패 시 open, reset_timeout 후 시험 요청 1건만 허용하는지 테스트"""
+    from lib.Crawling.utils.resilience import CircuitBreaker, CircuitOpenError
+
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        "a.com", failure_threshold=2, reset_timeout=10, clock=clock
+    )
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now = 10
+    breaker.before_call()  # 시험 요청
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # 시험 중에는 나머지 차단
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+
+
+def test_retry_fails_fast_on_open_circuit(monkeypatch):
+    """circuit이 열리면 남은 재시도 없이 즉시 실패하는지 테스트"""
+    from lib.Crawling.utils import retry
+    from lib.Crawling.utils.resilience import CircuitBreaker, CircuitOpenError
+
+    monkeypatch.setattr(retry.time, "sleep", lambda s: None)
+    calls = []
+    breaker = CircuitBreaker("a.com", failure_threshold=3, reset_timeout=60)
+
+    with pytest.raises(CircuitOpenError):
+        retry.retry_with_exponential_backoff(
+            _failing(calls), max_retries=100, circuit=breaker
+        )
+    assert len(calls) == 3
+
+
+def test_retry_budget_and_deadline_stop_retries(monkeypatch):
+    """주기별 재시도 예산 소진 또는 다음 실행 시각 초과 시 재시도를 멈추는지 테스트"""
+    from lib.Crawling.utils import retry
+    from lib.Crawling.utils.resilience import (
+        RetryBudget,
+        RetryBudgetExceeded,
+        RetryDeadlineExceeded,
+    )
+
+    monkeypatch.setattr(retry.time, "sleep", lambda s: None)
+    budget = RetryBudget(4)
+
+    first, second = [], []
+    with pytest.raises(RetryBudgetExceeded):
+        retry.retry_with_exponential_backoff(
+            _failing(first), max_retries=100, retry_budget=budget
+        )
+    with pytest.raises(RetryBudgetExceeded):
+        retry.retry_with_exponential_backoff(
+            _failing(second), max_retries=100, retry_budget=budget
+        )
+    assert (len(first), len(second), budget.remaining) == (5, 1, 0)
+
+    calls = []
+    with pytest.raises(RetryDeadlineExceeded):
+        retry.retry_with_exponential_backoff(
+            _failing(calls),
+            max_retries=100,
+            base_delay=30,
+            deadline=retry.time.time() + 10,
+        )
+    assert len(calls) == 1
+
+
+def test_half_open_probe_with_client_error_closes_circuit(monkeypatch):
+    """half-open 시험 요청이 404로 실패해도 circuit이 계속 열린 채 남지 않는지 테스트"""
+    import requests
+
+    from lib.Crawling.utils import retry
+    from lib.Crawling.utils.resilience import CircuitBreaker
+
+    monkeypatch.setattr(retry.time, "sleep", lambda s: None)
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        "a.com", failure_threshold=1, reset_timeout=10, clock=clock
+    )
+    breaker.record_failure()
+
+    def not_found():
+        response = requests.Response()
+        response.status_code = 404
+        raise requests.HTTPError("404", response=response)
+
+    clock.now = 10
+    with pytest.raises(requests.HTTPError):
+        retry.retry_with_exponential_backoff(not_found, max_retries=1, circuit=breaker)
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert retry.retry_with_exponential_backoff(lambda: "ok", circuit=breaker) == "ok"
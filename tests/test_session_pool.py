@@ -0,0 +1,76 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
+
+import lib.Config.config as config
+
+TEST_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "test_settings.yaml")
+
+
+@pytest.fixture(autouse=True)
+def patch_config_path():
+    """Config 클래스의 설정 파일 경로를 테스트용으로 패치"""
+    with patch.object(config.Config, "_config_path", TEST_CONFIG_PATH):
+        yield
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch):
+    """database.pool 설정이 담긴 임시 설정 파일로 교체"""
+    from lib.Config.config import Config
+
+    def write(text):
+        path = tmp_path / "settings.yaml"
+        path.write_text(text, encoding="utf-8")
+        monkeypatch.setattr(Config, "_config_path", str(path))
+        monkeypatch.setattr(Config, "_last_mtime", None)
+
+    return write
+
+
+def test_engine_options_follow_pool_settings(settings):
+    """database.pool 설정이 풀 옵션에 반영되고 sqlite에는 적용되지 않는지 테스트"""
+    from lib.Distributor.secretary.session import _engine_options
+
+    settings("database:\n  pool:\n    size: 3\n    recycle: 600\n")
+
+    options = _engine_options("mysql+pymysql://u:p@localhost/db")
+    assert options["pool_pre_ping"]
+    assert (options["pool_size"], options["max_overflow"]) == (3, 10)
+    assert (options["pool_recycle"], options["pool_timeout"]) == (600, 30)
+    assert "pool_size" not in _engine_options("sqlite:///:memory:")
+
+
+def test_warm_pool_and_stats(settings, tmp_path, monkeypatch):
+    """pre_warm 수만큼 연결을 열었다가 풀에 반납하는지 테스트"""
+    from lib.Distributor.secretary import session
+
+    settings("database:\n  pool:\n    pre_warm: 2\n")
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool, pool_size=3
+    )
+    monkeypatch.setattr(session, "_engine", engine)
+
+    assert session.warm_pool() == 2
+    stats = session.get_pool_stats()
+    assert (stats["size"], stats["checkedin"], stats["checkedout"]) == (3, 2, 0)
+    engine.dispose()
+
+
+def test_secretary_starts_while_db_is_down(monkeypatch):
+    """시작 시 DB가 내려가 있어도 Secretary.instance()가 실패하지 않는지 테스트"""
+    from lib.Distributor.secretary import Secretary as module
+    from lib.Distributor.secretary.Secretary import Secretary
+
+    def down(size=None):
+        raise OperationalError("SELECT 1", {}, Exception("down"))
+
+    monkeypatch.setattr(module, "warm_pool", down)
+    monkeypatch.setattr(Secretary, "_start_replayer", lambda self: None)
+    monkeypatch.setattr(Secretary, "_instance", None)
+
+    assert isinstance(Secretary.instance(), Secretary)
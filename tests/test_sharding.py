@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def lease_table():
+    from lib.Distributor.secretary.models.core import Base, CrawlerNode, ShardLease
+    from lib.Distributor.secretary.session import engine
+
+    tables = [CrawlerNode.__table__, ShardLease.__table__]
+    Base.metadata.create_all(engine, tables=tables)
+    yield
+    Base.metadata.drop_all(engine, tables=tables)
+
+
+def test_shard_of_is_stable_partition():
+    """ticker가 대소문자와 무관하게 항상 같은 shard 하나에 속하는지 테스트"""
+    from lib.Crawling.utils.sharding import shard_of
+
+    tickers = [f"T{i}" for i in range(200)]
+    shards = [shard_of(t, 4) for t in tickers]
+    assert set(shards) == {0, 1, 2, 3}
+    assert shards == [shard_of(t.lower(), 4) for t in tickers]
+
+
+def test_leases_rebalance_when_nodes_join_and_die(lease_table):
+    """노드 합류 시 shard를 나누고, 노드가 죽으면 남은 노드가 인수하는지 테스트"""
+    from lib.Crawling.utils.sharding import ShardCoordinator
+
+    a = ShardCoordinator(shard_count=4, shard_index=0, lease=True, ttl=60, node_id="a")
+    b = ShardCoordinator(shard_count=4, shard_index=3, lease=True, ttl=60, node_id="b")
+    now = datetime(2025, 1, 1)
+
+    assert a.acquire(now) == [0, 1, 2, 3]
+    assert b.acquire(now) == []  # 모두 점유 중
+    assert a.acquire(now + timedelta(seconds=20)) == [0, 1]  # 몫을 넘는 shard 반납
+    assert b.acquire(now + timedelta(seconds=20)) == [2, 3]
+
+    # a가 갱신을 멈추면 lease 만료 후 b가 모두 인수
+    assert b.acquire(now + timedelta(seconds=50)) == [2, 3]
+    assert b.acquire(now + timedelta(seconds=90)) == [0, 1, 2, 3]
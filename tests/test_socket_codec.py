@@ -0,0 +1,184 @@
+import base64
+import os
+import socket
+import threading
+import time
+from unittest.mock import patch
+
+import orjson
+import pytest
+import zstandard as zstd
+
+import lib.Config.config as config
+from lib.Distributor.socket.compression import (
+    FLAG_DICT,
+    FRAME_HEADER,
+    FRAME_MAGIC,
+    LEGACY_TERMINATOR,
+    PayloadCodec,
+    train_dictionary,
+)
+
+TEST_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "test_settings.yaml")
+
+
+@pytest.fixture(autouse=True)
+def patch_config_path():
+    """Config 클래스의 설정 파일 경로를 테스트용으로 패치"""
+    with patch.object(config.Config, "_config_path", TEST_CONFIG_PATH):
+        yield
+
+
+@pytest.fixture(scope="module")
+def dictionary():
+    samples = [
+        orjson.dumps(
+            {
+                "header": {"event": "news", "version": 1},
+                "body": {"item": {"ticker": f"T{i}", "close": [i, i + 1.5, i * 2]}},
+            }
+        )
+        for i in range(300)
+    ]
+    return train_dictionary(samples, dict_size=4096)
+
+
+def test_encode_decode_round_trip(dictionary):
+    """legacy(base64 + <END>)와 사전 압축 바이너리 프레임이 원본으로 복원되는지 테스트"""
+    payload = b'{"body": {"item": {"ticker": "AAPL"}}}'
+
+    legacy = PayloadCodec().encode(payload)
+    assert legacy.endswith(LEGACY_TERMINATOR)
+    compressed = base64.b64decode(legacy[: -len(LEGACY_TERMINATOR)])
+    assert zstd.ZstdDecompressor().decompress(compressed) == payload
+
+    codec = PayloadCodec(dictionary=dictionary, raw_frames=True)
+    frame = codec.encode(payload)
+    magic, flags, dict_id, length = FRAME_HEADER.unpack_from(frame)
+    assert (magic, flags & FLAG_DICT, dict_id) == (
+        FRAME_MAGIC,
+        FLAG_DICT,
+        codec.dict_id,
+    )
+    body = frame[FRAME_HEADER.size :]
+    assert zstd.ZstdDecompressor(dict_data=dictionary).decompress(body) == payload
+    assert len(frame) == FRAME_HEADER.size + length
+
+    plain = zstd.ZstdCompressor().compress(payload)
+    assert codec.decode(plain, 1024) == payload  # 사전 없이 압축된 응답도 복원
+    assert codec.decode(b'{"status_code": 200}', 1024) == b'{"status_code": 200}'
+
+
+def _client(codec, replies):
+    """응답(또는 예외)을 순서대로 돌려주는 SocketClient"""
+    from lib.Distributor.socket.Client import SocketClient
+
+    client = SocketClient()
+    client.codec = codec
+    client._negotiated = False
+    client.sent = []
+
+    def exchange(datagram, codec=None, read_timeout=None):
+        client.sent.append(datagram)
+        reply = replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    client._exchange = exchange
+    return client
+
+
+def test_negotiation_fallbacks(dictionary):
+    """사전 불일치 시 사전 없이, 바이너리 프레임 미지원 시 legacy로 고정되는지 테스트"""
+    codec = PayloadCodec(dictionary=dictionary, raw_frames=True)
+
+    mismatch = _client(
+        codec, [{"status_code": 200, "raw_frames": True, "zstd_dict_id": 7}]
+    )
+    negotiated = mismatch.negotiate()
+    assert negotiated.raw_frames and negotiated.dict_id == 0
+
+    legacy = _client(codec, [{"status_code": 200, "message": "unknown frame"}])
+    assert not legacy.negotiate().raw_frames
+    assert legacy._negotiated and legacy.negotiate() is legacy.codec
+
+
+def test_transport_error_retries_negotiation(dictionary):
+    """HELLO 전송 실패 시 이번 요청만 legacy로 보내고 다음 요청에서 다시 협상하는지 테스트"""
+    codec = PayloadCodec(dictionary=dictionary, raw_frames=True)
+    client = _client(
+        codec,
+        [
+            ConnectionRefusedError("down"),
+            {"status_code": 200},
+            {"status_code": 200, "raw_frames": True, "zstd_dict_id": codec.dict_id},
+            {"status_code": 200},
+        ],
+    )
+
+    client.request_tcp({"body": {"item": 1}})
+    assert not client._negotiated
+    assert client.sent[1].endswith(LEGACY_TERMINATOR)
+
+    client.request_tcp({"body": {"item": 2}})
+    assert client._negotiated and client.codec.dict_id == codec.dict_id
+    assert client.sent[3].startswith(FRAME_MAGIC)
+
+
+def test_silent_server_pins_legacy_after_hello_timeout(dictionary, monkeypatch):
+    """HELLO에 응답하지 않는 legacy 서버면 hello_timeout 후 legacy로 고정하는지 테스트"""
+    from lib.Distributor.socket.Client import SocketClient
+
+    server = socket.create_server(("127.0.0.1", 0))
+    received = []
+
+    def serve():
+        while True:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return
+            with conn:
+                data = conn.recv(65536)
+                received.append(data)
+                if data.startswith(FRAME_MAGIC):
+                    conn.recv(
+                        1
+                    )  # <END>가 올 때까지 대기 (클라이언트가 닫을 때까지 무응답)
+                else:
+                    conn.sendall(b'{"status_code": 200}')
+
+    threading.Thread(target=serve, daemon=True).start()
+    monkeypatch.setattr(
+        SocketClient, "resolve_addr", staticmethod(lambda: server.getsockname())
+    )
+
+    client = SocketClient()
+    client.codec = PayloadCodec(dictionary=dictionary, raw_frames=True)
+    client._negotiated = False
+    client.hello_timeout = 0.2
+
+    started = time.monotonic()
+    for i in range(2):
+        assert client.request_tcp({"body": {"item": i}}) == {"status_code": 200}
+    server.close()
+
+    assert time.monotonic() - started < client.read_timeout
+    assert client._negotiated and not client.codec.raw_frames
+    assert [data.startswith(FRAME_MAGIC) for data in received] == [True, False, False]
+
+
+def test_capture_is_bounded(tmp_path):
+    """사전 학습용 샘플이 개수/크기 상한을 넘지 않는지 테스트"""
+    (tmp_path / "old.json").write_bytes(b"{}")
+    codec = PayloadCodec(
+        capture_dir=str(tmp_path), capture_max_files=3, capture_max_bytes=16
+    )
+
+    codec.encode(b"x" * 17)  # 크기 초과 → 저장 안 함
+    for _ in range(5):
+        codec.encode(b'{"a": 1}')
+    codec.as_legacy().encode(b'{"b": 2}')  # 복사된 코덱도 같은 상한
+
+    assert len(list(tmp_path.glob("*.json"))) == 3
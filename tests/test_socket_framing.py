@@ -0,0 +1,78 @@
+import socket
+import threading
+
+import pytest
+
+from lib.Distributor.socket.compression import FRAME_HEADER, FRAME_MAGIC
+from lib.Distributor.socket.framing import FrameReader, FrameTooLarge
+
+
+def _send_later(sock, chunks):
+    """여러 조각으로 나누어 전송 (분할 응답 재현)"""
+
+    def run():
+        for chunk in chunks:
+            sock.sendall(chunk)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_reads_fragmented_terminated_frame():
+    """<END> 종료 토큰이 여러 조각에 나뉘어 도착해도 하나의 프레임으로 읽는지 테스트"""
+    client, server = socket.socketpair()
+    body = b'{"status_code": 200, "message": "' + b"x" * 20000 + b'"}'
+    thread = _send_later(server, [body[:10], body[10:], b"<E", b"ND>"])
+
+    payload = FrameReader(client, read_timeout=5, chunk_size=16).read()
+    thread.join()
+
+    assert payload == body
+    client.close()
+    server.close()
+
+
+def test_reads_length_prefixed_frame():
+    """헤더에 선언된 길이만큼 읽는지 테스트"""
+    client, server = socket.socketpair()
+    body = b'{"status_code": 200}'
+    header = FRAME_HEADER.pack(FRAME_MAGIC, 0, 0, len(body))
+    thread = _send_later(server, [header[:5], header[5:] + body[:3], body[3:]])
+
+    assert FrameReader(client, read_timeout=5).read() == body
+    thread.join()
+    client.close()
+    server.close()
+
+
+def test_reads_unterminated_json():
+    """종료 토큰 없는 기존 JSON 응답을 완결 시점에 반환하는지 테스트"""
+    client, server = socket.socketpair()
+    server.sendall(b'{"status_code": 200, "item": {"result": 1}}')
+
+    assert FrameReader(client, read_timeout=5).read().startswith(b'{"status_code"')
+    client.close()
+    server.close()
+
+
+def test_rejects_oversized_frame():
+    """선언된 길이가 최대 크기를 넘으면 즉시 실패하는지 테스트"""
+    client, server = socket.socketpair()
+    server.sendall(FRAME_HEADER.pack(FRAME_MAGIC, 0, 0, 1024))
+
+    with pytest.raises(FrameTooLarge):
+        FrameReader(client, max_frame_size=100, read_timeout=5).read()
+    client.close()
+    server.close()
+
+
+def test_read_deadline():
+    """응답이 멈추면 read deadline에서 TimeoutError가 발생하는지 테스트"""
+    client, server = socket.socketpair()
+    server.sendall(b'{"status_code": ')
+
+    with pytest.raises(TimeoutError):
+        FrameReader(client, read_timeout=0.2).read()
+    client.close()
+    server.close()
@@ -0,0 +1,122 @@
+import os
+import threading
+
+import pandas as pd
+from sqlalchemy.exc import OperationalError
+
+from lib.Distributor.secretary.spool import ResultSpool, SpoolReplayer
+
+
+def _result(title):
+    return {
+        "tag": "news",
+        "log": {"crawling_type": "news", "status_code": 200},
+        "df": [{"title": title, "posted_at": pd.Timestamp("2025-05-01")}],
+    }
+
+
+class FakeSecretary:
+    def __init__(self, down=False):
+        self.down = down
+        self.received = []
+
+    def distribute(self, results, crawling_ids=None, spool=True):
+        if self.down:
+            raise OperationalError("SELECT 1", {}, Exception("down"))
+        self.received.extend(zip(results, crawling_ids))
+
+
+def test_spool_round_trip_and_truncated_tail(tmp_path):
+    """기록한 레코드를 복원하고, 잘린 마지막 레코드는 무시하는지 테스트"""
+    spool = ResultSpool(directory=str(tmp_path))
+    assert spool.append([_result("a"), _result("b")], ["id-a", None]) == 2
+
+    [segment] = spool.sealed_segments()
+    with open(segment, "ab") as f:
+        f.write(b"\x00\x00\x01\x00partial")
+
+    records = list(ResultSpool.read_segment(segment))
+    assert [r["crawling_id"] for r in records] == ["id-a", None]
+    assert records[0]["result"]["df"][0]["posted_at"] == "2025-05-01T00:00:00"
+
+
+def test_replay_keeps_segment_while_db_down(tmp_path):
+    """DB 장애 중에는 세그먼트를 유지하고, 복구 후 재생 및 삭제하는지 테스트"""
+    spool = ResultSpool(directory=str(tmp_path))
+    spool.append([_result("a")], ["id-a"])
+    replayer = SpoolReplayer(spool)
+
+    assert replayer.replay(FakeSecretary(down=True)) == 0
+    assert len(spool.sealed_segments()) == 1
+
+    secretary = FakeSecretary()
+    assert replayer.replay(secretary) == 1
+    assert os.listdir(tmp_path) == []
+
+    result, crawling_id = secretary.received[0]
+    assert crawling_id == "id-a"
+    assert result["df"][0]["posted_at"] == pd.Timestamp("2025-05-01")
+
+
+def test_segment_opened_while_listing_is_not_sealed(tmp_path, monkeypatch):
+    """목록을 만드는 중 append가 연 세그먼트는 봉인 목록에 포함되지 않는지 테스트"""
+    from lib.Distributor.secretary import spool as module
+
+    spool = ResultSpool(directory=str(tmp_path))
+    spool.append([_result("a")], ["id-a"])
+    [sealed] = spool.sealed_segments()
+
+    real_glob = module.glob.glob
+    writer = threading.Thread(target=spool.append, args=([_result("b")], ["id-b"]))
+
+    def glob_during_append(pattern):
+        writer.start()
+        writer.join(0.2)  # lock 안에서 목록을 만들면 writer는 여기서 대기
+        return real_glob(pattern)
+
+    monkeypatch.setattr(module.glob, "glob", glob_during_append)
+    assert spool.sealed_segments() == [sealed]
+    monkeypatch.setattr(module.glob, "glob", real_glob)
+    writer.join()
+
+    [later] = set(spool.sealed_segments()) - {sealed}
+    assert [r["crawling_id"] for r in ResultSpool.read_segment(later)] == ["id-b"]
+
+
+def test_outage_spools_and_replays_original_crawling_ids(tmp_path, monkeypatch):
+    """DB 장애로 spool된 결과가 분배 때 계산된 crawling_id 그대로 재생되는지 테스트"""
+    from lib.Crawling.Interfaces.CrawlResult import CrawlResult
+    from lib.Distributor.secretary.Secretary import Secretary
+
+    spool = ResultSpool(directory=str(tmp_path))
+    monkeypatch.setattr(ResultSpool, "instance", classmethod(lambda cls: spool))
+    secretary = Secretary()
+
+    def outage(db, result, crawling_id=None):
+        raise OperationalError("INSERT", {}, Exception("down"))
+
+    monkeypatch.setattr(secretary, "_distribute_single", outage)
+    macro = pd.DataFrame(
+        [
+            {
+                "index_name": "GDP",
+                "country": "US",
+                "index_value": "1.0",
+                "posted_at": pd.Timestamp("2025-03-31 09:30"),
+            }
+        ]
+    )
+    results = [
+        CrawlResult.success("macro", macro),
+        CrawlResult.failure("macro", "timeout", index_name="GDP"),
+        CrawlResult.success("news", [{"title": "a", "posted_at": "2025-05-01"}]),
+    ]
+    handler_df = secretary._handler_df("macro", macro)
+    expected = secretary._result_hash_id("macro", results[0], handler_df)
+    secretary.distribute(results)
+
+    received = FakeSecretary()
+    assert SpoolReplayer(spool).replay(received) == 3
+    ids = [crawling_id for _, crawling_id in received.received]
+    assert ids[0] == expected and ids[2] is None  # news는 재생 시 DB 조회 후 계산
+    assert ids[1] is not None  # 실패 로그 ID도 보관 시점 값으로 고정
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_CONFIG_PATH = os.path.join(ROOT, "tests", "test_settings.yaml")
+
+# 크롤러에서만 쓰는 무거운 의존성
+CRAWLER_ONLY = {
+    "pandas",
+    "yfinance",
+    "curl_cffi",
+    "cloudscraper",
+    "bs4",
+    "fredapi",
+    "deepl",
+    "pyarrow",
+}
+
+
+def _imported(code: str, cwd) -> set[str]:
+    """-X importtime 출력에서 import된 최상위 패키지 이름 목록"""
+    prelude = (
+        "import lib.Config.config as c; "
+        f"c.Config._config_path = {TEST_CONFIG_PATH!r}\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", prelude + code],
+        cwd=cwd,  # logs/ 디렉터리가 저장소에 생기지 않도록
+        env={**os.environ, "PYTHONPATH": ROOT},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        line.rsplit("|", 1)[-1].strip().split(".")[0]
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+def test_main_import_is_light(tmp_path):
+    """main import 시 크롤러/DB/직렬화 의존성을 불러오지 않는지 테스트"""
+    imported = _imported("import main", tmp_path)
+
+    assert "lib" in imported
+    assert not imported & (CRAWLER_ONLY | {"sqlalchemy", "numpy", "zstandard"})
+
+
+def test_notifier_only_skips_crawler_dependencies(tmp_path):
+    """notifier만 실행할 때 pandas, yfinance 등을 불러오지 않는지 테스트"""
+    imported = _imported(
+        "import main, lib.Crawling\n"
+        "import lib.Distributor.notifier.Article_notifier\n"
+        "import lib.Distributor.notifier.Financial_notifier\n"
+        "from lib.Distributor.secretary.session import get_session\n"
+        "with get_session() as db: pass",
+        tmp_path,
+    )
+
+    assert "sqlalchemy" in imported
+    assert not imported & CRAWLER_ONLY
@@ -0,0 +1,35 @@
+from lib.Distributor.secretary.title_translator import (
+    FakeTranslator,
+    TitleTranslator,
+    TranslationCache,
+)
+
+
+def test_translates_in_batches_and_reuses_cache(tmp_path):
+    """캐시에 없는 제목만 batch_size 단위로 번역하고, 캐시는 재시작 후에도 유지되는지 테스트"""
+    path = str(tmp_path / "translations.sqlite3")
+    fake = FakeTranslator()
+    service = TitleTranslator(fake, TranslationCache(path), batch_size=2)
+
+    titles = ["Fed holds rates", "Oil rallies", "Chip stocks slide", "Oil rallies"]
+    translated = service.translate_many(titles)
+
+    assert translated["Oil rallies"] == "[KO] Oil rallies"
+    assert sorted(len(call) for call in fake.calls) == [1, 2]
+
+    restarted = TitleTranslator(FakeTranslator(), TranslationCache(path))
+    assert restarted.cached("Fed holds rates") == "[KO] Fed holds rates"
+    assert restarted.translate_many(titles) == translated
+    assert restarted.translator.calls == []
+
+
+def test_failed_batch_is_not_cached():
+    """번역 API 실패 시 결과와 캐시에서 제외되는지 테스트"""
+
+    class FailingTranslator:
+        def translate_batch(self, titles, target_lang):
+            raise ConnectionError("timeout")
+
+    service = TitleTranslator(FailingTranslator())
+    assert service.translate_many(["Fed holds rates"]) == {}
+    assert service.cached("Fed holds rates") is None
@@ -0,0 +1,128 @@
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+import lib.Config.config as config
+
+TEST_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "test_settings.yaml")
+
+
+@pytest.fixture(autouse=True)
+def patch_config_path():
+    """Config 클래스의 설정 파일 경로를 테스트용으로 패치"""
+    with patch.object(config.Config, "_config_path", TEST_CONFIG_PATH):
+        yield
+
+
+class FakeSecretary:
+    def __init__(self, fail_first=False):
+        self.fail_first = fail_first
+        self.received = []
+        self.lock = threading.Lock()
+        self.spooled = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def distribute(self, results):
+        self.release.wait()
+        with self.lock:
+            if self.fail_first:
+                self.fail_first = False
+                raise RuntimeError("boom")
+            self.received.extend(results)
+
+    def spool(self, results, crawling_ids=None, reason=""):
+        self.spooled.extend(results)
+        return True
+
+
+@pytest.fixture
+def secretary(monkeypatch):
+    """WriteBehindQueue가 사용하는 Secretary.instance()를 가짜로 교체"""
+    from lib.Distributor.secretary.Secretary import Secretary
+
+    fake = FakeSecretary()
+    monkeypatch.setattr(Secretary, "instance", classmethod(lambda cls: fake))
+    return fake
+
+
+def test_put_rejects_when_queue_is_full():
+    """대기열이 가득 차면 put_timeout 후 거절하고 지표에 기록하는지 테스트"""
+    from lib.Distributor.secretary.writer import WriteBehindQueue
+
+    writer = WriteBehindQueue(maxsize=1, workers=0, put_timeout=0.01)
+
+    assert writer.put([1]) and writer.put([])
+    assert not writer.put([2])
+    stats = writer.stats()
+    assert (stats["enqueued"], stats["rejected"], stats["depth"]) == (1, 1, 1)
+
+
+def test_shutdown_flushes_and_failed_batches_are_counted(secretary):
+    """종료 시 남은 결과를 모두 분배하고, 실패한 묶음은 written이 아닌 failed로 집계하는지 테스트"""
+    from lib.Distributor.secretary.writer import WriteBehindQueue
+
+    secretary.fail_first = True
+    writer = WriteBehindQueue(maxsize=8, workers=1, batch_size=2)
+    writer.put(["a", "b"])
+    writer.start()
+    writer.queue.join()  # 첫 묶음 실패 후에도 writer 스레드 유지
+
+    for item in ["c", "d", "e"]:
+        writer.put([item])
+    writer.shutdown(timeout=5)
+
+    stats = writer.stats()
+    assert sorted(secretary.received) == ["c", "d", "e"]
+    assert (stats["written"], stats["failed"], stats["depth"]) == (3, 2, 0)
+    assert not any(t.is_alive() for t in writer._threads)
+
+
+def test_worker_survives_secretary_creation_failure(monkeypatch):
+    """Secretary 생성이 실패해도 writer 스레드가 죽지 않고 다음 묶음을 저장하는지 테스트"""
+    from lib.Distributor.secretary.Secretary import Secretary
+    from lib.Distributor.secretary.writer import WriteBehindQueue
+
+    fake = FakeSecretary()
+    calls = []
+
+    def instance(cls):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("DB down")
+        return fake
+
+    monkeypatch.setattr(Secretary, "instance", classmethod(instance))
+    writer = WriteBehindQueue(workers=1, batch_size=1)
+    writer.start()
+    writer.put(["a"])
+    writer.queue.join()
+    writer.put(["b"])
+    writer.shutdown(timeout=5)
+
+    assert fake.received == ["b"]
+    assert (writer.stats()["written"], writer.stats()["failed"]) == (1, 1)
+
+
+def test_shutdown_timeout_spools_remaining_batches(secretary):
+    """종료 대기 시간 안에 저장하지 못한 묶음은 버리지 않고 spool에 보관하는지 테스트"""
+    from lib.Distributor.secretary.writer import WriteBehindQueue
+
+    secretary.release.clear()  # 첫 묶음 저장이 끝나지 않음
+    writer = WriteBehindQueue(maxsize=8, workers=1, batch_size=1)
+    writer.start()
+    writer.put(["a"])
+    while writer.queue.qsize():  # writer가 첫 묶음을 가져갈 때까지 대기
+        time.sleep(0.01)
+    writer.put(["b"])
+    writer.put(["c"])
+
+    writer.shutdown(timeout=0.1)
+    assert secretary.spooled == ["b", "c"] and writer.stats()["depth"] == 0
+
+    secretary.release.set()
+    writer._threads[0].join(5)
+    assert secretary.received == ["a"]